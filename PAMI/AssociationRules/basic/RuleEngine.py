@@ -0,0 +1,635 @@
+# RuleEngine extracts the association rules of the given frequent patterns, measuring every rule with confidence, lift,
+# leverage and conviction at once.
+#
+# **Importing this algorithm into a python program**
+#
+#             from PAMI.AssociationRules.basic import RuleEngine as alg
+#
+#             from PAMI.extras.sinks import patternSinks
+#
+#             obj = alg.RuleEngine(iFile, minConf, dbSize=dbSize)    # iFile: patterns file, dataframe or getPatterns()
+#
+#             obj.mine()
+#
+#             obj = alg.RuleEngine(iFile, minConf, dbSize=dbSize, numWorkers=4, topN=100, perConsequent=True)
+#
+#             obj.setRuleSink(patternSinks.FileSink('rules.txt'))     # the rules are written while mining
+#
+#             obj.mine()
+#
+#             associationRules = obj.getAssociationRules()
+#
+#             print("Total number of Association Rules:", len(associationRules))
+#
+#             obj.save(oFile)
+#
+#             Df = obj.getAssociationRulesAsDataFrame()
+#
+#             memUSS = obj.getMemoryUSS()
+#
+#             print("Total Memory in USS:", memUSS)
+#
+#             memRSS = obj.getMemoryRSS()
+#
+#             print("Total Memory in RSS", memRSS)
+#
+#             run = obj.getRuntime()
+#
+#             print("Total ExecutionTime in seconds:", run)
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from PAMI.AssociationRules.basic import abstract as _ab
+from concurrent.futures import ProcessPoolExecutor as _ProcessPoolExecutor, FIRST_COMPLETED as _FIRST_COMPLETED, \
+    wait as _wait
+import heapq as _heapq
+from typing import Dict, List, Tuple, Any
+
+measures = ('support', 'confidence', 'lift', 'leverage', 'conviction')
+
+_workerEngine = None
+
+
+class _TopRules:
+    """
+    Keeps the topN rules of highest measure overall or for every consequent in bounded min-heaps. Ties of the
+    measure are broken by the bitsets of the antecedent and the consequent, so the kept rules do not depend on the
+    order in which the rules arrive.
+
+    :param topN: number of rules to keep
+    :type topN: int
+    :param perConsequent: keep topN rules for every consequent instead of topN rules overall
+    :type perConsequent: bool
+    :param measure: index of the measure in the values of a rule
+    :type measure: int
+    """
+
+    def __init__(self, topN, perConsequent, measure):
+        self._topN = topN
+        self._perConsequent = perConsequent
+        self._measure = measure
+        self._heaps = {}
+
+    def add(self, antecedent, consequent, values) -> None:
+        heap = self._heaps.setdefault(consequent if self._perConsequent else None, [])
+        entry = (values[self._measure], antecedent, consequent, values)
+        if len(heap) < self._topN:
+            _heapq.heappush(heap, entry)
+        elif entry[:3] > heap[0][:3]:
+            _heapq.heapreplace(heap, entry)
+
+    def bound(self):
+        """
+        :return: the measure a rule must reach to enter the overall heap, or None while the heap is not full
+        :rtype: float
+        """
+        heap = self._heaps.get(None)
+        if self._perConsequent or heap is None or len(heap) < self._topN:
+            return None
+        return heap[0][0]
+
+    def rules(self) -> List[Tuple[int, int, list]]:
+        """
+        :return: the kept rules as (antecedent, consequent, values), by decreasing measure
+        :rtype: list
+        """
+        entries = sorted((entry for heap in self._heaps.values() for entry in heap), key=lambda x: x[:3], reverse=True)
+        return [(antecedent, consequent, values) for _, antecedent, consequent, values in entries]
+
+
+def _initWorker(supports, dbSize, minConf, minLift, minLeverage, topN, perConsequent, measure):
+    """
+    Prepares a worker process of RuleEngine with the support index of the patterns
+    """
+    global _workerEngine
+    _workerEngine = RuleEngine(None, minConf, dbSize=dbSize, minLift=minLift, minLeverage=minLeverage, topN=topN,
+                               perConsequent=perConsequent, measure=measure)
+    _workerEngine._supports = supports
+
+
+def _mineChunk(itemsets):
+    """
+    Generates the rules of a chunk of patterns in a worker process
+
+    :param itemsets: bitsets of the patterns
+    :type itemsets: list
+    :return: the rules as (antecedent, consequent, values). With topN, only the topN rules of the chunk.
+    :rtype: list
+    """
+    return list(_workerEngine._rulesOf(itemsets))
+
+
+class RuleEngine:
+    """
+    About this algorithm
+    ====================
+
+    :**Description**: RuleEngine derives association rules from frequent patterns. The support of every pattern is
+                      indexed by the bitset of its items, so the support of any antecedent or consequent is a single
+                      dictionary lookup. The rules of every pattern are generated with ap-genrules: the consequents
+                      grow one item at a time, and a consequent is only extended if its rule satisfies minConf, as
+                      moving items from the antecedent to the consequent never raises the confidence. Confidence,
+                      lift, leverage and conviction of a rule are computed together.
+
+    :**Reference**:   R. Agrawal, R. Srikant: Fast Algorithms for Mining Association Rules. VLDB 1994: 487-499
+
+    :**Parameters**:    - **iFile** (*str or dict or DataFrame*) -- *Patterns file written by save() of a miner, the dataframe of getPatternsAsDataFrame() (items separated by white space), or the dictionary of getPatterns().*
+                        - **minConf** (*float*) -- *Minimum confidence of a rule, between 0 and 1.*
+                        - **sep** (*str*) -- *Separator of the items of a pattern given as a string. The default seperator is tab space.*
+                        - **dbSize** (*int*) -- *Number of transactions of the database the patterns were mined from. If None, the supports must be proportions of the database.*
+                        - **minLift** (*float*) -- *Optional minimum lift of a rule.*
+                        - **minLeverage** (*float*) -- *Optional minimum leverage of a rule.*
+                        - **numWorkers** (*int*) -- *Number of worker processes generating the rules of chunks of patterns. The default is 1, i.e., no worker processes are started.*
+                        - **topN** (*int*) -- *Keep only the topN rules of highest measure, overall or for every consequent. The default None keeps all rules.*
+                        - **perConsequent** (*bool*) -- *Keep topN rules for every consequent instead of topN rules overall.*
+                        - **measure** (*str*) -- *Measure ranking the rules for topN: 'support', 'confidence', 'lift', 'leverage' or 'conviction'.*
+                        - **chunkSize** (*int*) -- *Number of patterns sent to a worker process at once.*
+
+    :**Attributes**:    - **startTime** (*float*) -- *To record the start time of the mining process.*
+                        - **endTime** (*float*) -- *To record the completion time of the mining process.*
+                        - **associationRules** (*dict*) -- *Maps (antecedent, consequent) to [support, confidence, lift, leverage, conviction].*
+                        - **memoryUSS** (*float*) -- *To store the total amount of USS memory consumed by the program.*
+                        - **memoryRSS** (*float*) -- *To store the total amount of RSS memory consumed by the program.*
+
+
+    Execution methods
+    =================
+
+    **Terminal command**
+
+    .. code-block:: console
+
+      Format:
+
+      (.venv) $ python3 RuleEngine.py <inputFile> <outputFile> <minConf> <dbSize> <sep>
+
+      Example Usage:
+
+      (.venv) $ python3 RuleEngine.py patterns.txt rules.txt 0.5 1000 ' '
+
+
+    **Calling from a python program**
+
+    .. code-block:: python
+
+            from PAMI.frequentPattern.basic import FPGrowth as fp
+
+            from PAMI.AssociationRules.basic import RuleEngine as alg
+
+            miner = fp.FPGrowth('sampleDB.txt', 10)
+
+            miner.mine()
+
+            obj = alg.RuleEngine(miner.getPatterns(), 0.5, dbSize=1000)
+
+            obj.mine()
+
+            associationRules = obj.getAssociationRules()
+
+            print("Total number of Association Rules:", len(associationRules))
+
+            obj.save(oFile)
+
+            Df = obj.getAssociationRulesAsDataFrame()
+
+            print("Total ExecutionTime in seconds:", obj.getRuntime())
+
+
+    Credits
+    =======
+
+            The complete program was written under the supervision of Professor Rage Uday Kiran.
+
+    """
+
+    def __init__(self, iFile, minConf, sep="\t", dbSize=None, minLift=None, minLeverage=None, numWorkers=1, topN=None,
+                 perConsequent=False, measure='confidence', chunkSize=10000):
+        """
+        :param iFile: patterns file, dataframe of patterns or dictionary of patterns
+        :type iFile: str or DataFrame or dict
+        :param minConf: minimum confidence
+        :type minConf: float
+        :param sep: separator of the items of a pattern
+        :type sep: str
+        :param dbSize: number of transactions of the database. If None, the supports must be proportions.
+        :type dbSize: int
+        :param minLift: minimum lift
+        :type minLift: float
+        :param minLeverage: minimum leverage
+        :type minLeverage: float
+        :param numWorkers: number of worker processes
+        :type numWorkers: int
+        :param topN: number of rules to keep, overall or for every consequent. None keeps all rules.
+        :type topN: int
+        :param perConsequent: keep topN rules for every consequent
+        :type perConsequent: bool
+        :param measure: measure ranking the rules for topN
+        :type measure: str
+        :param chunkSize: number of patterns sent to a worker process at once
+        :type chunkSize: int
+        """
+        if measure not in measures:
+            raise ValueError("measure must be one of: " + str(measures))
+        self._iFile = iFile
+        self._minConf = float(minConf)
+        self._sep = sep
+        self._dbSize = dbSize
+        self._minLift = minLift
+        self._minLeverage = minLeverage
+        self._numWorkers = numWorkers
+        self._topN = topN
+        self._perConsequent = perConsequent
+        self._measure = measure
+        self._chunkSize = chunkSize
+        self._ruleSink = None
+        self._minConfBound = self._minConf
+        self._items = []
+        self._supports = {}
+        self._associationRules = {}
+        self._startTime = float()
+        self._endTime = float()
+        self._memoryUSS = float()
+        self._memoryRSS = float()
+
+    def _splitPattern(self, pattern, whitespace: bool = False) -> List[str]:
+        """
+        :param pattern: a pattern as a string of items or a collection of items
+        :type pattern: str or tuple or frozenset
+        :param whitespace: split the string at white space instead of sep, as in the dataframes of
+            getPatternsAsDataFrame()
+        :type whitespace: bool
+        :return: the items of the pattern
+        :rtype: list
+        """
+        if isinstance(pattern, str):
+            return [item.strip() for item in pattern.split(None if whitespace else self._sep) if item.strip()]
+        return list(pattern)
+
+    def _readPatterns(self) -> List[Tuple[List[Any], float]]:
+        """
+        Reads the patterns and their supports
+
+        :return: the items and the support of every pattern
+        :rtype: list
+        """
+        patterns = []
+        if isinstance(self._iFile, dict):
+            for pattern, support in self._iFile.items():
+                if isinstance(support, (list, tuple)):
+                    support = support[0]
+                patterns.append((self._splitPattern(pattern), support))
+        elif isinstance(self._iFile, _ab._pd.DataFrame):
+            pattern, support = [], []
+            for col in self._iFile.columns.values.tolist():
+                if 'pattern' in col.lower():
+                    pattern = self._iFile[col].tolist()
+                if 'support' in col.lower():
+                    support = self._iFile[col].tolist()
+            # getPatternsAsDataFrame() of the miners joins the items with spaces
+            patterns = [(self._splitPattern(p, whitespace=True), s) for p, s in zip(pattern, support)]
+        elif isinstance(self._iFile, str):
+            if _ab._validators.url(self._iFile):
+                lines = [line.decode('utf-8') for line in _ab._urlopen(self._iFile)]
+            else:
+                try:
+                    with open(self._iFile, 'r', encoding='utf-8') as f:
+                        lines = f.readlines()
+                except IOError:
+                    print("File Not Found")
+                    quit()
+            for line in lines:
+                line = line.strip()
+                if not line:
+                    continue
+                line = line.split(':')
+                patterns.append((self._splitPattern(line[0]), float(line[1])))
+        return patterns
+
+    def _index(self, patterns) -> None:
+        """
+        Numbers the items in order of appearance and indexes the support of every pattern by the bitset of its items
+
+        :param patterns: the items and the support of every pattern
+        :type patterns: list
+        """
+        self._items = []
+        self._supports = {}
+        positions = {}
+        for items, support in patterns:
+            bits = 0
+            for item in items:
+                position = positions.get(item)
+                if position is None:
+                    position = positions[item] = len(self._items)
+                    self._items.append(item)
+                bits |= 1 << position
+            self._supports[bits] = support
+
+    def _positions(self, bits) -> List[int]:
+        """
+        :param bits: bitset of items
+        :type bits: int
+        :return: positions of the items of the bitset, in increasing order
+        :rtype: list
+        """
+        positions = []
+        while bits:
+            low = bits & -bits
+            positions.append(low.bit_length() - 1)
+            bits ^= low
+        return positions
+
+    def _measureRule(self, antecedent, consequent, support, confidence):
+        """
+        Measures a rule satisfying minConf
+
+        :param antecedent: bitset of the antecedent
+        :type antecedent: int
+        :param consequent: bitset of the consequent
+        :type consequent: int
+        :param support: relative support of the rule
+        :type support: float
+        :param confidence: confidence of the rule
+        :type confidence: float
+        :return: [support, confidence, lift, leverage, conviction], or None if the rule does not satisfy minLift and
+            minLeverage
+        :rtype: list
+        """
+        consequentSupport = self._supports[consequent] / self._dbSize
+        antecedentSupport = self._supports[antecedent] / self._dbSize
+        lift = confidence / consequentSupport
+        leverage = support - antecedentSupport * consequentSupport
+        if self._minLift is not None and lift < self._minLift:
+            return None
+        if self._minLeverage is not None and leverage < self._minLeverage:
+            return None
+        conviction = (1 - consequentSupport) / (1 - confidence) if confidence < 1 else float('inf')
+        return [support, confidence, lift, leverage, conviction]
+
+    def _genRules(self, itemset, support):
+        """
+        Generates the rules of one pattern with ap-genrules. The consequents of m + 1 items are joined from the
+        consequents of m items sharing their first m - 1 items, and are kept only if all their consequents of m items
+        satisfied the confidence bound. The bound is minConf, raised to the confidence of the last of the topN rules
+        once topN rules ranked by confidence are kept.
+
+        :param itemset: bitset of the pattern
+        :type itemset: int
+        :param support: support of the pattern
+        :type support: int or float
+        :return: the rules as (antecedent, consequent, values)
+        :rtype: generator
+        """
+        size = bin(itemset).count('1')
+        relativeSupport = support / self._dbSize
+        consequents = [(p,) for p in self._positions(itemset)]
+        m = 1
+        while consequents and m < size:
+            passed = []
+            for consequent in consequents:
+                consequentBits = 0
+                for p in consequent:
+                    consequentBits |= 1 << p
+                antecedent = itemset & ~consequentBits
+                antecedentSupport = self._supports.get(antecedent)
+                if antecedentSupport is None or consequentBits not in self._supports:
+                    continue
+                confidence = support / antecedentSupport
+                if confidence >= self._minConfBound:
+                    passed.append(consequent)
+                    values = self._measureRule(antecedent, consequentBits, relativeSupport, confidence)
+                    if values is not None:
+                        yield antecedent, consequentBits, values
+            m += 1
+            if m >= size:
+                break
+            passedSet = set(passed)
+            consequents = []
+            for i in range(len(passed)):
+                for j in range(i + 1, len(passed)):
+                    if passed[i][:-1] != passed[j][:-1]:
+                        break
+                    candidate = passed[i] + passed[j][-1:]
+                    if all(candidate[:k] + candidate[k + 1:] in passedSet for k in range(len(candidate) - 2)):
+                        consequents.append(candidate)
+
+    def _rulesOf(self, itemsets):
+        """
+        Generates the rules of several patterns. With topN, only the topN rules are kept in bounded heaps, and the
+        confidence bound rises with the heap when the rules are ranked by confidence.
+
+        :param itemsets: bitsets of the patterns
+        :type itemsets: iterable
+        :return: the rules as (antecedent, consequent, values)
+        :rtype: list or generator
+        """
+        if self._topN is None:
+            return (rule for itemset in itemsets if itemset & (itemset - 1)
+                    for rule in self._genRules(itemset, self._supports[itemset]))
+        top = _TopRules(self._topN, self._perConsequent, measures.index(self._measure))
+        pruneByBound = self._measure == 'confidence' and not self._perConsequent
+        for itemset in itemsets:
+            if itemset & (itemset - 1):
+                for antecedent, consequent, values in self._genRules(itemset, self._supports[itemset]):
+                    top.add(antecedent, consequent, values)
+                    if pruneByBound and top.bound() is not None:
+                        self._minConfBound = max(self._minConfBound, top.bound())
+        return top.rules()
+
+    def _rulesInPool(self):
+        """
+        Generates the rules in a pool of numWorkers processes, each task being a chunk of chunkSize patterns. The rules
+        are handed on chunk by chunk as the tasks complete.
+
+        :return: the rules as (antecedent, consequent, values)
+        :rtype: generator
+        """
+        itemsets = [itemset for itemset in self._supports if itemset & (itemset - 1)]
+        chunks = iter(range(0, len(itemsets), self._chunkSize))
+        with _ProcessPoolExecutor(self._numWorkers, initializer=_initWorker,
+                                  initargs=(self._supports, self._dbSize, self._minConf, self._minLift,
+                                            self._minLeverage, self._topN, self._perConsequent,
+                                            self._measure)) as pool:
+            pending = set()
+            while True:
+                for start in chunks:
+                    pending.add(pool.submit(_mineChunk, itemsets[start:start + self._chunkSize]))
+                    if len(pending) >= 2 * self._numWorkers:
+                        break
+                if not pending:
+                    break
+                done, pending = _wait(pending, return_when=_FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+
+    def _ruleKey(self, antecedent, consequent):
+        """
+        :return: the items of the antecedent and of the consequent of a rule
+        :rtype: tuple
+        """
+        return (tuple(self._items[p] for p in self._positions(antecedent)),
+                tuple(self._items[p] for p in self._positions(consequent)))
+
+    def _ruleString(self, antecedent, consequent):
+        """
+        :return: a rule as written by save()
+        :rtype: str
+        """
+        antecedent, consequent = self._ruleKey(antecedent, consequent)
+        return self._sep.join(str(x) for x in antecedent) + " -> " + self._sep.join(str(x) for x in consequent)
+
+    def setRuleSink(self, sink) -> None:
+        """
+        Streams the rules of the following mine() calls to a sink instead of keeping them in memory. The sink receives
+        every rule as written by save(), i.e., 'antecedent -> consequent', with [support, confidence, lift, leverage,
+        conviction]. While a sink is set, getAssociationRules() returns an empty dictionary. The sink is closed at the
+        end of every mine() call.
+
+        :param sink: a sink of PAMI.extras.sinks.patternSinks, or None to keep the rules in memory again
+        :type sink: PatternSink
+        :return: None
+        """
+        self._ruleSink = sink
+
+    def mine(self) -> None:
+        """
+        Association rule mining process will start from here
+        """
+        self._startTime = _ab._time.time()
+        self._associationRules = {}
+        self._index(self._readPatterns())
+        if self._dbSize is None:
+            if any(support > 1 for support in self._supports.values()):
+                raise ValueError("dbSize is required when the supports are counts")
+            self._dbSize = 1
+        self._minConfBound = self._minConf
+        if self._numWorkers > 1:
+            rules = self._rulesInPool()
+            if self._topN is not None:
+                top = _TopRules(self._topN, self._perConsequent, measures.index(self._measure))
+                for rule in rules:
+                    top.add(*rule)
+                rules = top.rules()
+        else:
+            rules = self._rulesOf(self._supports)
+        if self._ruleSink is not None:
+            for antecedent, consequent, values in rules:
+                self._ruleSink.add(self._ruleString(antecedent, consequent), values)
+            self._ruleSink.close()
+        else:
+            for antecedent, consequent, values in rules:
+                self._associationRules[self._ruleKey(antecedent, consequent)] = values
+        self._endTime = _ab._time.time()
+        process = _ab._psutil.Process(_ab._os.getpid())
+        self._memoryUSS = process.memory_full_info().uss
+        self._memoryRSS = process.memory_info().rss
+        print("Association rules successfully  generated from frequent patterns ")
+
+    def getMemoryUSS(self) -> float:
+        """
+        Total amount of USS memory consumed by the mining process will be retrieved from this function
+
+        :return: returning USS memory consumed by the mining process
+        :rtype: float
+        """
+
+        return self._memoryUSS
+
+    def getMemoryRSS(self) -> float:
+        """
+        Total amount of RSS memory consumed by the mining process will be retrieved from this function
+
+        :return: returning RSS memory consumed by the mining process
+        :rtype: float
+        """
+
+        return self._memoryRSS
+
+    def getRuntime(self) -> float:
+        """
+        Calculating the total amount of runtime taken by the mining process
+
+        :return: returning total amount of runtime taken by the mining process
+        :rtype: float
+        """
+
+        return self._endTime - self._startTime
+
+    def getAssociationRulesAsDataFrame(self) -> _ab._pd.DataFrame:
+        """
+        Storing the association rules in a dataframe
+
+        :return: returning association rules in a dataframe
+        :rtype: pd.DataFrame
+        """
+        data = [[" ".join(str(x) for x in antecedent), " ".join(str(x) for x in consequent)] + values
+                for (antecedent, consequent), values in self._associationRules.items()]
+        return _ab._pd.DataFrame(data, columns=['Antecedent', 'Consequent', 'Support', 'Confidence', 'Lift',
+                                                'Leverage', 'Conviction'])
+
+    def save(self, outFile: str) -> None:
+        """
+        Complete set of association rules will be loaded in to an output file as
+        antecedent -> consequent:support:confidence:lift:leverage:conviction
+
+        :param outFile: name of the output file
+        :type outFile: csvfile
+        :return: None
+        """
+        with open(outFile, 'w') as f:
+            for (antecedent, consequent), values in self._associationRules.items():
+                rule = self._sep.join(str(x) for x in antecedent) + " -> " + self._sep.join(str(x) for x in consequent)
+                f.write(rule + ":" + ":".join(str(x) for x in values) + "\n")
+
+    def getAssociationRules(self) -> Dict[Tuple[tuple, tuple], List[float]]:
+        """
+        Function to send the association rules after completion of the mining process
+
+        :return: returning the association rules, mapping (antecedent, consequent) to [support, confidence, lift,
+            leverage, conviction]
+        :rtype: dict
+        """
+        return self._associationRules
+
+    def printResults(self) -> None:
+        """
+        Function to send the result after completion of the mining process
+        """
+        print("Total number of Association Rules:", len(self.getAssociationRules()))
+        print("Total Memory in USS:", self.getMemoryUSS())
+        print("Total Memory in RSS", self.getMemoryRSS())
+        print("Total ExecutionTime in ms:", self.getRuntime())
+
+
+if __name__ == "__main__":
+    _ap = str()
+    if len(_ab._sys.argv) == 5 or len(_ab._sys.argv) == 6:
+        if len(_ab._sys.argv) == 6:
+            _ap = RuleEngine(_ab._sys.argv[1], float(_ab._sys.argv[3]), _ab._sys.argv[5], int(_ab._sys.argv[4]))
+        if len(_ab._sys.argv) == 5:
+            _ap = RuleEngine(_ab._sys.argv[1], float(_ab._sys.argv[3]), dbSize=int(_ab._sys.argv[4]))
+        _ap.mine()
+        print("Total number of Association Rules:", len(_ap.getAssociationRules()))
+        _ap.save(_ab._sys.argv[2])
+        print("Total Memory in USS:", _ap.getMemoryUSS())
+        print("Total Memory in RSS", _ap.getMemoryRSS())
+        print("Total ExecutionTime in ms:", _ap.getRuntime())
+    else:
+        print("Error! The number of input parameters do not match the total number of parameters provided")
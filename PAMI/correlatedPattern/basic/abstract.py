@@ -26,6 +26,7 @@ import validators as _validators
 from urllib.request import urlopen as _urlopen
 import sys as _sys
 import math as _math
+from PAMI.extras.dbLoader import compactDatabase as _compactDatabase
 
 
 class _correlatedPatterns(_ABC):
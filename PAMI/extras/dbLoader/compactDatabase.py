@@ -0,0 +1,435 @@
+# compactDatabase parses transactional, temporal, utility and uncertain databases once into a compact, integer-encoded
+# layout that every mining algorithm in PAMI can consume.
+#
+# **Importing this module into a python program**
+#
+#             from PAMI.extras.dbLoader import compactDatabase as cdb
+#
+#             db = cdb.load('sampleTemporalDB.txt', sep='\t', dbType='temporal')
+#
+#             print("Total number of transactions:", len(db))
+#
+#             print("Total number of items:", db.getItemCount())
+#
+#             supports = db.getItemSupports()
+#
+#             for tid in range(len(db)):
+#
+#                 print(db.getTimestamp(tid), db.decode(db.getTransaction(tid)))
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from array import array
+from typing import List, Dict, Union, Iterable, Optional
+from urllib.request import urlopen
+import numpy as np
+import pandas as pd
+import validators
+from PAMI.extras.dbLoader import databaseCache
+
+dbTypes = ('transactional', 'temporal', 'utility', 'uncertain')
+
+
+class CompactDatabase:
+    """
+    :Description:   CompactDatabase stores a database in a CSR (compressed sparse row) layout. Every distinct item is
+                    mapped to an integer id, and the transactions are kept as one flat array of item ids together with
+                    an array of offsets. The items of the transaction tid are items[offsets[tid]:offsets[tid + 1]].
+
+    :Attributes:
+
+        itemNames : list
+            Maps an item id to the item name as it appeared in the input
+        itemIds : dict
+            Maps an item name to its item id
+        items : numpy.ndarray
+            Flat int32 array storing the item ids of all transactions
+        offsets : numpy.ndarray
+            int64 array of length (number of transactions + 1) storing where every transaction starts in items
+        timestamps : numpy.ndarray or None
+            int64 array storing the timestamp of every transaction of a temporal database
+        utilities : numpy.ndarray or None
+            float64 array parallel to items storing the utility of every item occurrence of a utility database
+        transactionUtilities : numpy.ndarray or None
+            float64 array storing the transaction utility of every transaction of a utility database
+        probabilities : numpy.ndarray or None
+            float64 array parallel to items storing the existential probability of every item occurrence of an
+            uncertain database
+
+    :Methods:
+
+        getTransaction(tid)
+            Returns the item ids of the transaction tid
+        getItemCount()
+            Returns the number of distinct items
+        getItemSupports()
+            Returns the number of transactions containing each item id
+        getTransactionLengths()
+            Returns the length of every transaction
+        getTidLists()
+            Returns the vertical (item id -> transaction ids) representation of the database
+        getTimestampLists()
+            Returns the vertical (item id -> timestamps) representation of a temporal database
+        decode(ids)
+            Converts item ids back into item names
+        toLists()
+            Returns the database as a list of lists of item names
+    """
+
+    def __init__(self, itemNames: List[str], items: np.ndarray, offsets: np.ndarray,
+                 timestamps: Optional[np.ndarray] = None, utilities: Optional[np.ndarray] = None,
+                 transactionUtilities: Optional[np.ndarray] = None,
+                 probabilities: Optional[np.ndarray] = None) -> None:
+        self.itemNames = itemNames
+        self.itemIds = {name: i for i, name in enumerate(itemNames)}
+        self.items = items
+        self.offsets = offsets
+        self.timestamps = timestamps
+        self.utilities = utilities
+        self.transactionUtilities = transactionUtilities
+        self.probabilities = probabilities
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def getTransaction(self, tid: int) -> np.ndarray:
+        """
+        Returns the item ids of a transaction as a view on the flat item array
+
+        :param tid: index of the transaction
+        :type tid: int
+        :return: item ids of the transaction
+        :rtype: numpy.ndarray
+        """
+        return self.items[self.offsets[tid]:self.offsets[tid + 1]]
+
+    def getTimestamp(self, tid: int) -> int:
+        """
+        Returns the timestamp of a transaction. Transactions of non-temporal databases are numbered from 1.
+
+        :param tid: index of the transaction
+        :type tid: int
+        :return: timestamp of the transaction
+        :rtype: int
+        """
+        if self.timestamps is None:
+            return tid + 1
+        return int(self.timestamps[tid])
+
+    def getItemCount(self) -> int:
+        """
+        :return: number of distinct items in the database
+        :rtype: int
+        """
+        return len(self.itemNames)
+
+    def getTransactionLengths(self) -> np.ndarray:
+        """
+        :return: the number of items in every transaction
+        :rtype: numpy.ndarray
+        """
+        return np.diff(self.offsets)
+
+    def getItemSupports(self) -> np.ndarray:
+        """
+        Counts the number of transactions containing each item. An item repeated within a transaction is counted once.
+        The count of item id i is stored at index i.
+
+        :return: support of every item id
+        :rtype: numpy.ndarray
+        """
+        itemCount = len(self.itemNames)
+        if itemCount == 0:
+            return np.zeros(0, dtype=np.int64)
+        # every (transaction, item) pair is counted once
+        pairs = np.unique(self.getTransactionIds() * itemCount + self.items)
+        return np.bincount(pairs % itemCount, minlength=itemCount)
+
+    def getTransactionIds(self) -> np.ndarray:
+        """
+        :return: array parallel to items storing the transaction index of every item occurrence
+        :rtype: numpy.ndarray
+        """
+        return np.repeat(np.arange(len(self), dtype=np.int64), self.getTransactionLengths())
+
+    def _vertical(self, values: np.ndarray) -> Dict[int, np.ndarray]:
+        """
+        Groups values (parallel to items) by item id. Every group keeps the order of the transactions.
+
+        :param values: array parallel to items
+        :type values: numpy.ndarray
+        :return: dictionary from item id to the grouped values
+        :rtype: dict
+        """
+        order = np.argsort(self.items, kind='stable')
+        counts = np.bincount(self.items, minlength=len(self.itemNames))
+        groups = np.split(values[order], np.cumsum(counts)[:-1])
+        return {item: groups[item] for item in range(len(self.itemNames)) if counts[item] > 0}
+
+    def getTidLists(self) -> Dict[int, np.ndarray]:
+        """
+        :return: dictionary from item id to the sorted indices of the transactions containing the item
+        :rtype: dict
+        """
+        return self._vertical(self.getTransactionIds())
+
+    def getTimestampLists(self) -> Dict[int, np.ndarray]:
+        """
+        :return: dictionary from item id to the timestamps at which the item appears
+        :rtype: dict
+        """
+        if self.timestamps is None:
+            return self._vertical(self.getTransactionIds() + 1)
+        return self._vertical(np.repeat(self.timestamps, self.getTransactionLengths()))
+
+    def decode(self, ids: Iterable[int]) -> List[str]:
+        """
+        Converts a collection of item ids into item names
+
+        :param ids: item ids
+        :type ids: iterable
+        :return: item names
+        :rtype: list
+        """
+        return [self.itemNames[i] for i in ids]
+
+    def getArrays(self) -> Dict[str, np.ndarray]:
+        """
+        :return: the arrays of the database by attribute name, leaving out the attributes that are not used
+        :rtype: dict
+        """
+        names = ('items', 'offsets', 'timestamps', 'utilities', 'transactionUtilities', 'probabilities')
+        return {name: getattr(self, name) for name in names if getattr(self, name) is not None}
+
+    def toLists(self) -> List[List[str]]:
+        """
+        Converts the database back into the list of lists representation used by the original miners
+
+        :return: transactions as lists of item names
+        :rtype: list
+        """
+        names = self.itemNames
+        items = self.items.tolist()
+        offsets = self.offsets.tolist()
+        return [[names[i] for i in items[offsets[t]:offsets[t + 1]]] for t in range(len(offsets) - 1)]
+
+
+class _Builder:
+    """
+    Accumulates parsed transactions in typed arrays, so that no per-transaction Python lists are kept alive.
+    """
+
+    def __init__(self, dbType: str) -> None:
+        self.dbType = dbType
+        self.itemIds = {}
+        self.itemNames = []
+        self.items = array('i')
+        self.offsets = array('q', [0])
+        self.timestamps = array('q')
+        self.values = array('d')
+        self.transactionUtilities = array('d')
+
+    def add(self, names: Iterable[str], values: Optional[Iterable[float]] = None) -> None:
+        """
+        Appends one transaction
+
+        :param names: item names of the transaction
+        :type names: iterable
+        :param values: utilities or probabilities parallel to names
+        :type values: iterable
+        """
+        itemIds = self.itemIds
+        if values is None:
+            for name in names:
+                iid = itemIds.get(name)
+                if iid is None:
+                    iid = itemIds[name] = len(self.itemNames)
+                    self.itemNames.append(name)
+                self.items.append(iid)
+        else:
+            for name, value in zip(names, values):
+                iid = itemIds.get(name)
+                if iid is None:
+                    iid = itemIds[name] = len(self.itemNames)
+                    self.itemNames.append(name)
+                self.items.append(iid)
+                self.values.append(value)
+        self.offsets.append(len(self.items))
+
+    def build(self) -> CompactDatabase:
+        """
+        :return: the accumulated database
+        :rtype: CompactDatabase
+        """
+        timestamps = utilities = transactionUtilities = probabilities = None
+        if self.dbType == 'temporal':
+            timestamps = np.array(self.timestamps, dtype=np.int64)
+        if self.dbType == 'utility':
+            utilities = np.array(self.values, dtype=np.float64)
+            transactionUtilities = np.array(self.transactionUtilities, dtype=np.float64)
+        if self.dbType == 'uncertain':
+            probabilities = np.array(self.values, dtype=np.float64)
+        return CompactDatabase(self.itemNames, np.array(self.items, dtype=np.int32),
+                               np.array(self.offsets, dtype=np.int64), timestamps, utilities,
+                               transactionUtilities, probabilities)
+
+
+def _split(text: str, sep: str) -> List[str]:
+    """
+    Splits a field into its non-empty, stripped tokens
+    """
+    return [x for x in (i.strip() for i in text.split(sep)) if x]
+
+
+def _parseLine(builder: _Builder, line: str, sep: str) -> None:
+    """
+    Parses one line of the input according to the database type of the builder
+
+    :param builder: builder receiving the transaction
+    :type builder: _Builder
+    :param line: line of the input file
+    :type line: str
+    :param sep: separator of the items
+    :type sep: str
+    """
+    line = line.strip()
+    if not line:
+        return
+    dbType = builder.dbType
+    if dbType == 'transactional':
+        builder.add(_split(line, sep))
+    elif dbType == 'temporal':
+        temp = _split(line, sep)
+        builder.timestamps.append(int(float(temp[0])))
+        builder.add(temp[1:])
+    elif dbType == 'utility':
+        parts = line.split(':')
+        builder.transactionUtilities.append(float(parts[1]))
+        builder.add(_split(parts[0], sep), [float(x) for x in _split(parts[2], sep)])
+    else:
+        if ':' in line:
+            parts = line.split(':')
+            builder.add(_split(parts[0], sep), [float(x) for x in _split(parts[1], sep)])
+        else:
+            names, probabilities = [], []
+            for token in _split(line, sep):
+                i1 = token.find('(')
+                names.append(token[:i1])
+                probabilities.append(float(token[i1 + 1:token.find(')')]))
+            builder.add(names, probabilities)
+
+
+def _fromDataFrame(builder: _Builder, df: pd.DataFrame, sep: str) -> None:
+    """
+    Reads a data frame with a 'Transactions' column and, depending on the database type, a 'TS', 'Utilities',
+    'TransactionUtility' or 'uncertain' column
+    """
+    columns = df.columns.values.tolist()
+    if 'Transactions' not in columns:
+        print("The column name should be Transactions and each line should be separated by tab space or a seperator specified by the user")
+        return
+
+    def tokens(value):
+        if isinstance(value, str):
+            return _split(value, sep)
+        return [str(x) for x in value]
+
+    transactions = df['Transactions'].tolist()
+    if builder.dbType == 'temporal':
+        ts = df['TS'].tolist() if 'TS' in columns else range(1, len(transactions) + 1)
+        for stamp, transaction in zip(ts, transactions):
+            builder.timestamps.append(int(stamp))
+            builder.add(tokens(transaction) if transaction else [])
+    elif builder.dbType in ('utility', 'uncertain'):
+        column = 'Utilities' if builder.dbType == 'utility' else 'uncertain'
+        values = df[column].tolist()
+        for k, transaction in enumerate(transactions):
+            builder.add(tokens(transaction), [float(x) for x in tokens(values[k])])
+            if builder.dbType == 'utility':
+                if 'TransactionUtility' in columns:
+                    builder.transactionUtilities.append(float(df['TransactionUtility'].iloc[k]))
+                else:
+                    builder.transactionUtilities.append(float(sum(builder.values[builder.offsets[-2]:])))
+    else:
+        for transaction in transactions:
+            builder.add(tokens(transaction))
+
+
+def parseLines(lines: Iterable[str], sep: str = '\t', dbType: str = 'transactional') -> CompactDatabase:
+    """
+    Parses an iterable of text lines, e.g. an open file or a list of strings, into a CompactDatabase
+
+    :param lines: lines of the database
+    :type lines: iterable
+    :param sep: separator of the items. The default separator is tab space.
+    :type sep: str
+    :param dbType: one of 'transactional', 'temporal', 'utility' or 'uncertain'
+    :type dbType: str
+    :return: the parsed database
+    :rtype: CompactDatabase
+    """
+    if dbType not in dbTypes:
+        raise ValueError("dbType must be one of: " + str(dbTypes))
+    builder = _Builder(dbType)
+    for line in lines:
+        _parseLine(builder, line, sep)
+    return builder.build()
+
+
+def load(iFile: Union[str, pd.DataFrame], sep: str = '\t', dbType: str = 'transactional',
+         cache: Optional[bool] = None) -> CompactDatabase:
+    """
+    Reads a database from a file, URL or data frame into a CompactDatabase. Local files can be cached in a binary
+    sidecar (see databaseCache), in which case later calls memory-map the arrays instead of parsing the text.
+
+    :param iFile: name of the input file, URL or data frame
+    :type iFile: str or pandas.DataFrame
+    :param sep: separator of the items. The default separator is tab space.
+    :type sep: str
+    :param dbType: one of 'transactional', 'temporal', 'utility' or 'uncertain'
+    :type dbType: str
+    :param cache: use the binary sidecar of a local file. Defaults to the setting of databaseCache.enable()/disable().
+    :type cache: bool
+    :return: the parsed database
+    :rtype: CompactDatabase
+    """
+    if dbType not in dbTypes:
+        raise ValueError("dbType must be one of: " + str(dbTypes))
+    if isinstance(iFile, pd.DataFrame):
+        builder = _Builder(dbType)
+        if iFile.empty:
+            print("its empty..")
+        else:
+            _fromDataFrame(builder, iFile, sep)
+        return builder.build()
+    if validators.url(iFile):
+        return parseLines((line.decode("utf-8") for line in urlopen(iFile)), sep, dbType)
+    if cache is None:
+        cache = databaseCache.isEnabled()
+    if cache:
+        cached = databaseCache.read(iFile, sep, dbType)
+        if cached is not None:
+            itemNames, arrays = cached
+            return CompactDatabase(itemNames, **arrays)
+    with open(iFile, 'r', encoding='utf-8') as f:
+        db = parseLines(f, sep, dbType)
+    if cache:
+        databaseCache.write(iFile, sep, dbType, db.itemNames, db.getArrays())
+    return db
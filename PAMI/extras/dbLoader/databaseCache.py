@@ -0,0 +1,184 @@
+# databaseCache stores the integer-encoded databases of compactDatabase as binary sidecar files, so that mining the
+# same database repeatedly, e.g. with different minSup or maxPer values, parses the text file only once.
+#
+# **Importing this module into a python program**
+#
+#             from PAMI.extras.dbLoader import databaseCache
+#
+#             from PAMI.frequentPattern.basic import FPGrowth as alg
+#
+#             databaseCache.enable()     # or databaseCache.enable('/tmp/pamiCache')
+#
+#             for minSup in [100, 80, 60]:
+#
+#                 obj = alg.FPGrowth('sampleDB.txt', minSup)
+#
+#                 obj.mine()             # only the first call parses sampleDB.txt
+#
+#             databaseCache.disable()
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import os
+import json
+import shutil
+import hashlib
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+formatVersion = 1
+
+_settings = {'enabled': False, 'cacheDir': None}
+
+
+def enable(cacheDir: Optional[str] = None) -> None:
+    """
+    Enables the cache for every database read through compactDatabase.load
+
+    :param cacheDir: directory storing the sidecar files. By default, the sidecar is written next to the input file.
+    :type cacheDir: str
+    :return: None
+    """
+    _settings['enabled'] = True
+    _settings['cacheDir'] = cacheDir
+
+
+def disable() -> None:
+    """
+    Disables the cache. Existing sidecar files are kept.
+
+    :return: None
+    """
+    _settings['enabled'] = False
+
+
+def isEnabled() -> bool:
+    """
+    :return: True if the cache is enabled
+    :rtype: bool
+    """
+    return _settings['enabled']
+
+
+def _signature(iFile: str, sep: str, dbType: str) -> Dict:
+    """
+    Describes the exact version of an input file. A sidecar is only reused if its signature is identical.
+    """
+    stat = os.stat(iFile)
+    return {'version': formatVersion, 'path': os.path.abspath(iFile), 'mtime': stat.st_mtime_ns,
+            'size': stat.st_size, 'sep': sep, 'dbType': dbType}
+
+
+def cachePath(iFile: str, sep: str, dbType: str, cacheDir: Optional[str] = None) -> str:
+    """
+    Returns the sidecar directory of an input file. There is one sidecar per (file, separator, database type).
+
+    :param iFile: name of the input file
+    :type iFile: str
+    :param sep: separator of the items
+    :type sep: str
+    :param dbType: database type of compactDatabase
+    :type dbType: str
+    :param cacheDir: directory storing the sidecar files. Defaults to the configured directory or the directory of iFile.
+    :type cacheDir: str
+    :return: path of the sidecar directory
+    :rtype: str
+    """
+    path = os.path.abspath(iFile)
+    key = hashlib.sha1(repr((path, sep, dbType)).encode('utf-8')).hexdigest()[:16]
+    directory = cacheDir or _settings['cacheDir'] or os.path.dirname(path)
+    return os.path.join(directory, os.path.basename(path) + '.' + key + '.pamidb')
+
+
+def read(iFile: str, sep: str, dbType: str) -> Optional[Tuple[List[str], Dict[str, np.ndarray]]]:
+    """
+    Reads a sidecar if it matches the current version of the input file. The arrays are memory-mapped read-only, so
+    only the pages touched by the miner are loaded.
+
+    :param iFile: name of the input file
+    :type iFile: str
+    :param sep: separator of the items
+    :type sep: str
+    :param dbType: database type of compactDatabase
+    :type dbType: str
+    :return: item names and arrays of the database, or None if there is no valid sidecar
+    :rtype: tuple or None
+    """
+    path = cachePath(iFile, sep, dbType)
+    try:
+        with open(os.path.join(path, 'meta.json'), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta['signature'] != _signature(iFile, sep, dbType):
+            return None
+        with open(os.path.join(path, 'itemNames.json'), 'r', encoding='utf-8') as f:
+            itemNames = json.load(f)
+        arrays = {name: np.load(os.path.join(path, name + '.npy'), mmap_mode='r') for name in meta['arrays']}
+    except (OSError, ValueError, KeyError):
+        return None
+    return itemNames, arrays
+
+
+def write(iFile: str, sep: str, dbType: str, itemNames: List[str], arrays: Dict[str, np.ndarray]) -> None:
+    """
+    Writes the sidecar of an input file. The files are written to a temporary directory first, so that concurrent
+    readers never observe a partially written sidecar.
+
+    :param iFile: name of the input file
+    :type iFile: str
+    :param sep: separator of the items
+    :type sep: str
+    :param dbType: database type of compactDatabase
+    :type dbType: str
+    :param itemNames: maps an item id to the item name
+    :type itemNames: list
+    :param arrays: arrays of the database by attribute name
+    :type arrays: dict
+    :return: None
+    """
+    path = cachePath(iFile, sep, dbType)
+    temp = path + '.' + str(os.getpid()) + '.tmp'
+    try:
+        os.makedirs(temp, exist_ok=True)
+        for name, arr in arrays.items():
+            np.save(os.path.join(temp, name + '.npy'), arr)
+        with open(os.path.join(temp, 'itemNames.json'), 'w', encoding='utf-8') as f:
+            json.dump(itemNames, f)
+        with open(os.path.join(temp, 'meta.json'), 'w', encoding='utf-8') as f:
+            json.dump({'signature': _signature(iFile, sep, dbType), 'arrays': list(arrays)}, f)
+        if os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+        os.replace(temp, path)
+    except OSError:
+        shutil.rmtree(temp, ignore_errors=True)
+
+
+def clear(iFile: str, sep: str = '\t', dbType: str = 'transactional') -> None:
+    """
+    Removes the sidecar of an input file
+
+    :param iFile: name of the input file
+    :type iFile: str
+    :param sep: separator of the items
+    :type sep: str
+    :param dbType: database type of compactDatabase
+    :type dbType: str
+    :return: None
+    """
+    shutil.rmtree(cachePath(iFile, sep, dbType), ignore_errors=True)
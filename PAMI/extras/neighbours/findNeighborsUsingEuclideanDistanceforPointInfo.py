@@ -32,8 +32,7 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 import sys
-import re
-from math import sqrt
+from PAMI.extras.neighbours.findNeighboursUsingEuclidean import createNeighborhoodFileUsingEuclideanDistance as _euclidean
 
 class createNeighborhoodFileUsingEuclideanDistance:
     """
@@ -75,6 +74,7 @@ class createNeighborhoodFileUsingEuclideanDistance:
         self.oFile = oFile
         self.maxEucledianDistance = maxEucledianDistance
         self.uniqueItems = []
+        seen = set()
         coordinates = []
         result = {}
         with open(self.iFile,"r") as f:
@@ -85,28 +85,16 @@ class createNeighborhoodFileUsingEuclideanDistance:
                 for i in l[0]:
                     if i[-1] == '1':
                         i = i[0:-2]
-                    if i not in self.uniqueItems:
+                    if i not in seen:
+                        seen.add(i)
                         self.uniqueItems.append(i)
         for i in self.uniqueItems:
             i = i.strip("Point()")
             coordinates.append(i.rstrip().split())
         #print("Total number of unique coordinates in the given file: "len(coordinates))
-        for i in range(len(coordinates)):
-            for j in range(len(coordinates)):
-                if i != j:
-                    firstCoordinate = coordinates[i]
-                    secondCoordinate = coordinates[j]
-                    x1 = float(firstCoordinate[0])
-                    y1 = float(firstCoordinate[1])
-                    x2 = float(secondCoordinate[0])
-                    y2 = float(secondCoordinate[1])
-                    ansX = x2-x1
-                    ansY = y2-y1
-                    dist = abs(pow(ansX,2) - pow(ansY,2))
-                    norm = sqrt(dist)
-                    if norm <= float(self.maxEucledianDistance):
-                        result[tuple(firstCoordinate)] = result.get(tuple(firstCoordinate),[])
-                        result[tuple(firstCoordinate)].append(secondCoordinate)
+        for i, points in _euclidean._neighbours(coordinates, float(self.maxEucledianDistance), 1 << 22):
+            result[tuple(coordinates[i])] = result.get(tuple(coordinates[i]), [])
+            result[tuple(coordinates[i])].extend(coordinates[j] for j in points)
 
         with open(self.oFile,"w+") as f:
             for i in result:
@@ -5,9 +5,9 @@
 #
 #     from PAMI.extras.neighbours import findNeighboursUsingEuclidean as db
 #
-#     obj = db.findNeighboursUsingGeodesic(iFile, oFile, 10, "\t")
+#     obj = db.createNeighborhoodFileUsingEuclideanDistance(iFile, oFile, 10, "\t")
 #
-#     obj.save()
+#     print(obj.getFileName())
 #
 
 
@@ -32,11 +32,15 @@ Copyright (C)  2021 Rage Uday Kiran
 
 import sys
 import re
-from math import sqrt
+import numpy as np
+from PAMI.extras.neighbours.spatialIndex import GridIndex
 
 class createNeighborhoodFileUsingEuclideanDistance:
     """
-    This class create a neighbourhood file using euclid distance.
+    This class create a neighbourhood file using euclid distance. The coordinates are loaded into a numpy array and
+    indexed by a grid whose cells are as large as maxEuclideanDistance, so only the points of adjacent cells are
+    compared. Each line of the neighbourhood file holds a point followed by its neighbours, in the order of the input
+    file.
 
     :Attribute:
 
@@ -50,11 +54,11 @@ class createNeighborhoodFileUsingEuclideanDistance:
             and store the pairs.
         :param  seperator: str :
                     This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+        :param blockSize : int
+            Number of candidate pairs compared at once, which bounds the memory used
 
     :Methods:
 
-        mine()
-            find and store the pairs of values whose Euclidean distance is less than or equal to maxEucledianDistace.
         getFileName()
             This function returns output file name.
 
@@ -64,51 +68,67 @@ class createNeighborhoodFileUsingEuclideanDistance:
 
             from PAMI.extras.neighbours import findNeighboursUsingEuclidean as db
 
-            obj = db.findNeighboursUsingEuclidean(iFile, oFile, 10, "\t")
+            obj = db.createNeighborhoodFileUsingEuclideanDistance(iFile, oFile, 10, "\t")
 
-            obj.save()
+            print(obj.getFileName())
     """
 
-    def __init__(self,iFile: str,oFile: str,maxEucledianDistance: int, seperator='\t') -> None:
+    def __init__(self,iFile: str,oFile: str,maxEucledianDistance: int, seperator='\t', blockSize: int = 1 << 22) -> None:
         self.iFile = iFile
         self.oFile = oFile
         self.maxEucledianDistance = maxEucledianDistance
 
         coordinates = []
-        result = {}
         with open(self.iFile,"r") as f:
             for line in f:
                 l = line.rstrip().split(seperator)
-                #print(l)
-                l[0] = re.sub(r'[^0-9. ]', '', l[0])
-                coordinates.append(l[0].rstrip().split(' '))
-                #print(l[0])
-        for i in range(len(coordinates)):
-            for j in range(len(coordinates)):
-                if i != j:
-                    firstCoordinate = coordinates[i]
-                    secondCoordinate = coordinates[j]
-                    x1 = float(firstCoordinate[0])
-                    y1 = float(firstCoordinate[1])
-                    x2 = float(secondCoordinate[0])
-                    y2 = float(secondCoordinate[1])
-                    ansX = x2-x1
-                    ansY = y2-y1
-                    dist = abs(pow(ansX,2) - pow(ansY,2))
-                    norm = sqrt(dist)
-                    if norm <= float(self.maxEucledianDistance):
-                        result[tuple(firstCoordinate)] = result.get(tuple(firstCoordinate),[])
-                        result[tuple(firstCoordinate)].append(secondCoordinate)
+                l[0] = re.sub(r'[^0-9.\- ]', '', l[0])
+                if l[0].strip():
+                    coordinates.append(l[0].split())
+        neighbours = self._neighbours(coordinates, float(self.maxEucledianDistance), blockSize)
 
+        result = {}
+        for i, points in neighbours:
+            result[tuple(coordinates[i])] = result.get(tuple(coordinates[i]), [])
+            result[tuple(coordinates[i])].extend(points)
         with open(self.oFile,"w+") as f:
             for i in result:
-                string = "Point(" +i[0]+" "+i[1] + ")"+ seperator
+                string = "Point(" + i[0] + " " + i[1] + ")" + seperator
                 f.write(string)
                 for j in result[i]:
-                    string = "Point(" + j[0] + " " + j[1] + ")"+ seperator
+                    j = coordinates[j]
+                    string = "Point(" + j[0] + " " + j[1] + ")" + seperator
                     f.write(string)
                 f.write("\n")
 
+    @staticmethod
+    def _neighbours(coordinates, maxDistance, blockSize):
+        """
+        Finds the neighbours of every point
+
+        :param coordinates: x and y of every point
+        :type coordinates: list
+        :param maxDistance: maximum Euclidean distance between neighbours
+        :type maxDistance: float
+        :param blockSize: number of candidate pairs compared at once
+        :type blockSize: int
+        :return: every point having neighbours with the indices of its neighbours, in the order of the input
+        :rtype: list
+        """
+        points = np.array([c[:2] for c in coordinates], dtype=np.float64).reshape(-1, 2)
+        index = GridIndex(points, maxDistance if maxDistance > 0 else 1.0)
+        firsts, seconds = [], []
+        for first, second in index.candidatePairs(blockSize):
+            close = ((points[first] - points[second]) ** 2).sum(axis=1) <= maxDistance * maxDistance
+            firsts.append(first[close])
+            seconds.append(second[close])
+        if not firsts:
+            return []
+        firsts, seconds = np.concatenate(firsts), np.concatenate(seconds)
+        order = np.lexsort((seconds, firsts))
+        firsts, seconds = firsts[order], seconds[order]
+        points, starts = np.unique(firsts, return_index=True)
+        return list(zip(points.tolist(), [x.tolist() for x in np.split(seconds, starts[1:])]))
 
     def getFileName(self) -> str:
         return self.oFile
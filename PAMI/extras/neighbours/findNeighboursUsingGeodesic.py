@@ -5,9 +5,9 @@
 #
 #     from PAMI.extras.neighbours import findNeighboursUsingGeodesic as db
 #
-#     obj = db.findNeighboursUsingGeodesic(iFile, oFile, 10, "\t")
+#     obj = db.createNeighborhoodFileUsingGeodesicDistance(iFile, oFile, 10, "\t")
 #
-#     obj.save()
+#     print(obj.getFileName())
 #
 
 
@@ -31,13 +31,29 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 import sys
 import re
-from math import sqrt
-from geopy.distance import geodesic
+import numpy as np
+from PAMI.extras.neighbours.spatialIndex import GridIndex
+
+try:
+    from geopy.distance import geodesic
+except ImportError:
+    geodesic = None
+
+#: mean radius of the earth in kilometers
+_earthRadius = 6371.0088
+
+#: bounds of the ratio between the geodesic distance on the WGS-84 ellipsoid and the haversine distance, given by the
+#: smallest and the largest radius of curvature of the ellipsoid
+_lowerRatio = 0.994
+_upperRatio = 1.005
 
 
 class createNeighborhoodFileUsingGeodesicDistance:
     """
-    This class create a neighbourhood file using Geodesic distance.
+    This class create a neighbourhood file using Geodesic distance. The locations are indexed by a grid over their unit
+    vectors, and the haversine distance of the candidate pairs is computed with numpy. The geodesic distance on the
+    ellipsoid differs from the haversine distance by less than 0.6%, so the exact geodesic distance is computed only
+    for the pairs whose haversine distance is that close to maxDistance.
 
     :Attribute:
 
@@ -51,12 +67,12 @@ class createNeighborhoodFileUsingGeodesicDistance:
             and store the pairs.
         :param  seperator: str :
                     This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+        :param blockSize : int
+            Number of candidate pairs compared at once, which bounds the memory used
 
 
     :Methods:
 
-        mine()
-            find and store the pairs of values whose Geodesic distance is less than or equal to maxDistace.
         getFileName()
             This function returns output file name.
 
@@ -66,50 +82,83 @@ class createNeighborhoodFileUsingGeodesicDistance:
 
             from PAMI.extras.neighbours import findNeighboursUsingGeodesic as db
 
-             obj = db.findNeighboursUsingGeodesic(iFile, oFile, 10, "\t")
+            obj = db.createNeighborhoodFileUsingGeodesicDistance(iFile, oFile, 10, "\t")
 
-            obj.save()
+            print(obj.getFileName())
     """
 
-    def __init__(self, iFile: str, oFile: str, maxDistance: float, seperator='\t'):
+    def __init__(self, iFile: str, oFile: str, maxDistance: float, seperator='\t', blockSize: int = 1 << 22):
         self.iFile = iFile
         self.oFile = oFile
         self.maxDistance = maxDistance
 
         coordinates = []
-        result = {}
         with open(self.iFile, "r") as f:
             for line in f:
                 l = line.rstrip().split(seperator)
-                # print(l)
-                l[2] = re.sub(r'[^0-9. ]', '', l[2])
-                coordinates.append(l[2].rstrip().split(' '))
-                # print(l[0])
-        for i in range(len(coordinates)):
-            for j in range(len(coordinates)):
-                if i != j:
-                    firstCoordinate = coordinates[i]
-                    secondCoordinate = coordinates[j]
-                    long1 = float(firstCoordinate[0])
-                    lat1 = float(firstCoordinate[1])
-                    long2 = float(secondCoordinate[0])
-                    lat2 = float(secondCoordinate[1])
-
-                    dist = geodesic((lat1, long1), (lat2, long2)).kilometers
-
-                    if dist <= float(self.maxDistance):
-                        result[tuple(firstCoordinate)] = result.get(tuple(firstCoordinate), [])
-                        result[tuple(firstCoordinate)].append(secondCoordinate)
+                l[2] = re.sub(r'[^0-9.\- ]', '', l[2])
+                coordinates.append(l[2].split())
+        neighbours = self._neighbours(coordinates, float(self.maxDistance), blockSize)
 
+        result = {}
+        for i, points in neighbours:
+            result[tuple(coordinates[i])] = result.get(tuple(coordinates[i]), [])
+            result[tuple(coordinates[i])].extend(points)
         with open(self.oFile, "w+") as f:
             for i in result:
                 string = "Point(" + i[0] + " " + i[1] + ")" + seperator
                 f.write(string)
                 for j in result[i]:
+                    j = coordinates[j]
                     string = "Point(" + j[0] + " " + j[1] + ")" + seperator
                     f.write(string)
                 f.write("\n")
 
+    @staticmethod
+    def _neighbours(coordinates, maxDistance, blockSize):
+        """
+        Finds the neighbours of every location
+
+        :param coordinates: longitude and latitude of every location
+        :type coordinates: list
+        :param maxDistance: maximum geodesic distance between neighbours in kilometers
+        :type maxDistance: float
+        :param blockSize: number of candidate pairs compared at once
+        :type blockSize: int
+        :return: every location having neighbours with the indices of its neighbours, in the order of the input
+        :rtype: list
+        """
+        locations = np.radians(np.array([c[:2] for c in coordinates], dtype=np.float64).reshape(-1, 2))
+        longitudes, latitudes = locations[:, 0], locations[:, 1]
+        vectors = np.column_stack((np.cos(latitudes) * np.cos(longitudes), np.cos(latitudes) * np.sin(longitudes),
+                                   np.sin(latitudes)))
+        # the haversine distance of neighbours is at most maxDistance / _lowerRatio, i.e., their unit vectors are at
+        # most this chord apart
+        angle = min(maxDistance / (_earthRadius * _lowerRatio), np.pi)
+        chord = 2 * np.sin(angle / 2)
+        index = GridIndex(vectors, max(chord, 1e-12))
+        firsts, seconds = [], []
+        for first, second in index.candidatePairs(blockSize):
+            chords = np.sqrt(((vectors[first] - vectors[second]) ** 2).sum(axis=1))
+            distances = 2 * _earthRadius * np.arcsin(np.minimum(chords / 2, 1.0))
+            close = distances * _upperRatio <= maxDistance
+            near = np.flatnonzero(~close & (distances * _lowerRatio <= maxDistance))
+            if len(near):
+                if geodesic is None:
+                    raise ImportError("geopy is required for the geodesic distance, install it with: pip install geopy")
+                for k in near.tolist():
+                    a, b = coordinates[first[k]], coordinates[second[k]]
+                    close[k] = geodesic((float(a[1]), float(a[0])), (float(b[1]), float(b[0]))).kilometers <= maxDistance
+            firsts.append(first[close])
+            seconds.append(second[close])
+        if not firsts:
+            return []
+        firsts, seconds = np.concatenate(firsts), np.concatenate(seconds)
+        order = np.lexsort((seconds, firsts))
+        firsts, seconds = firsts[order], seconds[order]
+        points, starts = np.unique(firsts, return_index=True)
+        return list(zip(points.tolist(), [x.tolist() for x in np.split(seconds, starts[1:])]))
+
     def getFileName(self):
         return self.oFile
 
@@ -0,0 +1,122 @@
+# spatialIndex is a uniform grid over points, used to find the pairs of points that are close to each other without
+# comparing every pair of points. Every point is put into the cell of the grid containing it, so two points whose
+# distance along every axis is at most the cell size of the axis are in the same or in adjacent cells.
+#
+# **Importing this module into a python program**
+# --------------------------------------------------------
+#
+#     from PAMI.extras.neighbours import spatialIndex
+#
+#     index = spatialIndex.GridIndex(points, 10)    # points is a numpy array with one row per point
+#
+#     for first, second in index.candidatePairs():
+#
+#         close = ((points[first] - points[second]) ** 2).sum(axis=1) <= 10 ** 2
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import numpy as np
+from itertools import product as _product
+
+
+class GridIndex:
+    """
+    A uniform grid over points of any dimension, e.g., x and y, or the unit vectors of locations on the earth. The
+    points of a cell are stored contiguously, so the candidate pairs of two cells are generated with array
+    operations.
+
+    :param points: coordinates of the points, one row per point. A flat array is read as x and y pairs.
+    :type points: numpy.ndarray
+    :param cellSize: size of the cells, for both axes or per axis. Points closer than the cell size along every axis
+        are in the same or in adjacent cells.
+    :type cellSize: float or tuple
+
+    :Methods:
+
+        candidatePairs(blockSize)
+            Yields the ordered pairs of distinct points lying in the same or in adjacent cells, in blocks
+    """
+
+    def __init__(self, points, cellSize):
+        points = np.asarray(points, dtype=np.float64)
+        if points.ndim != 2:
+            points = points.reshape(-1, 2)
+        dimensions = points.shape[1]
+        cellSize = np.broadcast_to(np.asarray(cellSize, dtype=np.float64), (dimensions,))
+        if not np.all(cellSize > 0):
+            raise ValueError("cellSize must be positive")
+        if len(points):
+            # larger cells only add candidates, and keep the cell keys within int64
+            cellSize = np.maximum(cellSize, np.ptp(points, axis=0) / (1 << (60 // dimensions - 2)))
+        cells = np.floor(points / cellSize).astype(np.int64)
+        if len(cells):
+            cells -= cells.min(axis=0)
+        # a cell is encoded as one integer, leaving empty cells around the grid so that the neighbours of a cell never
+        # wrap to the other side
+        widths = cells.max(axis=0) + 3 if len(cells) else np.full(dimensions, 3, dtype=np.int64)
+        self._strides = np.concatenate([np.cumprod(widths[::-1])[::-1][1:], [1]]).astype(np.int64)
+        keys = (cells + 1) @ self._strides
+        self._order = np.argsort(keys, kind='stable')
+        self._keys, self._starts, self._counts = np.unique(keys[self._order], return_index=True, return_counts=True)
+
+    def _cellPairs(self):
+        """
+        :return: start and count of the points of both cells of every pair of adjacent occupied cells
+        :rtype: tuple
+        """
+        firstStarts, firstCounts, secondStarts, secondCounts = [], [], [], []
+        for offset in _product((-1, 0, 1), repeat=len(self._strides)):
+            neighbours = self._keys + int(np.dot(offset, self._strides))
+            positions = np.searchsorted(self._keys, neighbours)
+            positions[positions == len(self._keys)] = 0
+            found = np.flatnonzero(self._keys[positions] == neighbours)
+            firstStarts.append(self._starts[found])
+            firstCounts.append(self._counts[found])
+            secondStarts.append(self._starts[positions[found]])
+            secondCounts.append(self._counts[positions[found]])
+        return (np.concatenate(firstStarts), np.concatenate(firstCounts), np.concatenate(secondStarts),
+                np.concatenate(secondCounts))
+
+    def candidatePairs(self, blockSize=1 << 22):
+        """
+        Yields every ordered pair (i, j), i != j, of points lying in the same or in adjacent cells. The pairs are
+        yielded in blocks of about blockSize pairs, so the memory used does not depend on the number of points. A pair
+        of cells holding more than blockSize pairs is yielded as one block.
+
+        :param blockSize: number of pairs of a block
+        :type blockSize: int
+        :return: the indices of the first and of the second point of the pairs of a block
+        :rtype: generator
+        """
+        firstStarts, firstCounts, secondStarts, secondCounts = self._cellPairs()
+        sizes = firstCounts * secondCounts
+        ends = np.cumsum(sizes)
+        begin = 0
+        while begin < len(sizes):
+            offset = ends[begin] - sizes[begin]
+            end = max(int(np.searchsorted(ends, offset + blockSize, side='right')), begin + 1)
+            counts = sizes[begin:end]
+            pairOf = np.repeat(np.arange(begin, end), counts)
+            local = np.arange(int(counts.sum()), dtype=np.int64) - np.repeat(ends[begin:end] - counts - offset, counts)
+            first = self._order[firstStarts[pairOf] + local // secondCounts[pairOf]]
+            second = self._order[secondStarts[pairOf] + local % secondCounts[pairOf]]
+            distinct = first != second
+            yield first[distinct], second[distinct]
+            begin = end
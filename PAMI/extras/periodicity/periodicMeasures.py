@@ -0,0 +1,350 @@
+# periodicMeasures provides the periodicity measures shared by the periodic pattern mining algorithms in PAMI: maximum
+# period, periodic support, lability (stability), recurring intervals and local periodic intervals.
+#
+# Every measure expects the timestamps of a pattern sorted in ascending order, so no measure sorts its input again.
+# The batched versions evaluate the timestamps of many patterns at once. The timestamps are then passed in the CSR
+# layout of compactDatabase: one flat array of values and an array of offsets, where the timestamps of pattern k are
+# values[offsets[k]:offsets[k + 1]].
+#
+# **Importing this module into a python program**
+#
+#             from PAMI.extras.periodicity import periodicMeasures as pm
+#
+#             values, offsets = pm.pack([[1, 3, 4, 9], [2, 5], [7]])
+#
+#             periods = pm.maxPeriods(values, offsets, maxTS=10)    # array([5, 5, 7])
+#
+#             print(pm.maxPeriod([1, 3, 4, 9], maxTS=10))          # 5
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from typing import List, Optional, Sequence, Set, Tuple
+import numpy as np
+
+
+def pack(arrays: Sequence[Sequence[int]]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Packs several sorted arrays of timestamps into the CSR layout used by the batched measures
+
+    :param arrays: sorted arrays of timestamps
+    :type arrays: list
+    :return: flat array of timestamps and offsets of every array
+    :rtype: tuple
+    """
+    lengths = np.fromiter((len(a) for a in arrays), dtype=np.int64, count=len(arrays))
+    offsets = np.zeros(len(arrays) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    if offsets[-1] == 0:
+        return np.zeros(0, dtype=np.int64), offsets
+    return np.concatenate([np.asarray(a, dtype=np.int64) for a in arrays]), offsets
+
+
+def _gaps(values: np.ndarray, offsets: np.ndarray, first: Optional[int] = None,
+          last: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Computes the differences between consecutive timestamps of every array. When first is given, the difference
+    between first and the first timestamp is included; when last is given, the difference between the last timestamp
+    and last is included.
+
+    :return: flat array of the differences and their offsets
+    :rtype: tuple
+    """
+    values = np.asarray(values, dtype=np.int64)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    count = len(offsets) - 1
+    head = int(first is not None)
+    tail = int(last is not None)
+    lengths = np.diff(offsets)
+    paddedOffsets = offsets + np.arange(count + 1, dtype=np.int64) * (head + tail)
+    padded = np.empty(paddedOffsets[-1], dtype=np.int64)
+    if head:
+        padded[paddedOffsets[:-1]] = first
+    if tail:
+        padded[paddedOffsets[1:] - 1] = last
+    segment = np.repeat(np.arange(count, dtype=np.int64), lengths)
+    padded[np.arange(len(values), dtype=np.int64) + segment * (head + tail) + head] = values
+    # a difference is only valid if both of its timestamps belong to the same array
+    valid = np.ones(max(len(padded) - 1, 0), dtype=bool)
+    boundaries = paddedOffsets[1:-1]
+    valid[boundaries[(boundaries > 0) & (boundaries < len(padded))] - 1] = False
+    gaps = np.diff(padded)[valid]
+    gapOffsets = np.zeros(count + 1, dtype=np.int64)
+    np.cumsum(np.maximum(np.diff(paddedOffsets) - 1, 0), out=gapOffsets[1:])
+    return gaps, gapOffsets
+
+
+def _reduce(ufunc: np.ufunc, data: np.ndarray, offsets: np.ndarray, empty) -> np.ndarray:
+    """
+    Applies a reduction to every segment of a flat array. Empty segments receive the value empty.
+    """
+    lengths = np.diff(offsets)
+    result = np.full(len(lengths), empty, dtype=data.dtype if len(data) else np.int64)
+    nonEmpty = lengths > 0
+    if np.any(nonEmpty):
+        result[nonEmpty] = ufunc.reduceat(data, offsets[:-1][nonEmpty])
+    return result
+
+
+def maxPeriods(values: np.ndarray, offsets: np.ndarray, maxTS: int, first: int = 0) -> np.ndarray:
+    """
+    Computes the maximum period of many sorted arrays of timestamps. The periods of an array are the differences
+    between first, its consecutive timestamps and maxTS.
+
+    :param values: flat array of sorted timestamps
+    :type values: numpy.ndarray
+    :param offsets: offsets of every array in values
+    :type offsets: numpy.ndarray
+    :param maxTS: the last timestamp of the database
+    :type maxTS: int
+    :param first: the timestamp before the first transaction. The default is 0.
+    :type first: int
+    :return: maximum period of every array
+    :rtype: numpy.ndarray
+    """
+    gaps, gapOffsets = _gaps(values, offsets, first, maxTS)
+    return _reduce(np.maximum, gaps, gapOffsets, 0)
+
+
+def maxPeriod(timeStamps: Sequence[int], maxTS: int, first: int = 0) -> int:
+    """
+    Computes the maximum period of a sorted array of timestamps
+
+    :param timeStamps: sorted timestamps of a pattern
+    :type timeStamps: list or numpy.ndarray
+    :param maxTS: the last timestamp of the database
+    :type maxTS: int
+    :param first: the timestamp before the first transaction. The default is 0.
+    :type first: int
+    :return: maximum period
+    :rtype: int
+    """
+    return int(np.max(np.diff(np.asarray(timeStamps, dtype=np.int64), prepend=first, append=maxTS)))
+
+
+def periodicSupports(values: np.ndarray, offsets: np.ndarray, period: int, first: Optional[int] = None,
+                     last: Optional[int] = None) -> np.ndarray:
+    """
+    Computes the periodic support of many sorted arrays of timestamps, i.e., the number of periods that are not
+    longer than period. By default only the periods between consecutive timestamps are counted.
+
+    :param values: flat array of sorted timestamps
+    :type values: numpy.ndarray
+    :param offsets: offsets of every array in values
+    :type offsets: numpy.ndarray
+    :param period: the user specified period
+    :type period: int or float
+    :param first: if given, the period between first and the first timestamp is also counted
+    :type first: int
+    :param last: if given, the period between the last timestamp and last is also counted
+    :type last: int
+    :return: periodic support of every array
+    :rtype: numpy.ndarray
+    """
+    gaps, gapOffsets = _gaps(values, offsets, first, last)
+    return _reduce(np.add, (gaps <= period).astype(np.int64), gapOffsets, 0)
+
+
+def periodicSupport(timeStamps: Sequence[int], period: int, first: Optional[int] = None,
+                    last: Optional[int] = None) -> int:
+    """
+    Computes the periodic support of a sorted array of timestamps
+
+    :param timeStamps: sorted timestamps of a pattern
+    :type timeStamps: list or numpy.ndarray
+    :param period: the user specified period
+    :type period: int or float
+    :param first: if given, the period between first and the first timestamp is also counted
+    :type first: int
+    :param last: if given, the period between the last timestamp and last is also counted
+    :type last: int
+    :return: periodic support
+    :rtype: int
+    """
+    padding = {}
+    if first is not None:
+        padding['prepend'] = first
+    if last is not None:
+        padding['append'] = last
+    return int(np.count_nonzero(np.diff(np.asarray(timeStamps, dtype=np.int64), **padding) <= period))
+
+
+def labilities(values: np.ndarray, offsets: np.ndarray, maxPer: int, last: int, first: int = 0,
+               final: bool = False) -> np.ndarray:
+    """
+    Computes the lability of many sorted arrays of timestamps. The lability after a period p is
+    max(0, previous lability + p - maxPer), starting from 0. It is computed without a Python loop from the identity
+    lability_i = S_i - min(0, S_1, ..., S_i), where S_i is the running sum of (p - maxPer).
+
+    :param values: flat array of sorted timestamps
+    :type values: numpy.ndarray
+    :param offsets: offsets of every array in values
+    :type offsets: numpy.ndarray
+    :param maxPer: the user specified maximum period
+    :type maxPer: int or float
+    :param last: the last timestamp of the database
+    :type last: int
+    :param first: the timestamp before the first transaction. The default is 0.
+    :type first: int
+    :param final: return the lability after the last period instead of the maximum lability
+    :type final: bool
+    :return: maximum (or final) lability of every array
+    :rtype: numpy.ndarray
+    """
+    gaps, gapOffsets = _gaps(values, offsets, first, last)
+    excess = gaps - maxPer
+    count = len(gapOffsets) - 1
+    segment = np.repeat(np.arange(count, dtype=np.int64), np.diff(gapOffsets))
+    running = np.cumsum(excess)
+    # make the running sums restart at every array
+    starts = gapOffsets[:-1][np.diff(gapOffsets) > 0]
+    base = np.zeros(count, dtype=running.dtype)
+    nonEmpty = np.diff(gapOffsets) > 0
+    base[nonEmpty] = running[starts] - excess[starts]
+    running = running - base[segment]
+    # the running minimum of every array is obtained with one global accumulate by shifting every array below the
+    # previous ones
+    spread = int(np.max(np.abs(running))) * 2 + 1 if len(running) else 1
+    if spread * max(count, 1) < 2 ** 62:
+        shift = segment * spread
+        runningMin = np.minimum.accumulate(running - shift) + shift
+    else:
+        runningMin = np.concatenate([np.minimum.accumulate(running[a:b]) for a, b in
+                                     zip(gapOffsets[:-1], gapOffsets[1:]) if b > a] or [running])
+    lability = running - np.minimum(runningMin, 0)
+    if final:
+        result = np.zeros(count, dtype=lability.dtype)
+        result[nonEmpty] = lability[gapOffsets[1:][nonEmpty] - 1]
+        return result
+    return _reduce(np.maximum, lability, gapOffsets, 0)
+
+
+def lability(timeStamps: Sequence[int], maxPer: int, last: int, first: int = 0, final: bool = False) -> int:
+    """
+    Computes the lability of a sorted array of timestamps (see labilities)
+
+    :param timeStamps: sorted timestamps of a pattern
+    :type timeStamps: list or numpy.ndarray
+    :param maxPer: the user specified maximum period
+    :type maxPer: int or float
+    :param last: the last timestamp of the database
+    :type last: int
+    :param first: the timestamp before the first transaction. The default is 0.
+    :type first: int
+    :param final: return the lability after the last period instead of the maximum lability
+    :type final: bool
+    :return: maximum (or final) lability
+    :rtype: int
+    """
+    excess = np.diff(np.asarray(timeStamps, dtype=np.int64), prepend=first, append=last) - maxPer
+    running = np.cumsum(excess)
+    values = running - np.minimum(np.minimum.accumulate(running), 0)
+    return values[-1].item() if final else values.max().item()
+
+
+def periodicIntervals(timeStamps: Sequence[int], maxPer: int, minPS: int) -> Tuple[List[List[int]], int]:
+    """
+    Splits a sorted array of timestamps into its periodic intervals, i.e., the maximal runs of timestamps whose
+    consecutive periods are not longer than maxPer, and keeps the intervals with at least minPS timestamps.
+
+    :param timeStamps: sorted timestamps of a pattern
+    :type timeStamps: list or numpy.ndarray
+    :param maxPer: the user specified maximum period
+    :type maxPer: int or float
+    :param minPS: the minimum periodic support of an interval
+    :type minPS: int
+    :return: intervals as [start, end, periodic support] and the total periodic support of the kept intervals
+    :rtype: tuple
+    """
+    timeStamps = np.asarray(timeStamps, dtype=np.int64)
+    if len(timeStamps) == 0:
+        return [], 0
+    breaks = np.flatnonzero(np.diff(timeStamps) > maxPer) + 1
+    starts = np.concatenate(([0], breaks))
+    ends = np.concatenate((breaks, [len(timeStamps)]))
+    supports = ends - starts
+    keep = supports >= minPS
+    intervals = np.stack((timeStamps[starts[keep]], timeStamps[ends[keep] - 1], supports[keep]), axis=1)
+    return intervals.tolist(), int(supports[keep].sum())
+
+
+def localPeriodicIntervals(timeStamps: Sequence[int], maxPer: int, maxSoPer: int, minDur: int,
+                           tsMax: int) -> Set[Tuple[int, int]]:
+    """
+    Computes the time-intervals in which a sorted array of timestamps is locally periodic. An interval starts at the
+    first period not longer than maxPer and ends as soon as the spill-over period, i.e., the lability starting from
+    maxSoPer, exceeds maxSoPer. Intervals shorter than minDur are discarded.
+
+    The spill-over period of an interval is evaluated on windows of doubling size with the same identity as
+    labilities, so the cost is linear in the number of timestamps.
+
+    :param timeStamps: sorted timestamps of a pattern
+    :type timeStamps: list or numpy.ndarray
+    :param maxPer: the user specified maximum period
+    :type maxPer: int or float
+    :param maxSoPer: the user specified maximum spill-over period
+    :type maxSoPer: int or float
+    :param minDur: the user specified minimum duration of an interval
+    :type minDur: int or float
+    :param tsMax: the last timestamp of the database
+    :type tsMax: int
+    :return: set of intervals as (start, end)
+    :rtype: set
+    """
+    timeStamps = np.asarray(timeStamps, dtype=np.int64)
+    intervals = set()
+    if len(timeStamps) < 2:
+        return intervals
+    gaps = np.diff(timeStamps)
+    n = len(gaps)
+    position = 0
+    while position < n:
+        periodic = np.flatnonzero(gaps[position:] <= maxPer)
+        if len(periodic) == 0:
+            break
+        begin = position + int(periodic[0])
+        start = int(timeStamps[begin])
+        soPer = maxSoPer
+        window = 64
+        index = begin
+        end = -1
+        while index < n:
+            stop = min(n, index + window)
+            running = np.cumsum(gaps[index:stop] - maxPer)
+            values = running - np.minimum(np.minimum.accumulate(running), -soPer)
+            exceeded = np.flatnonzero(values > maxSoPer)
+            if len(exceeded):
+                end = index + int(exceeded[0])
+                break
+            soPer = values[-1].item()
+            index = stop
+            window *= 2
+        if end >= 0:
+            if timeStamps[end] - start >= minDur:
+                intervals.add((start, int(timeStamps[end])))
+            position = end + 1
+            continue
+        tsPre = int(timeStamps[-1])
+        soPer = max(0, soPer + tsMax - tsPre - maxPer)
+        if soPer > maxSoPer and tsPre - start >= minDur:
+            intervals.add((start, tsPre))
+        if soPer <= maxSoPer and tsMax - start >= minDur:
+            intervals.add((start, tsMax))
+        break
+    return intervals
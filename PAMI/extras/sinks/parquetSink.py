@@ -0,0 +1,184 @@
+# parquetSink writes the patterns of a miner to a Parquet file in columns: the items of every pattern as a list
+# column of strings (dictionary-encoded by Parquet) followed by one float64 column per value, e.g., Support and
+# Periodicity. The types do not depend on the patterns, so every row group has the same columns. The patterns
+# are written in row groups of batchSize patterns while they are mined, and the file can be read back by pandas, Spark
+# or any other Arrow reader without parsing text. It requires pyarrow (pip install pami[parquet]).
+#
+# **Importing this module into a python program**
+#
+#             from PAMI.extras.sinks import parquetSink
+#
+#             from PAMI.periodicFrequentPattern.basic import PFPGrowth as alg
+#
+#             obj = alg.PFPGrowth('sampleTDB.txt', 10, 20)
+#
+#             obj.setPatternSink(parquetSink.ParquetSink('patterns.parquet'))   # columns Patterns, Support, Periodicity
+#
+#             obj.mine()
+#
+#             df = parquetSink.readPatterns('patterns.parquet')
+#
+#             # the patterns of any other miner can be exported once they are mined
+#
+#             parquetSink.savePatterns(otherObj.getPatterns(), 'other.parquet', columns=['Utility'])
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from typing import Any, Dict, List, Optional
+import numbers as _numbers
+import pandas as _pd
+from PAMI.extras.sinks import patternSinks as _patternSinks
+
+try:
+    import pyarrow as _pa
+    import pyarrow.parquet as _pq
+except ImportError:
+    _pa = _pq = None
+
+_defaultColumns = {1: ['Support'], 2: ['Support', 'Periodicity']}
+
+
+def _requirePyarrow() -> None:
+    if _pa is None:
+        raise ImportError("Parquet export requires pyarrow. Install it with: pip install pami[parquet]")
+
+
+class ParquetSink(_patternSinks.PatternSink):
+    """
+    Writes the patterns to a Parquet file in row groups of batchSize patterns. At most batchSize patterns are kept
+    in memory. The items are written as strings and the values as float64; a value that is not a number, or an
+    integer too large for float64, raises an error instead of being converted.
+
+    :param oFile: name of the output file
+    :type oFile: str
+    :param columns: names of the value columns. By default, a single value is named Support and a pair of values
+        Support and Periodicity; other values are named Value1, Value2, ...
+    :type columns: list
+    :param sep: separator of the items of patterns given as strings. By default, they are split at white space.
+    :type sep: str
+    :param batchSize: number of patterns of a row group
+    :type batchSize: int
+    """
+
+    def __init__(self, oFile: str, columns: Optional[List[str]] = None, sep: Optional[str] = None,
+                 batchSize: int = 65536) -> None:
+        _requirePyarrow()
+        super().__init__()
+        if batchSize < 1:
+            raise ValueError("batchSize must be at least 1")
+        self._oFile = oFile
+        self._columns = list(columns) if columns is not None else None
+        self._sep = sep
+        self._batchSize = batchSize
+        self._items = []
+        self._values = []
+        self._schema = None
+        self._writer = None
+
+    def _add(self, pattern: Any, value: Any) -> None:
+        if isinstance(pattern, str):
+            pattern = pattern.split(self._sep)
+        value = list(value) if isinstance(value, (list, tuple)) else [value]
+        if self._columns is None:
+            self._columns = _defaultColumns.get(len(value), ['Value' + str(i + 1) for i in range(len(value))])
+        if len(value) != len(self._columns):
+            raise ValueError("Pattern " + str(pattern) + " has " + str(len(value)) + " values, but the columns are "
+                             + str(self._columns))
+        for x in value:
+            if not isinstance(x, _numbers.Real):
+                raise TypeError("Value " + repr(x) + " of pattern " + str(pattern) + " is not a number")
+            if isinstance(x, _numbers.Integral) and int(float(x)) != x:
+                raise ValueError("Value " + str(x) + " of pattern " + str(pattern) + " cannot be stored as float64 "
+                                 "without loss")
+        self._items.append([str(item) for item in pattern])
+        self._values.append(value)
+        if len(self._items) >= self._batchSize:
+            self._writeBatch()
+
+    def _createSchema(self) -> None:
+        """
+        Fixes the columns of the file: the items are stored as strings and the values as float64, so that no batch
+        has to be narrowed to the types of an earlier one
+        """
+        if self._columns is None:
+            self._columns = ['Support']
+        fields = [_pa.field('Patterns', _pa.list_(_pa.string()))]
+        fields += [_pa.field(name, _pa.float64()) for name in self._columns]
+        self._schema = _pa.schema(fields)
+        self._writer = _pq.ParquetWriter(self._oFile, self._schema)
+
+    def _writeBatch(self) -> None:
+        if self._schema is None:
+            self._createSchema()
+        arrays = [_pa.array(self._items, type=self._schema.field(0).type)]
+        for i in range(len(self._columns)):
+            arrays.append(_pa.array([float(v[i]) for v in self._values], type=self._schema.field(i + 1).type))
+        table = _pa.Table.from_arrays(arrays, names=self._schema.names)
+        if not table.schema.equals(self._schema):
+            raise TypeError("Batch with columns " + str(table.schema) + " does not match the file " + str(self._schema))
+        self._writer.write_table(table)
+        self._items = []
+        self._values = []
+
+    def close(self) -> None:
+        if self._items:
+            self._writeBatch()
+        if self._writer is None:
+            # no pattern was mined; an empty file still has the columns
+            self._createSchema()
+        self._writer.close()
+
+
+def savePatterns(patterns: Dict[Any, Any], oFile: str, columns: Optional[List[str]] = None, sep: Optional[str] = None,
+                 batchSize: int = 65536) -> int:
+    """
+    Writes the patterns returned by getPatterns() of any algorithm to a Parquet file
+
+    :param patterns: the patterns with their values
+    :type patterns: dict
+    :param oFile: name of the output file
+    :type oFile: str
+    :param columns: names of the value columns, see ParquetSink
+    :type columns: list
+    :param sep: separator of the items of patterns given as strings
+    :type sep: str
+    :param batchSize: number of patterns of a row group
+    :type batchSize: int
+    :return: number of patterns written
+    :rtype: int
+    """
+    sink = ParquetSink(oFile, columns, sep, batchSize)
+    for pattern, value in patterns.items():
+        sink.add(pattern, value)
+    sink.close()
+    return len(sink)
+
+
+def readPatterns(iFile: str) -> '_pd.DataFrame':
+    """
+    Reads a file written by ParquetSink or savePatterns()
+
+    :param iFile: name of the Parquet file
+    :type iFile: str
+    :return: a data frame with a column of item lists and the value columns
+    :rtype: pd.DataFrame
+    """
+    _requirePyarrow()
+    return _pq.read_table(iFile).to_pandas()
@@ -0,0 +1,219 @@
+# patternSinks receive the patterns of a miner while it is mining, so that the patterns do not have to be kept in
+# memory until save() is called. A sink is attached to a miner with setPatternSink() before mine() is called.
+# Apriori, FPGrowth, ECLATbitset and PFPGrowth write their patterns to sinks; the setPatternSink() of the other miners
+# raises NotImplementedError.
+#
+# **Importing this module into a python program**
+#
+#             from PAMI.extras.sinks import patternSinks
+#
+#             from PAMI.frequentPattern.basic import FPGrowth as alg
+#
+#             obj = alg.FPGrowth('sampleDB.txt', 10)
+#
+#             obj.setPatternSink(patternSinks.FileSink('patterns.txt'))   # patterns are written while mining
+#
+#             obj.mine()
+#
+#             obj.setPatternSink(patternSinks.BufferedSink(print, capacity=1000))   # batches of 1000 patterns
+#
+#             obj.mine()
+#
+#             obj.setPatternSink(None)    # back to the in-memory patterns of getPatterns()
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from abc import ABC as _ABC, abstractmethod as _abstractmethod
+from typing import Any, Callable, Dict, List, Tuple
+
+
+class PatternSink(_ABC):
+    """
+    Base class of the sinks. A miner passes every pattern with its value (support, or a list such as
+    [support, periodicity]) to add(), and calls close() once mining has finished.
+
+    A sink can also be used like the dictionary of finalPatterns, i.e., sink[pattern] = value calls add().
+    """
+
+    def __init__(self) -> None:
+        self._count = 0
+
+    @_abstractmethod
+    def _add(self, pattern: Any, value: Any) -> None:
+        """
+        Stores or forwards one pattern
+        """
+
+        pass
+
+    def add(self, pattern: Any, value: Any) -> None:
+        """
+        Receives one pattern from the miner
+
+        :param pattern: the pattern, as a tuple of items or a string
+        :type pattern: tuple or str
+        :param value: the value of the pattern, e.g., its support
+        :type value: int or float or list
+        :return: None
+        """
+        self._count += 1
+        self._add(pattern, value)
+
+    def __setitem__(self, pattern: Any, value: Any) -> None:
+        self.add(pattern, value)
+
+    def __len__(self) -> int:
+        """
+        :return: number of patterns received by the sink
+        :rtype: int
+        """
+        return self._count
+
+    def close(self) -> None:
+        """
+        Flushes the patterns that are still buffered. Miners call close() at the end of mine().
+
+        :return: None
+        """
+        pass
+
+    def mapped(self, function: Callable[[Any], Any]) -> 'PatternSink':
+        """
+        Returns a view of the sink which converts every pattern with function before passing it on, e.g., to decode
+        the integer item ids used internally by a miner into item names.
+
+        :param function: converts a pattern
+        :type function: function
+        :return: the view of the sink
+        :rtype: PatternSink
+        """
+        return _MappedSink(self, function)
+
+
+class _MappedSink(PatternSink):
+    """
+    View of a sink converting every pattern before passing it on
+    """
+
+    def __init__(self, sink: PatternSink, function: Callable[[Any], Any]) -> None:
+        super().__init__()
+        self._sink = sink
+        self._function = function
+
+    def _add(self, pattern: Any, value: Any) -> None:
+        self._sink.add(self._function(pattern), value)
+
+    def close(self) -> None:
+        self._sink.close()
+
+
+class MemorySink(PatternSink):
+    """
+    Keeps the patterns in a dictionary. This is what miners do when no sink is set.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._patterns = {}
+
+    def _add(self, pattern: Any, value: Any) -> None:
+        self._patterns[pattern] = value
+
+    def getPatterns(self) -> Dict[Any, Any]:
+        """
+        :return: the patterns received by the sink
+        :rtype: dict
+        """
+        return self._patterns
+
+
+class FileSink(PatternSink):
+    """
+    Writes every pattern to a file in the format of save(), i.e., the items separated by sep followed by the value(s)
+    separated by ':'.
+
+    :param oFile: name of the output file. The file is created when the sink is created.
+    :type oFile: str
+    :param sep: separator of the items of a pattern. The default separator is tab space.
+    :type sep: str
+    """
+
+    def __init__(self, oFile: str, sep: str = '\t') -> None:
+        super().__init__()
+        self._sep = sep
+        self._writer = open(oFile, 'w', encoding='utf-8')
+
+    def _add(self, pattern: Any, value: Any) -> None:
+        if not isinstance(pattern, str):
+            pattern = self._sep.join(str(item) for item in pattern)
+        if isinstance(value, (list, tuple)):
+            value = ":".join(str(x) for x in value)
+        self._writer.write(pattern + ":" + str(value) + "\n")
+
+    def close(self) -> None:
+        if not self._writer.closed:
+            self._writer.close()
+
+
+class CallbackSink(PatternSink):
+    """
+    Calls a function for every pattern
+
+    :param callback: function called as callback(pattern, value)
+    :type callback: function
+    """
+
+    def __init__(self, callback: Callable[[Any, Any], None]) -> None:
+        super().__init__()
+        self._callback = callback
+
+    def _add(self, pattern: Any, value: Any) -> None:
+        self._callback(pattern, value)
+
+
+class BufferedSink(PatternSink):
+    """
+    Collects the patterns in a buffer of bounded size and hands every full buffer to a function, e.g., to insert the
+    patterns into a database in batches. At most capacity patterns are kept in memory.
+
+    :param flush: function called with a list of (pattern, value) pairs
+    :type flush: function
+    :param capacity: maximum number of patterns in the buffer
+    :type capacity: int
+    """
+
+    def __init__(self, flush: Callable[[List[Tuple[Any, Any]]], None], capacity: int = 100000) -> None:
+        super().__init__()
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self._flush = flush
+        self._capacity = capacity
+        self._buffer = []
+
+    def _add(self, pattern: Any, value: Any) -> None:
+        self._buffer.append((pattern, value))
+        if len(self._buffer) >= self._capacity:
+            self._flush(self._buffer)
+            self._buffer = []
+
+    def close(self) -> None:
+        if self._buffer:
+            self._flush(self._buffer)
+            self._buffer = []
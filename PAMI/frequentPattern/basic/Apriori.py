@@ -140,6 +140,7 @@ class Apriori(_ab._frequentPatterns):
     _startTime = float()
     _endTime = float()
     _finalPatterns = {}
+    _supportsPatternSink = True
     _iFile = " "
     _oFile = " "
     _sep = " "
@@ -243,11 +244,12 @@ class Apriori(_ab._frequentPatterns):
 
         cands = []
         fileData = {}
+        sink = self._openPatternSink()
         for key in items:
             if len(items[key]) >= self._minSup:
                 cands.append(key)
                 # self._finalPatterns["\t".join(key)] = len(items[key])
-                self._finalPatterns[key] = len(items[key])
+                sink[key] = len(items[key])
                 fileData[key] = set(items[key])
             else:
                 break
@@ -264,7 +266,7 @@ class Apriori(_ab._frequentPatterns):
                                 intersection = intersection.intersection(fileData[tuple([newCand[k]])])
                             if len(intersection) >= self._minSup:
                                 newKeys.append(newCand)
-                                self._finalPatterns[newCand] = len(intersection)
+                                sink[newCand] = len(intersection)
                 del cands
                 cands = newKeys
                 del newKeys
@@ -281,12 +283,12 @@ class Apriori(_ab._frequentPatterns):
                                 # intersection = intersection.intersection(fileData[tuple([newCand[k]])])
                             if len(intersection) >= self._minSup:
                                 newKeys.append(newCand)
-                                self._finalPatterns[newCand] = len(intersection)
+                                sink[newCand] = len(intersection)
                                 fileData[newCand] = intersection
                 del cands
                 cands = newKeys
                 del newKeys
-        
+        self._closePatternSink(sink)
 
         process = _ab._psutil.Process(_ab._os.getpid())
         self._endTime = _ab._time.time()
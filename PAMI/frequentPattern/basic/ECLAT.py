@@ -18,6 +18,14 @@
 #
 #             obj.save(oFile)
 #
+#             obj = alg.ECLAT(iFile, minSup)
+#
+#             obj.mine(incremental=True)    # keeps the tid-lists for update()
+#
+#             obj.update('appendedDB.txt')    # mines only the patterns of the appended transactions
+#
+#             obj.saveState('state.pkl')    # a later run continues with loadState('state.pkl') and update()
+#
 #             Df = obj.getPatternInDataFrame()
 #
 #             memUSS = obj.getMemoryUSS()
@@ -53,6 +61,8 @@ Copyright (C)  2021 Rage Uday Kiran
 
 from PAMI.frequentPattern.basic import abstract as _ab
 from deprecated import deprecated
+import math as _math
+import pickle as _pickle
 
 class ECLAT(_ab._frequentPatterns):
     """
@@ -144,44 +154,56 @@ class ECLAT(_ab._frequentPatterns):
     _memoryRSS = float()
     _Database = []
 
-    def _creatingItemSets(self) -> float:
+    def _readTransactions(self, iFile) -> list:
         """
 
-        Storing the complete transactions of the database/input file in a database variable
+        Reads the transactions of a file, URL, dataframe or list of transactions
 
-        :return: the complete transactions of the database/input file in a database variable
-        :rtype: float
+        :param iFile: the transactions
+        :type iFile: str or DataFrame or list
+        :return: the transactions, each as a list of items
+        :rtype: list
         """
-        self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
-            if self._iFile.empty:
+        database = []
+        if isinstance(iFile, _ab._pd.DataFrame):
+            if iFile.empty:
                 print("its empty..")
-            i = self._iFile.columns.values.tolist()
+            i = iFile.columns.values.tolist()
             if 'Transactions' in i:
-                self._Database = self._iFile['Transactions'].tolist()
-                self._Database = [x.split(self._sep) for x in self._Database]
+                database = iFile['Transactions'].tolist()
+                database = [x.split(self._sep) for x in database]
             else:
                 print("The column name should be Transactions and each line should be separated by tab space or a seperator specified by the user")
-        if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
-                data = _ab._urlopen(self._iFile)
+        if isinstance(iFile, list):
+            database = [[x for x in line if x] for line in iFile]
+        if isinstance(iFile, str):
+            if _ab._validators.url(iFile):
+                data = _ab._urlopen(iFile)
                 for line in data:
                     line.strip()
                     line = line.decode("utf-8")
                     temp = [i.rstrip() for i in line.split(self._sep)]
                     temp = [x for x in temp if x]
-                    self._Database.append(temp)
+                    database.append(temp)
             else:
                 try:
-                    with open(self._iFile, 'r', encoding='utf-8') as f:
+                    with open(iFile, 'r', encoding='utf-8') as f:
                         for line in f:
                             line.strip()
                             temp = [i.rstrip() for i in line.split(self._sep)]
                             temp = [x for x in temp if x]
-                            self._Database.append(temp)
+                            database.append(temp)
                 except IOError:
                     print("File Not Found")
                     quit()
+        return database
+
+    def _creatingItemSets(self) -> None:
+        """
+
+        Storing the complete transactions of the database/input file in a database variable
+        """
+        self._Database = self._readTransactions(self._iFile)
 
     def _convert(self, value) -> float:
         """
@@ -251,9 +273,17 @@ class ECLAT(_ab._frequentPatterns):
                 if len(newCands) > 1:
                     self.__recursive(items, newCands, memorySaver)
 
-    def mine(self, memorySaver = True) -> None:
+    def mine(self, memorySaver = True, incremental = False) -> None:
         """
         Frequent pattern mining process will start from here
+
+        :param memorySaver: rebuild the tid-list of a candidate from the tid-lists of its items instead of keeping the
+                            tid-lists of the whole search path
+        :type memorySaver: bool
+        :param incremental: keep the tid-lists of all the items after mining, so that transactions appended later can
+                            be mined with update() instead of mining the whole database again
+        :type incremental: bool
+        :return: None
         """
 
         self._startTime = _ab._time.time()
@@ -263,6 +293,7 @@ class ECLAT(_ab._frequentPatterns):
             raise Exception("Please enter the Minimum Support")
         self._creatingItemSets()
 
+        self._minSupValue = self._minSup
         self._minSup = self._convert(self._minSup)
 
     
@@ -274,7 +305,12 @@ class ECLAT(_ab._frequentPatterns):
                     items[item] = []
                 items[item].append(index)
             index += 1
-        
+        if incremental:
+            self._tidLists = {k: set(v) for k, v in items.items()}
+            self._dbSize = len(self._Database)
+        else:
+            self._tidLists = None
+
         items = {tuple([k]): set(v) for k, v in items.items() if len(v) >= self._minSup}
         items = {k: v for k, v in sorted(items.items(), key=lambda item: len(item[1]), reverse=False)}
         for k, v in items.items():
@@ -293,6 +329,146 @@ class ECLAT(_ab._frequentPatterns):
         self._memoryRSS = process.memory_info().rss
         print("Frequent patterns were generated successfully using ECLAT algorithm")
 
+    def _deltaExtensions(self, prefix, cands, tidLists, supports, bound, minSup, patterns):
+        """
+
+        Mines the frequent patterns that occur in the appended transactions. A candidate is extended only while it
+        occurs in an appended transaction, so the search is bounded by the appended transactions. The support of a
+        candidate that was frequent before is its previous support plus its support in the appended transactions. The
+        previous support of the other candidates is at most bound, so the tid-lists of the whole database are
+        intersected only for the candidates that may reach minSup.
+
+        :param prefix: the items of the prefix of the equivalence class
+        :type prefix: tuple
+        :param cands: the items extending the prefix, with the tids of the appended transactions of every extension
+        :type cands: list
+        :param tidLists: tid-lists of the items in the whole database
+        :type tidLists: dict
+        :param supports: previous support of every frequent pattern
+        :type supports: dict
+        :param bound: largest previous support of a pattern that was not frequent before
+        :type bound: int or float
+        :param minSup: minimum support count of the whole database
+        :type minSup: int or float
+        :param patterns: receives the support of every frequent pattern found
+        :type patterns: dict
+        :return: None
+        """
+        for i in range(len(cands)):
+            item, tids = cands[i]
+            pattern = prefix + (item,)
+            newCands = []
+            for other, otherTids in cands[i + 1:]:
+                delta = tids & otherTids
+                if not delta:
+                    continue
+                newPattern = pattern + (other,)
+                support = supports.get(frozenset(newPattern))
+                if support is not None:
+                    support += len(delta)
+                elif bound + len(delta) < minSup:
+                    continue
+                else:
+                    lists = sorted((tidLists[x] for x in newPattern), key=len)
+                    support = len(lists[0].intersection(*lists[1:]))
+                if support >= minSup:
+                    patterns[newPattern] = support
+                    newCands.append((other, delta))
+            if len(newCands) > 0:
+                self._deltaExtensions(pattern, newCands, tidLists, supports, bound, minSup, patterns)
+
+    def update(self, transactions) -> None:
+        """
+        Updates the frequent patterns with transactions appended to the database, following FUP: a pattern that does
+        not occur in the appended transactions keeps its support, so only the patterns occurring in them are mined,
+        including those of the items that become frequent. The items of the appended transactions are added to the
+        tid-lists kept by mine(incremental=True) or loadState(). A minSup expressed in proportion is applied to the
+        size of the whole database.
+
+        :param transactions: the appended transactions, as a file, URL, dataframe or list of transactions
+        :type transactions: str or DataFrame or list
+        :return: None
+        """
+        if getattr(self, '_tidLists', None) is None:
+            raise Exception("Please call mine(incremental=True) or loadState() before update()")
+        self._startTime = _ab._time.time()
+        delta = self._readTransactions(transactions)
+        deltaTids = {}
+        for tid, line in enumerate(delta, self._dbSize):
+            for item in line:
+                deltaTids.setdefault(item, set()).add(tid)
+        for item, tids in deltaTids.items():
+            self._tidLists.setdefault(item, set()).update(tids)
+        self._dbSize += len(delta)
+        bound = _math.ceil(self._minSup) - 1
+        if self._isProportion(self._minSupValue):
+            minSup = self._dbSize * float(self._minSupValue)
+        else:
+            minSup = int(self._minSupValue)
+        self._minSup = minSup
+
+        supports = {frozenset(pattern): support for pattern, support in self._finalPatterns.items()}
+        patterns = {}
+        cands = [(item, tids) for item, tids in deltaTids.items() if len(self._tidLists[item]) >= minSup]
+        cands.sort(key=lambda x: len(self._tidLists[x[0]]))
+        for item, tids in cands:
+            patterns[(item,)] = len(self._tidLists[item])
+        self._deltaExtensions((), cands, self._tidLists, supports, bound, minSup, patterns)
+
+        updated = {frozenset(pattern) for pattern in patterns}
+        finalPatterns = {}
+        for pattern, support in self._finalPatterns.items():
+            key = frozenset(pattern)
+            if key in updated or support < minSup:
+                continue
+            if all(x in deltaTids for x in pattern):
+                lists = sorted((deltaTids[x] for x in pattern), key=len)
+                if lists[0].intersection(*lists[1:]):
+                    continue
+            finalPatterns[pattern] = support
+        finalPatterns.update(patterns)
+        self._finalPatterns = finalPatterns
+
+        self._endTime = _ab._time.time()
+        process = _ab._psutil.Process(_ab._os.getpid())
+        self._memoryUSS = process.memory_full_info().uss
+        self._memoryRSS = process.memory_info().rss
+
+    def saveState(self, stateFile: str) -> None:
+        """
+        Stores the tid-lists and the frequent patterns kept for update() in a file, so that a later run can continue
+        with loadState() and update() instead of mining the whole database again
+
+        :param stateFile: name of the state file
+        :type stateFile: str
+        :return: None
+        """
+        if getattr(self, '_tidLists', None) is None:
+            raise Exception("Please call mine(incremental=True) before saveState()")
+        with open(stateFile, 'wb') as f:
+            _pickle.dump({'minSup': self._minSupValue, 'minSupCount': self._minSup, 'dbSize': self._dbSize, 'tidLists': self._tidLists,
+                          'patterns': self._finalPatterns}, f, protocol=_pickle.HIGHEST_PROTOCOL)
+
+    def loadState(self, stateFile: str) -> None:
+        """
+        Restores the tid-lists and the frequent patterns stored by saveState()
+
+        :param stateFile: name of the state file
+        :type stateFile: str
+        :return: None
+        """
+        try:
+            with open(stateFile, 'rb') as f:
+                state = _pickle.load(f)
+        except IOError:
+            print("File Not Found")
+            quit()
+        self._minSupValue = state['minSup']
+        self._minSup = state['minSupCount']
+        self._dbSize = state['dbSize']
+        self._tidLists = state['tidLists']
+        self._finalPatterns = state['patterns']
+
     def getMemoryUSS(self) -> float:
         """
 
@@ -53,6 +53,24 @@ Copyright (C)  2021 Rage Uday Kiran
 
 from PAMI.frequentPattern.basic import abstract as _ab
 from deprecated import deprecated
+import numpy as np
+
+
+def _popcount(bitsets):
+    """
+    Counts the set bits of every row of a matrix of uint64 words
+
+    :param bitsets: matrix of bitsets
+    :type bitsets: numpy.ndarray
+    :return: number of set bits of every row
+    :rtype: numpy.ndarray
+    """
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(bitsets).sum(axis=-1, dtype=np.int64)
+    return _bitCounts[bitsets.view(np.uint8)].sum(axis=-1, dtype=np.int64)
+
+
+_bitCounts = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
 
 
 class ECLATbitset(_ab._frequentPatterns):
@@ -74,7 +92,7 @@ class ECLATbitset(_ab._frequentPatterns):
                         - **finalPatterns** (*dict*) -- *Storing the complete set of patterns in a dictionary variable.*
                         - **memoryUSS** (*float*) -- *To store the total amount of USS memory consumed by the program.*
                         - **memoryRSS** *(float*) -- *To store the total amount of RSS memory consumed by the program.*
-                        - **Database** (*list*) -- *To store the transactions of a database in list.*
+                        - **Database** (*CompactDatabase*) -- *To store the transactions of a database as integer-encoded arrays.*
 
     **Execution methods**
 
@@ -136,6 +154,7 @@ class ECLATbitset(_ab._frequentPatterns):
     _startTime = float()
     _endTime = float()
     _finalPatterns = {}
+    _supportsPatternSink = True
     _iFile = " "
     _oFile = " "
     _sep = " "
@@ -145,6 +164,10 @@ class ECLATbitset(_ab._frequentPatterns):
     _Database = []
     _mapSupport = {}
     _lno = 0
+    _items = None
+    _names = []
+    _minSupCount = 0
+    _sink = None
 
     def _convert(self, value):
         """
@@ -170,40 +193,13 @@ class ECLATbitset(_ab._frequentPatterns):
 
     def _creatingItemSets(self):
         """
-        Storing the complete transactions of the database/input file in a database variable
+        Storing the complete transactions of the database/input file in a compact, integer-encoded database variable
         """
-        self._Database = []
-        self._mapSupport = {}
-        if isinstance(self._iFile, _ab._pd.DataFrame):
-            if self._iFile.empty:
-                print("its empty..")
-            i = self._iFile.columns.values.tolist()
-            if 'Transactions' in i:
-                self._Database = self._iFile['Transactions'].tolist()
-                self._Database = [x.split(self._sep) for x in self._Database]
-            else:
-                print("The column name should be Transactions and each line should be separated by tab space or a seperator specified by the user")
-
-        if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
-                data = _ab._urlopen(self._iFile)
-                for line in data:
-                    line.strip()
-                    line = line.decode("utf-8")
-                    temp = [i.rstrip() for i in line.split(self._sep)]
-                    temp = [x for x in temp if x]
-                    self._Database.append(temp)
-            else:
-                try:
-                    with open(self._iFile, 'r') as f:
-                        for line in f:
-                            self._lno += 1
-                            splitter = [i.rstrip() for i in line.split(self._sep)]
-                            splitter = [x for x in splitter if x]
-                            self._Database.append(splitter)
-                except IOError:
-                    print("File Not Found")
-        self._minSup = self._convert(self._minSup)
+        try:
+            self._Database = _ab._compactDatabase.load(self._iFile, self._sep)
+        except IOError:
+            print("File Not Found")
+            quit()
 
     @deprecated("It is recommended to use 'mine()' instead of 'startMine()' for mining process. Starting from January 2025, 'startMine()' will be completely terminated.")
     def startMine(self):
@@ -215,97 +211,111 @@ class ECLATbitset(_ab._frequentPatterns):
         """
         self.mine()
 
-    def _bitPacker(self, data, maxIndex):
+    def _bitsets(self, itemIds):
         """
 
-        It takes the data and maxIndex as input and generates integer as output value.
+        Packs the tid-lists of the given items into a matrix of uint64 words, where bit (tid % 64) of word (tid // 64)
+        of a row is set if the item occurs in transaction tid.
 
-        :param data: it takes data as input.
-        :type data: int or float
-        :param maxIndex: It converts the data into bits By taking the maxIndex value as condition.
-        :type maxIndex: int
+        :param itemIds: ids of the items to be packed. Row k of the matrix belongs to itemIds[k].
+        :type itemIds: numpy.ndarray
+        :return: matrix of bitsets
+        :rtype: numpy.ndarray
         """
-        packed_bits = 0
-        for i in data:
-            packed_bits |= 1 << (maxIndex - i)
-
-        return packed_bits
-    
-    def __recursive(self, items, cands, memorySaver):
+        words = (len(self._Database) + 63) // 64
+        rows = np.full(self._Database.getItemCount(), -1, dtype=np.int64)
+        rows[itemIds] = np.arange(len(itemIds))
+        items = self._Database.items
+        tids = self._Database.getTransactionIds()
+        keep = rows[items] >= 0
+        items, tids = rows[items[keep]], tids[keep]
+        bitsets = np.zeros((len(itemIds), words), dtype=np.uint64)
+        np.bitwise_or.at(bitsets, (items, tids >> 6), np.left_shift(np.uint64(1), (tids & 63).astype(np.uint64)))
+        return bitsets
+
+    def __recursive(self, prefix, ids, cols, rows, prefixRow, budget):
         """
 
-        This function generates new candidates by taking input as original candidates.
-
-        :param items: A dictionary containing items and their corresponding support values.
-        :type items: dict
-        :param cands: A list of candidate itemsets.
-        :type cands: list
+        Extends the prefix with every item of its equivalence class. The bitsets of the class are either kept in rows,
+        i.e., the intersections computed for the parent are reused, or rebuilt on demand from the item bitsets and
+        prefixRow. Only the words that are non-zero in the prefix bitset (cols) are stored, so the bitsets shrink as
+        the patterns grow.
+
+        :param prefix: rows of the items of the prefix
+        :type prefix: list
+        :param ids: rows of the items of the equivalence class
+        :type ids: numpy.ndarray
+        :param cols: indices of the words kept for this class
+        :type cols: numpy.ndarray
+        :param rows: bitsets of prefix + [ids[k]] restricted to cols, or None
+        :type rows: numpy.ndarray
+        :param prefixRow: bitset of the prefix restricted to cols, used when rows is None
+        :type prefixRow: numpy.ndarray
+        :param budget: number of bytes that may still be kept for the bitsets of the descendants
+        :type budget: int or float
         :return: None
         """
+        for i in range(len(ids) - 1):
+            if rows is not None:
+                row = rows[i]
+                others = rows[i + 1:]
+            else:
+                row = self._items[ids[i], cols] & prefixRow
+                others = self._items[np.ix_(ids[i + 1:], cols)] & prefixRow
+            intersections = others & row
+            counts = _popcount(intersections)
+            keep = np.flatnonzero(counts >= self._minSupCount)
+            if len(keep) == 0:
+                continue
+            newPrefix = prefix + [ids[i]]
+            names = tuple(self._names[x] for x in newPrefix)
+            for k, count in zip(ids[i + 1:][keep].tolist(), counts[keep].tolist()):
+                self._sink[names + (self._names[k],)] = count
+            if len(keep) < 2:
+                continue
+            nonZero = np.flatnonzero(row)
+            size = len(keep) * len(nonZero) * 8
+            if size <= budget:
+                self.__recursive(newPrefix, ids[i + 1:][keep], cols[nonZero], intersections[keep][:, nonZero], None,
+                                 budget - size)
+            else:
+                self.__recursive(newPrefix, ids[i + 1:][keep], cols[nonZero], None, row[nonZero], budget)
 
-        if memorySaver:
-            for i in range(len(cands)):
-                newCands = []
-                for j in range(i + 1, len(cands)):
-                    newCand = tuple(cands[i] + tuple([cands[j][-1]]))
-                    intersection = items[tuple([newCand[0]])]
-                    for k in newCand[1:]:
-                        intersection &= items[tuple([k])]
-                    count = int.bit_count(intersection)
-                    if count >= self._minSup:
-                        newCands.append(newCand)
-                        self._finalPatterns[newCand] = count
-                if len(newCands) > 1:
-                    self.__recursive(items, newCands, memorySaver)
-        else:
-            for i in range(len(cands)):
-                newCands = []
-                for j in range(i + 1, len(cands)):
-                    newCand = tuple(cands[i] + tuple([cands[j][-1]]))
-                    intersection = items[cands[i]] & items[cands[j]]
-                    count = int.bit_count(intersection)
-                    if count >= self._minSup:
-                        newCands.append(newCand)
-                        self._finalPatterns[newCand] = count
-                        items[newCand] = intersection
-                if len(newCands) > 1:
-                    self.__recursive(items, newCands, memorySaver)
-
-    def mine(self, memorySaver = True) -> None:
+    def mine(self, memorySaver = True, memoryBudget = 256 * 1024 * 1024) -> None:
         """
         Frequent pattern mining process will start from here
         # Bitset implementation
+
+        :param memorySaver: bound the memory used for the intersections that are reused along the search by memoryBudget.
+                            If False, all the intersections of the current search path are kept.
+        :type memorySaver: bool
+        :param memoryBudget: number of bytes available for the reused intersections when memorySaver is True
+        :type memoryBudget: int
+        :return: None
         """
         self._startTime = _ab._time.time()
-
-        self._Database = []
+        self._finalPatterns = {}
 
         self._creatingItemSets()
-
-        items = {}
-        index = 0
-        for line in self._Database:
-            for item in line:
-                if tuple([item]) in items:
-                    items[tuple([item])].append(index)
-                else:
-                    items[tuple([item])] = [index]
-            index += 1
-
-        # sort by length in descending order
-        items = dict(sorted(items.items(), key=lambda x: len(x[1]), reverse=True))
-        cands = []
-        for key in list(items.keys()):
-            if len(items[key]) >= self._minSup:
-                self._finalPatterns["\t".join(key)] = len(items[key])
-                cands.append(key)
-                items[key] = self._bitPacker(items[key], index)
-            else:
-                break
-
-
-        self.__recursive(items, cands, memorySaver)
-        
+        self._minSupCount = self._convert(self._minSup)
+
+        supports = self._Database.getItemSupports()
+        # items are extended in support ascending order, which keeps the equivalence classes small
+        frequent = np.flatnonzero(supports >= self._minSupCount)
+        frequent = frequent[np.lexsort((frequent, supports[frequent]))]
+        self._names = [self._Database.itemNames[item] for item in frequent.tolist()]
+        self._sink = self._openPatternSink()
+        for name, support in zip(self._names, supports[frequent].tolist()):
+            self._sink[(name,)] = support
+
+        self._items = self._bitsets(frequent)
+        ids = np.arange(len(frequent))
+        cols = np.arange(self._items.shape[1])
+        budget = memoryBudget if memorySaver else float('inf')
+        self.__recursive([], ids, cols, self._items, None, budget)
+        self._items = None
+        self._closePatternSink(self._sink)
+        self._sink = None
 
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
@@ -363,7 +373,7 @@ class ECLATbitset(_ab._frequentPatterns):
         #     data.append([a.replace('\t', ' '), b])
         #     dataFrame = _ab._pd.DataFrame(data, columns=['Patterns', 'Support'])
 
-        dataFrame = _ab._pd.DataFrame(list([[x.replace("\t", " "), y] for x,y in self._finalPatterns.items()]), columns=['Patterns', 'Support'])
+        dataFrame = _ab._pd.DataFrame(list([[" ".join(x), y] for x,y in self._finalPatterns.items()]), columns=['Patterns', 'Support'])
         return dataFrame
 
     def save(self, outFile: str, seperator = "\t" ) -> None:
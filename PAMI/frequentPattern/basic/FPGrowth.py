@@ -55,7 +55,8 @@ from PAMI.frequentPattern.basic import abstract as _fp
 from typing import List, Dict, Tuple, Any
 from deprecated import deprecated
 from itertools import combinations
-from collections import Counter
+from concurrent.futures import ProcessPoolExecutor as _ProcessPoolExecutor
+import numpy as np
 
 _minSup = str()
 _fp._sys.setrecursionlimit(20000)
@@ -113,6 +114,32 @@ class _Node:
         return transaction[::-1], count
 
 
+def _mineConditionalBase(task):
+    """
+    Mines the conditional FP-tree of one item of the global FP-tree in a worker process.
+
+    :param task: item, the paths of its conditional pattern base as flat item array and offsets, the count of every
+                 path and the minimum support
+    :type task: tuple
+    :return: the patterns as flat item array and offsets, and the support of every pattern
+    :rtype: tuple
+    """
+    item, items, offsets, counts, minSup = task
+    miner = FPGrowth(None, minSup)
+    miner._minSup = minSup
+    miner._sink = _fp._patternSinks.MemorySink()
+    items = items.tolist()
+    transactions = {tuple(items[offsets[k]:offsets[k + 1]]): count for k, count in enumerate(counts.tolist())}
+    newRoot, newItemNode = miner._conditionalTree([item], transactions, minSup)
+    if len(newItemNode) > 0:
+        miner._recursive(newRoot, newItemNode, minSup, miner._sink)
+    patterns = list(miner._sink.getPatterns().items())
+    patternOffsets = np.zeros(len(patterns) + 1, dtype=np.int64)
+    np.cumsum([len(pattern) for pattern, _ in patterns], out=patternOffsets[1:])
+    patternItems = np.fromiter((x for pattern, _ in patterns for x in pattern), dtype=np.int32, count=patternOffsets[-1])
+    return patternItems, patternOffsets, np.fromiter((support for _, support in patterns), dtype=np.int64, count=len(patterns))
+
+
 class FPGrowth(_fp._frequentPatterns):
     """
     **About this algorithm**
@@ -126,13 +153,14 @@ class FPGrowth(_fp._frequentPatterns):
                         - **oFile** (*str*) -- *Name of the output file to store complete set of frequent patterns.*
                         - **minSup** (*int or float or str*) -- *The user can specify minSup either in count or proportion of database size. If the program detects the data type of minSup is integer, then it treats minSup is expressed in count. Otherwise, it will be treated as float.*
                         - **sep** (*str*) -- *This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.*
+                        - **numWorkers** (*int*) -- *Number of worker processes mining the conditional FP-trees of the items in parallel. The default is 1, i.e., no worker processes are started.*
 
     :**Attributes**:    - **startTime** (*float*) -- *To record the start time of the mining process.*
                         - **endTime** (*float*) -- *To record the completion time of the mining process.*
                         - **finalPatterns** (*dict*) -- *Storing the complete set of patterns in a dictionary variable.*
                         - **memoryUSS** (*float*) -- *To store the total amount of USS memory consumed by the program.*
                         - **memoryRSS** (*float*) -- *To store the total amount of RSS memory consumed by the program.*
-                        - **Database** (*list*) -- *To store the transactions of a database in list.*
+                        - **Database** (*CompactDatabase*) -- *To store the transactions of a database as integer-encoded arrays.*
                         - **mapSupport** (*Dictionary*) -- *To maintain the information of item and their frequency.*
                         - **tree** (*class*) --  *it represents the Tree class.*
 
@@ -202,6 +230,7 @@ class FPGrowth(_fp._frequentPatterns):
     _iFile = " "
     _oFile = " "
     _sep = " "
+    _supportsPatternSink = True
     __memoryUSS = float()
     __memoryRSS = float()
     __Database = []
@@ -210,48 +239,51 @@ class FPGrowth(_fp._frequentPatterns):
     __rank = {}
     __rankDup = {}
 
-    def __init__(self, iFile, minSup, sep='\t') -> None:
+    def __init__(self, iFile, minSup, sep='\t', numWorkers=1) -> None:
         super().__init__(iFile, minSup, sep)
+        self._numWorkers = numWorkers
 
     def __creatingItemSets(self) -> None:
         """
-        Storing the complete transactions of the database/input file in a database variable
+        Storing the complete transactions of the database/input file in a compact, integer-encoded database variable
         """
-        self.__Database = []
-        if isinstance(self._iFile, _fp._pd.DataFrame):
-            if self._iFile.empty:
-                print("its empty..")
-            i = self._iFile.columns.values.tolist()
-            if 'Transactions' in i:
-                self.__Database = self._iFile['Transactions'].tolist()
-                self.__Database = [x.split(self._sep) for x in self.__Database]
-            else:
-                print("The column name should be Transactions and each line should be separated by tab space or a seperator specified by the user")
-                
-
-            #print(self.Database)
-        if isinstance(self._iFile, str):
-            if _fp._validators.url(self._iFile):
-                data = _fp._urlopen(self._iFile)
-                for line in data:
-                    line.strip()
-                    line = line.decode("utf-8")
-                    temp = [i.rstrip() for i in line.split(self._sep)]
-                    temp = [x for x in temp if x]
-                    self.__Database.append(temp)
-            else:
-                try:
-                    with open(self._iFile, 'r', encoding='utf-8') as f:
-                        for line in f:
-                            line.strip()
-                            temp = [i.rstrip() for i in line.split(self._sep)]
-                            temp = [x for x in temp if x]
-                            self.__Database.append(temp)
-                except IOError:
-                    print("File Not Found")
-                    quit()
+        try:
+            self.__Database = _fp._compactDatabase.load(self._iFile, self._sep)
+        except IOError:
+            print("File Not Found")
+            quit()
 
-    def __convert(self, value) -> float:
+    def __sortedTransactions(self, itemCount, minSup):
+        """
+        Removes the infrequent and the repeated items of every transaction and sorts the remaining items in support
+        descending order.
+        All transactions are sorted together with a single vectorized sort over the flat item array.
+
+        :param itemCount: support of every item id
+        :type itemCount: numpy.ndarray
+        :param minSup: The minimum support threshold.
+        :type minSup: int
+        :return: generator of transactions
+        :rtype: Generator
+        """
+        items = self.__Database.items
+        tids = self.__Database.getTransactionIds()
+        rank = np.empty(len(itemCount), dtype=np.int64)
+        rank[np.argsort(-itemCount, kind='stable')] = np.arange(len(itemCount))
+        keep = itemCount[items] >= minSup
+        items, tids = items[keep], tids[keep]
+        order = np.lexsort((rank[items], tids))
+        items, tids = items[order], tids[order]
+        # an item repeated within a transaction is inserted once, as it is counted once in its support
+        first = np.ones(len(items), dtype=bool)
+        first[1:] = (items[1:] != items[:-1]) | (tids[1:] != tids[:-1])
+        items, tids = items[first], tids[first]
+        bounds = np.flatnonzero(np.diff(tids)) + 1
+        for line in np.split(items, bounds):
+            if len(line):
+                yield line.tolist()
+
+    def _convert(self, value) -> float:
         """
 
         To convert the type of user specified minSup value
@@ -319,6 +351,85 @@ class FPGrowth(_fp._frequentPatterns):
             all_combinations_list.extend(combinations(arr, r))
         return all_combinations_list
     
+    def _conditionalTree(self, prefix, transactions, minSup):
+        """
+
+        Builds the conditional FP-tree of a prefix from its conditional pattern base.
+
+        :param prefix: The items of the prefix.
+        :type prefix: List
+        :param transactions: The conditional pattern base, mapping every path of the prefix to its count.
+        :type transactions: Dict
+        :param minSup: The minimum support threshold.
+        :type minSup: int
+        :return: The root node of the conditional FP-tree and a dictionary containing information about nodes associated with each item.
+        :rtype: Tuple[_Node, Dict]
+        """
+        itemCount = {}
+        for transaction, count in transactions.items():
+            for item in transaction:
+                if item in itemCount:
+                    itemCount[item] += count
+                else:
+                    itemCount[item] = count
+
+        # remove items that are below minSup
+        itemCount = {k: v for k, v in itemCount.items() if v >= minSup}
+
+        newRoot = _Node(prefix, 0, None)
+        newItemNode = {}
+        if len(itemCount) == 0:
+            return newRoot, newItemNode
+
+        for transaction, count in transactions.items():
+            transaction = sorted([item for item in transaction if item in itemCount], key = lambda x: itemCount[x], reverse = True)
+            currNode = newRoot
+            for item in transaction:
+                currNode = currNode.addChild(item, count)
+                if item in newItemNode:
+                    newItemNode[item][0].add(currNode)
+                    newItemNode[item][1] += count
+                else:
+                    newItemNode[item] = [set([currNode]), count]
+        return newRoot, newItemNode
+
+    @staticmethod
+    def _patternBase(nodes):
+        """
+
+        Collects the conditional pattern base of an item, i.e., the path of every node of the item with its count.
+
+        :param nodes: The nodes of the item in the FP-tree.
+        :type nodes: Set
+        :return: The conditional pattern base, mapping every path to its count.
+        :rtype: Dict
+        """
+        transactions = {}
+        for node in nodes:
+            transaction, count = node.traverse()
+            if len(transaction) == 0:
+                continue
+            if tuple(transaction) in transactions:
+                transactions[tuple(transaction)] += count
+            else:
+                transactions[tuple(transaction)] = count
+        return transactions
+
+    def _singlePath(self, prefix, node):
+        """
+
+        Generates the patterns of a prefix whose conditional FP-tree is a single path, i.e., every combination of the
+        items of the path.
+
+        :param prefix: The items of the prefix.
+        :type prefix: List
+        :param node: The only node of the last item of the prefix.
+        :type node: _Node
+        """
+        transaction, count = node.traverse()
+        for comb in self._all_combinations(transaction):
+            self._sink[tuple(list(comb) + prefix)] = count
+
     def _recursive(self, root, itemNode, minSup, patterns):
         """
 
@@ -339,66 +450,54 @@ class FPGrowth(_fp._frequentPatterns):
             if itemNode[item][1] < self._minSup:
                 break 
 
-            newRoot = _Node(root.item + [item], 0, None)
-            # pat = "\t".join([str(i) for i in newRoot.item])
-            # self.__finalPatterns[pat] = itemNode[item][1]
-            self._finalPatterns[tuple(newRoot.item)] = itemNode[item][1]
-            newItemNode = {}
+            prefix = root.item + [item]
+            self._sink[tuple(prefix)] = itemNode[item][1]
 
             if len(itemNode[item][0]) == 1:
-                transaction, count = itemNode[item][0].pop().traverse()
-                if len(transaction) == 0:
-                    continue
-                combination = self._all_combinations(transaction)
-                for comb in combination:
-                    # pat = "\t".join([str(i) for i in comb])
-                    # pat = pat + "\t" + "\t".join([str(i) for i in newRoot.item])
-                    # self.__finalPatterns[pat] = count
-                    self._finalPatterns[tuple(list(comb) + newRoot.item)] = count
-                pass
-
-
-            itemCount = {}
-            transactions = {}
-            for node in itemNode[item][0]:
-                transaction, count = node.traverse()
-                if len(transaction) == 0:
-                    continue
-                if tuple(transaction) in transactions:
-                    transactions[tuple(transaction)] += count
-                else:
-                    transactions[tuple(transaction)] = count
-
-
-                for item in transaction:
-                    if item in itemCount:
-                        itemCount[item] += count
-                    else:
-                        itemCount[item] = count
-
-
-            # remove items that are below minSup
-            itemCount = {k: v for k, v in itemCount.items() if v >= minSup}
-            if len(itemCount) == 0:
+                self._singlePath(prefix, next(iter(itemNode[item][0])))
                 continue
 
-            for transaction, count in transactions.items():
-                transaction = sorted([item for item in transaction if item in itemCount], key = lambda x: itemCount[x], reverse = True)
-                currNode = newRoot
-                for item in transaction:
-                    currNode = currNode.addChild(item, count)
-                    if item in newItemNode:
-                        newItemNode[item][0].add(currNode)
-                        newItemNode[item][1] += count
-                    else:
-                        newItemNode[item] = [set([currNode]), count]
-
+            newRoot, newItemNode = self._conditionalTree(prefix, self._patternBase(itemNode[item][0]), minSup)
             if len(newItemNode) < 1:
                 continue
 
-            # mine(newRoot, newItemNode, minSup, patterns)
             self._recursive(newRoot, newItemNode, minSup, patterns)
 
+    def _parallelRecursive(self, itemNode, minSup):
+        """
+
+        Mines the conditional FP-trees of the items of the global FP-tree in a pool of worker processes. The
+        conditional pattern base of every item is sent to the workers as flat arrays, and the workers return their
+        patterns as flat arrays, so that no tree is pickled.
+
+        :param itemNode: A dictionary containing information about the nodes associated with each item.
+        :type itemNode: Dict
+        :param minSup: The minimum support threshold.
+        :type minSup: int
+        """
+        tasks = []
+        for item, (nodes, support) in sorted(itemNode.items(), key = lambda x: x[1][1]):
+            if support < minSup:
+                continue
+            self._sink[(item,)] = support
+            if len(nodes) == 1:
+                self._singlePath([item], next(iter(nodes)))
+                continue
+            base = self._patternBase(nodes)
+            if len(base) == 0:
+                continue
+            paths = list(base.keys())
+            offsets = np.zeros(len(paths) + 1, dtype=np.int64)
+            np.cumsum([len(path) for path in paths], out=offsets[1:])
+            tasks.append((item, np.fromiter((x for path in paths for x in path), dtype=np.int32, count=offsets[-1]),
+                          offsets, np.fromiter(base.values(), dtype=np.int64, count=len(paths)), minSup))
+        # the largest pattern bases are submitted first, so that no worker is left with a large base at the end
+        tasks.sort(key = lambda x: len(x[1]), reverse = True)
+        with _ProcessPoolExecutor(max_workers=self._numWorkers) as pool:
+            for items, offsets, supports in pool.map(_mineConditionalBase, tasks):
+                items = items.tolist()
+                for k, support in enumerate(supports.tolist()):
+                    self._sink[tuple(items[offsets[k]:offsets[k + 1]])] = support
 
     def mine(self) -> None:
         """
@@ -410,16 +509,24 @@ class FPGrowth(_fp._frequentPatterns):
             raise Exception("Please enter the file path or file name:")
         if self._minSup is None:
             raise Exception("Please enter the Minimum Support")
+        self._finalPatterns = {}
         self.__creatingItemSets()
-        self._minSup = self.__convert(self._minSup)
+        self._minSup = self._convert(self._minSup)
         _minSup = self._minSup
 
-        itemCount = Counter()
-        for line in self.__Database:
-            itemCount.update(line)
-
-        root, itemNode = self._construct(itemCount, self.__Database, self._minSup)
-        self._recursive(root, itemNode, self._minSup, self.__finalPatterns)
+        itemCount = self.__Database.getItemSupports()
+        items = dict(enumerate(itemCount.tolist()))
+        root, itemNode = self._construct(items, self.__sortedTransactions(itemCount, self._minSup), self._minSup)
+        names = self.__Database.itemNames
+        sink = self._openPatternSink()
+        # the patterns are mined on item ids and decoded into item names when they are passed to the sink
+        self._sink = sink.mapped(lambda pattern: tuple(names[i] for i in pattern))
+        if self._numWorkers > 1:
+            self._parallelRecursive(itemNode, self._minSup)
+        else:
+            self._recursive(root, itemNode, self._minSup, self._sink)
+        self._closePatternSink(sink)
+        self._sink = None
         
         print("Frequent patterns were generated successfully using frequentPatternGrowth algorithm")
         self.__endTime = _fp._time.time()
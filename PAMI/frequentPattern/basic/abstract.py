@@ -40,6 +40,8 @@ import sys as _sys
 import validators as _validators
 from urllib.request import urlopen as _urlopen
 import functools as _functools
+from PAMI.extras.dbLoader import compactDatabase as _compactDatabase
+from PAMI.extras.sinks import patternSinks as _patternSinks
 
 
 class _frequentPatterns(_ABC):
@@ -88,9 +90,18 @@ class _frequentPatterns(_ABC):
             This function outputs the total amount of RSS memory consumed by a mining algorithm
         getRuntime()
             This function outputs the total runtime of a mining algorithm
+        setPatternSink(sink)
+            Streams the patterns of mine() to a file, a callback or a bounded buffer instead of keeping them in memory
+        mineSweep(minSups)
+            Mines the patterns of several minSup values with a single mining run
+        getSweepStatistics()
+            The function outputs the runtime and memory of every minSup value of the last mineSweep() call
 
     """
 
+    # algorithms writing their patterns through _openPatternSink() set this to True
+    _supportsPatternSink = False
+
     def __init__(self, iFile, minSup, sep="\t"):
         """
         :param iFile: Input file name or path of the input file
@@ -113,6 +124,97 @@ class _frequentPatterns(_ABC):
         self._memoryRSS = float()
         self._startTime = float()
         self._endTime = float()
+        self._sweepStatistics = []
+        self._patternSink = None
+
+    def setPatternSink(self, sink):
+        """
+        Streams the patterns of the following mine() calls to a sink instead of keeping them in memory. While a sink
+        is set, getPatterns() returns an empty dictionary. The sink is closed at the end of every mine() call.
+
+        :param sink: a sink of PAMI.extras.sinks.patternSinks, or None to keep the patterns in memory again
+        :type sink: PatternSink
+        :return: None
+        :raises NotImplementedError: if the algorithm does not write its patterns to a sink
+        """
+        if sink is not None and not self._supportsPatternSink:
+            raise NotImplementedError(type(self).__name__ + " keeps its patterns in memory and does not support "
+                                      "pattern sinks")
+        self._patternSink = sink
+
+    def _openPatternSink(self):
+        """
+        :return: the sink receiving the patterns of the current mine() call
+        :rtype: PatternSink
+        """
+        return self._patternSink if self._patternSink is not None else _patternSinks.MemorySink()
+
+    def _closePatternSink(self, sink):
+        """
+        Closes the sink of the current mine() call and keeps its patterns if they were kept in memory
+
+        :param sink: the sink returned by _openPatternSink()
+        :type sink: PatternSink
+        :return: None
+        """
+        sink.close()
+        self._finalPatterns = sink.getPatterns() if isinstance(sink, _patternSinks.MemorySink) else {}
+
+    @staticmethod
+    def _isProportion(value):
+        """
+        Tells whether a minSup value is expressed in proportion of database size, following the rules of convert()
+
+        :param value: user specified minSup value
+        :type value: int or float or str
+        :return: True if the value is a proportion
+        :rtype: bool
+        """
+        return type(value) is float or (type(value) is str and '.' in value)
+
+    def mineSweep(self, minSups):
+        """
+        Mines the frequent patterns of several minSup values with a single mining run. The algorithm runs once at the
+        lowest minSup and the patterns of every higher minSup are obtained by filtering, which is exact because every
+        pattern that is frequent at a higher minSup is also frequent at the lowest one.
+
+        :param minSups: minSup values, expressed either all in count or all in proportion of database size
+        :type minSups: list
+        :return: dictionary from every minSup value to its frequent patterns
+        :rtype: dict
+        """
+        minSups = list(minSups)
+        if len(minSups) == 0:
+            return {}
+        if self._patternSink is not None:
+            raise ValueError("mineSweep filters the patterns in memory and cannot be used while a pattern sink is set")
+        if len(set(self._isProportion(value) for value in minSups)) > 1:
+            raise ValueError("minSups must be expressed either all in count or all in proportion of database size")
+        startTime = _time.time()
+        self._minSup = min(minSups, key=float)
+        self.mine()
+        mineTime = _time.time() - startTime
+        patterns = self.getPatterns()
+        process = _psutil.Process(_os.getpid())
+        results = {}
+        self._sweepStatistics = []
+        for value in minSups:
+            startTime = _time.time()
+            minSup = self._convert(value)
+            results[value] = {pattern: support for pattern, support in patterns.items() if support >= minSup}
+            self._sweepStatistics.append([value, len(results[value]), mineTime + _time.time() - startTime,
+                                          process.memory_full_info().uss, process.memory_info().rss])
+        return results
+
+    def getSweepStatistics(self):
+        """
+        Statistics of the last mineSweep() call. The runtime of a minSup value is the time of the shared mining run plus
+        the time taken to filter its patterns.
+
+        :return: data frame with the columns minSup, Patterns, Runtime, MemoryUSS and MemoryRSS
+        :rtype: pd.DataFrame
+        """
+        return _pd.DataFrame(self._sweepStatistics, columns=['minSup', 'Patterns', 'Runtime', 'MemoryUSS', 'MemoryRSS'])
 
     @_abstractmethod
     def startMine(self):
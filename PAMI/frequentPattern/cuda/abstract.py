@@ -25,13 +25,106 @@ import os.path as _ospath
 import psutil as _psutil
 import sys as _sys
 import validators as _validators
-import cupy as _cp
 import numpy as _np
 from urllib.request import urlopen as _urlopen
-import pycuda.gpuarray as _gpuarray
-import pycuda.autoinit
-import pycuda.driver as _cuda
-from pycuda.compiler import _SourceModule
+
+try:
+    import cupy as _cp
+except ImportError:
+    _cp = None
+
+try:
+    import pycuda.gpuarray as _gpuarray
+    import pycuda.autoinit
+    import pycuda.driver as _cuda
+    from pycuda.compiler import SourceModule as _SourceModule
+except Exception:
+    # pycuda is either not installed or cannot create a context because there is no CUDA device
+    _gpuarray = _cuda = _SourceModule = None
+
+backends = ('cuda', 'numpy')
+
+_bitCounts = _np.array([bin(i).count('1') for i in range(256)], dtype=_np.uint8)
+
+
+def _cupyAvailable():
+    """
+    :return: True if CuPy is installed and a CUDA device can be used
+    :rtype: bool
+    """
+    if _cp is None:
+        return False
+    try:
+        return _cp.cuda.runtime.getDeviceCount() > 0
+    except Exception:
+        return False
+
+
+def _pycudaAvailable():
+    """
+    :return: True if PyCUDA is installed and has created a context on a CUDA device
+    :rtype: bool
+    """
+    return _gpuarray is not None
+
+
+def _selectBackend(backend, cudaAvailable):
+    """
+    Selects the backend running the bit-matrix operations of an algorithm
+
+    :param backend: 'cuda', 'numpy' or None. None selects 'cuda' if a CUDA device is available and 'numpy' otherwise.
+    :type backend: str
+    :param cudaAvailable: True if the CUDA libraries of the algorithm can be used
+    :type cudaAvailable: bool
+    :return: name of the selected backend
+    :rtype: str
+    """
+    if backend is None:
+        return 'cuda' if cudaAvailable else 'numpy'
+    if backend not in backends:
+        raise ValueError("backend must be one of: " + str(backends))
+    if backend == 'cuda' and not cudaAvailable:
+        raise RuntimeError("The cuda backend requires a CUDA device and its python libraries. Use backend='numpy'.")
+    return backend
+
+
+def _bitMatrix(xp, tidLists, numTransactions):
+    """
+    Packs tid-lists into a matrix of uint32 words. Transaction tid sets bit (31 - tid % 32) of word tid // 32 of a row.
+
+    :param xp: array module of the backend, i.e., cupy or numpy
+    :type xp: module
+    :param tidLists: sorted transaction ids of every row
+    :type tidLists: list
+    :param numTransactions: number of transactions in the database
+    :type numTransactions: int
+    :return: matrix of bit vectors
+    :rtype: xp.ndarray
+    """
+    words = (numTransactions + 31) // 32
+    lengths = [len(tids) for tids in tidLists]
+    rows = _np.repeat(_np.arange(len(tidLists)), lengths)
+    tids = _np.concatenate([_np.asarray(tids, dtype=_np.int64) for tids in tidLists]) if tidLists else _np.zeros(0, _np.int64)
+    matrix = _np.zeros((len(tidLists), words), dtype=_np.uint32)
+    _np.bitwise_or.at(matrix, (rows, tids // 32), _np.left_shift(_np.uint32(1), (31 - tids % 32).astype(_np.uint32)))
+    return xp.asarray(matrix)
+
+
+def _popcount(xp, bitVectors):
+    """
+    Counts the set bits of every row of a matrix of bit vectors. All the rows are counted together, so one call
+    replaces a kernel launch per candidate.
+
+    :param xp: array module of the backend, i.e., cupy or numpy
+    :type xp: module
+    :param bitVectors: matrix of uint32 words
+    :type bitVectors: xp.ndarray
+    :return: number of set bits of every row
+    :rtype: xp.ndarray
+    """
+    if hasattr(xp, 'bitwise_count'):
+        return xp.bitwise_count(bitVectors).sum(axis=-1, dtype=xp.int64)
+    return xp.asarray(_bitCounts)[xp.ascontiguousarray(bitVectors).view(xp.uint8)].sum(axis=-1, dtype=xp.int64)
 
 
 class _frequentPatterns(_ABC):
@@ -51,6 +144,9 @@ class _frequentPatterns(_ABC):
         sep : str
             This variable is used to distinguish items from one another in a transaction. The default seperator is tab space or \t.
             However, the users can override their default separator.
+        backend : str
+            'cuda' runs the algorithm on the GPU and 'numpy' on the CPU. By default, 'cuda' is selected whenever a
+            CUDA device is available.
         startTime:float
             To record the start time of the algorithm
         endTime:float
@@ -82,7 +178,7 @@ class _frequentPatterns(_ABC):
             Total amount of runtime taken by the program will be retrieved from this function
     """
 
-    def __init__(self, iFile, minSup, sep = '\t'):
+    def __init__(self, iFile, minSup, sep = '\t', backend = None):
         """
         :param iFile: Input file name or path of the input file
         :type iFile: str
@@ -93,6 +189,9 @@ class _frequentPatterns(_ABC):
         :type minSup: int or float or str
         :param sep: separator used in user specified input file
         :type sep: str
+        :param backend: 'cuda' to run on the GPU with CuPy, 'numpy' to run on the CPU. By default, 'cuda' is used if a
+            CUDA device is available.
+        :type backend: str
         """
 
         self._iFile = iFile
@@ -104,6 +203,11 @@ class _frequentPatterns(_ABC):
         self._memoryRSS = float()
         self._memoryUSS = float()
         self._oFile = " "
+        self._backend = _selectBackend(backend, _cupyAvailable())
+        self._xp = _np
+        if self._backend == 'cuda':
+            _cp.cuda.Device(0).use()
+            self._xp = _cp
 
     @_abstractmethod
     def startMine(self):
@@ -70,6 +70,8 @@ class cuApriori(_ab._frequentPatterns):
                    The user can specify minSup either in count or proportion of database size. If the program detects the data type of minSup is integer, then it treats minSup is expressed in count. Otherwise, it will be treated as float.
     :param  sep: str :
                    This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+    :param  backend: str :
+                   'cuda' runs the algorithm on the GPU, 'numpy' runs the same bit-matrix algorithm on the CPU. By default, 'cuda' is used whenever a CUDA device is available.
 
     :Attributes:
 
@@ -148,7 +150,6 @@ class cuApriori(_ab._frequentPatterns):
 
     """
 
-    _ab._cp.cuda.Device(0).use()
 
     _minSup = float()
     _startTime = float()
@@ -161,23 +162,6 @@ class cuApriori(_ab._frequentPatterns):
     _memoryRSS = float()
     _Database = []
 
-    _sumKernel = _ab._cp.RawKernel(r'''
-
-    #define uint32_t unsigned int
-
-    extern "C" __global__
-
-    void sumKernel(uint32_t *d_a, uint32_t *sum, uint32_t numElements)
-    {
-        uint32_t i = blockDim.x * blockIdx.x + threadIdx.x;
-        if (i < numElements)
-        {  
-            atomicAdd(&sum[0], __popc(d_a[i]));
-        }
-        return;    
-    }
-
-    ''', 'sumKernel')
 
     def _creatingItemSets(self):
         """
@@ -253,7 +237,7 @@ class cuApriori(_ab._frequentPatterns):
         newArraysAndItems = {}
 
         for k, v in ArraysAndItems.items():
-            ArraysAndItems[k] = _ab._cp.array(v, dtype=_ab._np.uint32)
+            ArraysAndItems[k] = self._xp.array(v, dtype=_ab._np.uint32)
             if len(v) >= self._minSup:
                 self._finalPatterns[k] = len(v)
                 newArraysAndItems[k] = ArraysAndItems[k]
@@ -272,6 +256,7 @@ class cuApriori(_ab._frequentPatterns):
         Frequent pattern mining process will start from here
         """
         self._Database = []
+        self._finalPatterns = {}
         self._startTime = _ab._time.time()
         self._creatingItemSets()
         self._minSup = self._convert(self._minSup)
@@ -288,7 +273,7 @@ class cuApriori(_ab._frequentPatterns):
                 for j in range(i + 1, len(ArraysAndItems)):
                     jList = list(keys[j])
                     union = tuple(sorted(set(iList + jList)))
-                    intersect = _ab._cp.intersect1d(ArraysAndItems[keys[i]], ArraysAndItems[keys[j]],
+                    intersect = self._xp.intersect1d(ArraysAndItems[keys[i]], ArraysAndItems[keys[j]],
                                                     assume_unique=True)
                     if len(intersect) >= self._minSup and union not in self._finalPatterns:
                         newArraysAndItems[union] = intersect
@@ -341,7 +326,7 @@ class cuApriori(_ab._frequentPatterns):
         dataFrame = {}
         data = []
         for a, b in self._finalPatterns.items():
-            data.append([a.replace('\t', ' '), b])
+            data.append([" ".join(a), b])
             dataFrame = _ab._pd.DataFrame(data, columns=['Patterns', 'Support'])
         # dataFrame = dataFrame.replace(r'\r+|\n+|\t+',' ', regex=True)
         return dataFrame
@@ -355,7 +340,7 @@ class cuApriori(_ab._frequentPatterns):
         self._oFile = outFile
         writer = open(self._oFile, 'w+')
         for x, y in self._finalPatterns.items():
-            s1 = x.strip() + ":" + str(y)
+            s1 = "\t".join(x) + ":" + str(y)
             writer.write("%s \n" % s1)
 
     def getPatterns(self):
@@ -50,8 +50,8 @@ Copyright (C)  2021 Rage Uday Kiran
      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-# from PAMI.frequentPattern.cuda import abstract as _ab
-import abstract as _ab
+from PAMI.frequentPattern.cuda import abstract as _ab
+# import abstract as _ab
 from deprecated import deprecated
 
 
@@ -70,6 +70,8 @@ class cuAprioriBit(_ab._frequentPatterns):
                    The user can specify minSup either in count or proportion of database size. If the program detects the data type of minSup is integer, then it treats minSup is expressed in count. Otherwise, it will be treated as float.
     :param  sep: str :
                    This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+    :param  backend: str :
+                   'cuda' runs the algorithm on the GPU, 'numpy' runs the same bit-matrix algorithm on the CPU. By default, 'cuda' is used whenever a CUDA device is available.
 
     :Attributes:
 
@@ -159,24 +161,6 @@ class cuAprioriBit(_ab._frequentPatterns):
     _memoryRSS = float()
     _Database = []
 
-    _sumKernel = _ab._cp.RawKernel(r'''
-
-    #define uint32_t unsigned int
-
-    extern "C" __global__
-
-    void sumKernel(uint32_t *d_a, uint32_t *sum, uint32_t numElements)
-    {
-        uint32_t i = blockDim.x * blockIdx.x + threadIdx.x;
-        if (i < numElements)
-        {  
-            atomicAdd(&sum[0], __popc(d_a[i]));
-        }
-        return;    
-    }
-
-    ''', 'sumKernel')
-
     def _creatingItemSets(self):
         """
         Storing the complete transactions of the database/input file in a database variable
@@ -259,18 +243,17 @@ class cuAprioriBit(_ab._frequentPatterns):
         return newArraysAndItems
 
     def createBitRepresentation(self, ArraysAndItems):
-        bitRep = {}
-        arraySize = len(self._Database) // 32 + 1 if len(self._Database) % 32 != 0 else len(self._Database) // 32
-
-        for k, v in ArraysAndItems.items():
-            bitRep[k] = _ab._np.zeros(arraySize, dtype=_ab._np.uint32)
-            for i in v:
-                bitRep[k][i // 32] |= 1 << 31 - (i % 32)
-
-        for k, v in bitRep.items():
-            bitRep[k] = _ab._cp.array(v)
+        """
+        Converts the tid-lists of the items into bit vectors of uint32 words on the selected backend
 
-        return bitRep
+        :param ArraysAndItems: tid-list of every frequent item
+        :type ArraysAndItems: dict
+        :return: bit vector of every frequent item
+        :rtype: dict
+        """
+        keys = list(ArraysAndItems.keys())
+        bitVectors = _ab._bitMatrix(self._xp, [ArraysAndItems[k] for k in keys], len(self._Database))
+        return {k: bitVectors[i] for i, k in enumerate(keys)}
 
     @deprecated("It is recommended to use 'mine()' instead of 'startMine()' for mining process. Starting from January 2025, 'startMine()' will be completely terminated.")
     def startMine(self):
@@ -284,6 +267,7 @@ class cuAprioriBit(_ab._frequentPatterns):
         Frequent pattern mining process will start from here
         """
         self._Database = []
+        self._finalPatterns = {}
         self._startTime = _ab._time.time()
         self._creatingItemSets()
         self._minSup = self._convert(self._minSup)
@@ -295,21 +279,20 @@ class cuAprioriBit(_ab._frequentPatterns):
             # print("Total number of ArraysAndItems:", len(ArraysAndItems))
             newArraysAndItems = {}
             keys = list(ArraysAndItems.keys())
+            bitVectors = self._xp.stack([ArraysAndItems[key] for key in keys])
             for i in range(len(ArraysAndItems)):
                 # print(i, "/", len(ArraysAndItems), end="\r")
                 iList = list(keys[i])
+                # the intersections of keys[i] with all the following keys are counted in one batch
+                unionData = self._xp.bitwise_and(bitVectors[i + 1:], bitVectors[i])
+                sums = _ab._popcount(self._xp, unionData).tolist()
                 for j in range(i + 1, len(ArraysAndItems)):
-                    unionData = _ab._cp.bitwise_and(ArraysAndItems[keys[i]], ArraysAndItems[keys[j]])
-                    sum = _ab._cp.zeros(1, dtype=_ab._np.uint32)
-                    self._sumKernel((len(unionData) // 32 + 1,), (32,),
-                                    (unionData, sum, _ab._cp.uint32(len(unionData))))
-                    sum = sum[0]
+                    sum = sums[j - i - 1]
                     jList = list(keys[j])
                     union = tuple(sorted(set(iList + jList)))
                     if sum >= self._minSup and union not in self._finalPatterns:
-                        newArraysAndItems[union] = unionData
-                        string = "\t".join(union)
-                        self._finalPatterns[string] = sum
+                        newArraysAndItems[union] = unionData[j - i - 1]
+                        self._finalPatterns[union] = sum
             ArraysAndItems = newArraysAndItems
             # print()
 
@@ -358,7 +341,7 @@ class cuAprioriBit(_ab._frequentPatterns):
         dataFrame = {}
         data = []
         for a, b in self._finalPatterns.items():
-            data.append([a.replace('\t', ' '), b])
+            data.append([" ".join(a), b])
             dataFrame = _ab._pd.DataFrame(data, columns=['Patterns', 'Support'])
         # dataFrame = dataFrame.replace(r'\r+|\n+|\t+',' ', regex=True)
         return dataFrame
@@ -372,7 +355,7 @@ class cuAprioriBit(_ab._frequentPatterns):
         self._oFile = outFile
         writer = open(self._oFile, 'w+')
         for x, y in self._finalPatterns.items():
-            s1 = x.strip() + ":" + str(y)
+            s1 = "\t".join(x) + ":" + str(y)
             writer.write("%s \n" % s1)
 
     def getPatterns(self):
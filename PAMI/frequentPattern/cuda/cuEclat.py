@@ -52,8 +52,8 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 
-# from PAMI.frequentPattern.cuda import abstract as _ab
-import abstract as _ab
+from PAMI.frequentPattern.cuda import abstract as _ab
+# import abstract as _ab
 from deprecated import deprecated
 
 class cuEclat(_ab._frequentPatterns):
@@ -71,6 +71,8 @@ class cuEclat(_ab._frequentPatterns):
                    The user can specify minSup either in count or proportion of database size. If the program detects the data type of minSup is integer, then it treats minSup is expressed in count. Otherwise, it will be treated as float.
     :param  sep: str :
                    This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+    :param  backend: str :
+                   'cuda' runs the algorithm on the GPU, 'numpy' runs the same bit-matrix algorithm on the CPU. By default, 'cuda' is used whenever a CUDA device is available.
 
 
 
@@ -151,7 +153,6 @@ class cuEclat(_ab._frequentPatterns):
 
     """
 
-    _ab._cp.cuda.Device(0).use()
 
 
 
@@ -245,7 +246,7 @@ class cuEclat(_ab._frequentPatterns):
         newArraysAndItems = {}
 
         for k,v in ArraysAndItems.items():
-            ArraysAndItems[k] = _ab._cp.array(v, dtype=_ab._np.uint32)
+            ArraysAndItems[k] = self._xp.array(v, dtype=_ab._np.uint32)
             if len(v) >= self._minSup:
                 self._finalPatterns[k] = len(v)
                 newArraysAndItems[k] = ArraysAndItems[k]
@@ -264,6 +265,7 @@ class cuEclat(_ab._frequentPatterns):
         Frequent pattern mining process will start from here
         """
         self._Database = []
+        self._finalPatterns = {}
         self._startTime = _ab._time.time()
         self._creatingItemSets()
         self._minSup = self._convert(self._minSup)
@@ -282,7 +284,7 @@ class cuEclat(_ab._frequentPatterns):
                     if iList[:-1] == jList[:-1] and iList[-1] != jList[-1]:
                         union = iList + [jList[-1]]
                         union = tuple(union)
-                        intersect = _ab._cp.intersect1d(ArraysAndItems[keys[i]], ArraysAndItems[keys[j]], assume_unique=True)
+                        intersect = self._xp.intersect1d(ArraysAndItems[keys[i]], ArraysAndItems[keys[j]], assume_unique=True)
                         if len(intersect) >= self._minSup:
                             newArraysAndItems[union] = intersect
                             self._finalPatterns[union] = len(intersect)
@@ -338,7 +340,7 @@ class cuEclat(_ab._frequentPatterns):
         dataFrame = {}
         data = []
         for a, b in self._finalPatterns.items():
-            data.append([a.replace('\t', ' '), b])
+            data.append([" ".join(a), b])
             dataFrame = _ab._pd.DataFrame(data, columns=['Patterns', 'Support'])
         # dataFrame = dataFrame.replace(r'\r+|\n+|\t+',' ', regex=True)
         return dataFrame
@@ -352,7 +354,7 @@ class cuEclat(_ab._frequentPatterns):
         self._oFile = outFile
         writer = open(self._oFile, 'w+')
         for x, y in self._finalPatterns.items():
-            s1 = x.strip() + ":" + str(y)
+            s1 = "\t".join(x) + ":" + str(y)
             writer.write("%s \n" % s1)
 
     def getPatterns(self):
@@ -52,8 +52,8 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 
-# from PAMI.frequentPattern.cuda import abstract as _ab
-import abstract as _ab
+from PAMI.frequentPattern.cuda import abstract as _ab
+# import abstract as _ab
 from deprecated import deprecated
 
 class cuEclatBit(_ab._frequentPatterns):
@@ -71,6 +71,8 @@ class cuEclatBit(_ab._frequentPatterns):
                    The user can specify minSup either in count or proportion of database size. If the program detects the data type of minSup is integer, then it treats minSup is expressed in count. Otherwise, it will be treated as float.
     :param  sep: str :
                    This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+    :param  backend: str :
+                   'cuda' runs the algorithm on the GPU, 'numpy' runs the same bit-matrix algorithm on the CPU. By default, 'cuda' is used whenever a CUDA device is available.
 
     :Attributes:
 
@@ -161,24 +163,6 @@ class cuEclatBit(_ab._frequentPatterns):
     _memoryRSS = float()
     _Database = []
 
-    _sumKernel = _ab._cp.RawKernel(r'''
-
-    #define uint32_t unsigned int
-
-    extern "C" __global__
-
-    void sumKernel(uint32_t *d_a, uint32_t *sum, uint32_t numElements)
-    {
-        uint32_t i = blockDim.x * blockIdx.x + threadIdx.x;
-        if (i < numElements)
-        {  
-            atomicAdd(&sum[0], __popc(d_a[i]));
-        }
-        return;    
-    }
-
-    ''', 'sumKernel')
-
     def _creatingItemSets(self):
         """
         Storing the complete transactions of the database/input file in a database variable
@@ -261,19 +245,17 @@ class cuEclatBit(_ab._frequentPatterns):
         return newArraysAndItems
     
     def createBitRepresentation(self, ArraysAndItems):
-        bitRep = {}
-        arraySize = len(self._Database) // 32 + 1 if len(self._Database) % 32 != 0 else len(self._Database) // 32
-
-
-        for k, v in ArraysAndItems.items():
-            bitRep[k] = _ab._np.zeros(arraySize, dtype=_ab._np.uint32)
-            for i in v:
-                bitRep[k][i // 32] |= 1 << 31 - (i % 32)
-
-        for k, v in bitRep.items():
-            bitRep[k] = _ab._cp.array(v)
+        """
+        Converts the tid-lists of the items into bit vectors of uint32 words on the selected backend
 
-        return bitRep
+        :param ArraysAndItems: tid-list of every frequent item
+        :type ArraysAndItems: dict
+        :return: bit vector of every frequent item
+        :rtype: dict
+        """
+        keys = list(ArraysAndItems.keys())
+        bitVectors = _ab._bitMatrix(self._xp, [ArraysAndItems[k] for k in keys], len(self._Database))
+        return {k: bitVectors[i] for i, k in enumerate(keys)}
 
     @deprecated("It is recommended to use 'mine()' instead of 'startMine()' for mining process. Starting from January 2025, 'startMine()' will be completely terminated.")
     def startMine(self):
@@ -287,6 +269,7 @@ class cuEclatBit(_ab._frequentPatterns):
         Frequent pattern mining process will start from here
         """
         self._Database = []
+        self._finalPatterns = {}
         self._startTime = _ab._time.time()
         self._creatingItemSets()
         itemsList = sorted(list(set.union(*self._Database)))  # because Database is list
@@ -303,20 +286,19 @@ class cuEclatBit(_ab._frequentPatterns):
             for i in range(len(ArraysAndItems)):
                 iList = list(keys[i])
                 # print(i, "/", len(ArraysAndItems), end="\r")
-                for j in range(i+1, len(ArraysAndItems)):
-                    jList = list(keys[j])
-                    union = []
-                    if iList[:-1] == jList[:-1] and iList[-1] != jList[-1]:
-                        union = iList + [jList[-1]]
-                        union = tuple(union)
-                        unionData = _ab._cp.bitwise_and(ArraysAndItems[keys[i]], ArraysAndItems[keys[j]])
-                        sum = _ab._cp.zeros(1, dtype=_ab._np.uint32)
-                        self._sumKernel((len(unionData) // 32 + 1,), (32,), (unionData, sum, _ab._cp.uint32(len(unionData))))
-                        sum = sum[0]
-                        if sum >= self._minSup and union not in self._finalPatterns:
-                            newArraysAndItems[union] = unionData
-                            string = "\t".join(union)
-                            self._finalPatterns[string] = sum
+                # the keys sharing the prefix of keys[i] are intersected and counted in one batch
+                jKeys = [keys[j] for j in range(i + 1, len(ArraysAndItems))
+                         if iList[:-1] == list(keys[j])[:-1] and iList[-1] != keys[j][-1]]
+                if not jKeys:
+                    continue
+                unionData = self._xp.bitwise_and(self._xp.stack([ArraysAndItems[key] for key in jKeys]),
+                                                 ArraysAndItems[keys[i]])
+                sums = _ab._popcount(self._xp, unionData).tolist()
+                for k, jKey in enumerate(jKeys):
+                    union = tuple(iList + [jKey[-1]])
+                    if sums[k] >= self._minSup and union not in self._finalPatterns:
+                        newArraysAndItems[union] = unionData[k]
+                        self._finalPatterns[union] = sums[k]
             ArraysAndItems = newArraysAndItems
             # print()
 
@@ -366,7 +348,7 @@ class cuEclatBit(_ab._frequentPatterns):
         dataFrame = {}
         data = []
         for a, b in self._finalPatterns.items():
-            data.append([a.replace('\t', ' '), b])
+            data.append([" ".join(a), b])
             dataFrame = _ab._pd.DataFrame(data, columns=['Patterns', 'Support'])
         # dataFrame = dataFrame.replace(r'\r+|\n+|\t+',' ', regex=True)
         return dataFrame
@@ -380,7 +362,7 @@ class cuEclatBit(_ab._frequentPatterns):
         self._oFile = outFile
         writer = open(self._oFile, 'w+')
         for x, y in self._finalPatterns.items():
-            s1 = x.strip() + ":" + str(y)
+            s1 = "\t".join(x) + ":" + str(y)
             writer.write("%s \n" % s1)
 
     def getPatterns(self):
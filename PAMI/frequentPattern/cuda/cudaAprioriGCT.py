@@ -58,7 +58,7 @@ from PAMI.frequentPattern.basic import abstract as _ab
 import os
 import time
 import numpy as np
-import pycuda.gpuarray as gpuarray
+from PAMI.frequentPattern.cuda import abstract as _cuda
 import psutil
 
 
@@ -77,6 +77,8 @@ class cudaAprioriGCT(_ab._frequentPatterns):
                     The user can specify minSup either in count or proportion of database size. If the program detects the data type of minSup is integer, then it treats minSup is expressed in count. Otherwise, it will be treated as float.
     :param  sep: str :
                    This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+    :param  backend: str :
+                   'cuda' runs the algorithm on the GPU, 'numpy' runs the same bit-matrix algorithm on the CPU. By default, 'cuda' is used whenever a CUDA device is available.
 
     :Attributes:
 
@@ -162,10 +164,11 @@ class cudaAprioriGCT(_ab._frequentPatterns):
     _minSup = 0
     _finalPatterns = {}
 
-    def __init__(self, filePath, minSup, sep):
+    def __init__(self, filePath, minSup, sep='\t', backend=None):
         self._iFile = filePath
         self._sep = sep
         self._minSup = minSup
+        self._backend = _cuda._selectBackend(backend, _cuda._pycudaAvailable())
         self.__time = 0
         self.__memRSS = 0
         self.__memUSS = 0
@@ -246,9 +249,41 @@ class cudaAprioriGCT(_ab._frequentPatterns):
         for trans_id, transaction in enumerate(self.__Database):
             for item in transaction:
                 vb_data[item2idx[item], trans_id] = 1
-        vb_data = gpuarray.to_gpu(vb_data.astype(np.uint16))
+        if self._backend == 'cuda':
+            vb_data = _cuda._gpuarray.to_gpu(vb_data)
         return vb_data, idx2item
 
+    def __support(self, vector):
+        """
+        Counts the transactions of a bit vector on the selected backend
+
+        :param vector: bit vector of a pattern
+        :type vector: pycuda.gpuarray.GPUArray or numpy.ndarray
+        :return: support of the pattern
+        :rtype: int
+        """
+        if self._backend == 'cuda':
+            return _cuda._gpuarray.sum(vector).get()
+        return int(vector.sum(dtype=np.int64))
+
+    def __intersection(self, vb_data, values):
+        """
+        Computes the bit vector of the transactions containing all the given items
+
+        :param vb_data: bit vectors of the items
+        :type vb_data: pycuda.gpuarray.GPUArray or numpy.ndarray
+        :param values: indices of the items
+        :type values: list
+        :return: bit vector of the items
+        :rtype: pycuda.gpuarray.GPUArray or numpy.ndarray
+        """
+        if self._backend == 'cuda':
+            totalArray = vb_data[values[0]]
+            for k in range(1, len(values)):
+                totalArray = totalArray.__mul__(vb_data[values[k]])
+            return totalArray
+        return np.bitwise_and.reduce(vb_data[values], axis=0)
+
     def getRuntime(self):
         """
         Calculating the total amount of time taken by the mining process
@@ -347,9 +382,10 @@ class cudaAprioriGCT(_ab._frequentPatterns):
         vb_data, idx2item = self.compute_vertical_bitvector_data()
 
         for i in range(len(vb_data)):
-            if gpuarray.sum(vb_data[i]).get() >= self._minSup:
+            support = self.__support(vb_data[i])
+            if support >= self._minSup:
                 basePattern[idx2item[i]] = [i]
-                final[idx2item[i]] = gpuarray.sum(vb_data[i]).get()
+                final[idx2item[i]] = support
 
         while len(basePattern) > 0:
             temp = {}
@@ -366,10 +402,7 @@ class cudaAprioriGCT(_ab._frequentPatterns):
                     for val in valuesList[j]:
                         values.add(val)
                     values = list(sorted(values))
-                    totalArray = vb_data[values[0]]
-                    for k in range(1, len(values)):
-                        totalArray = totalArray.__mul__(vb_data[values[k]])
-                    support = gpuarray.sum(totalArray).get()
+                    support = self.__support(self.__intersection(vb_data, values))
                     if support >= self._minSup:
                         combinedKey = " ".join(
                             str(x) for x in sorted(set(keyI) | set(keyJ)))
@@ -388,7 +421,7 @@ class cudaAprioriGCT(_ab._frequentPatterns):
         This function is used to print the results
         """
         print("Total number of Coverage Patterns:", len(self.getPatterns()))
-        print("GPU MEM: ", _ap.getGPUMemory())
+        print("GPU MEM: ", self.getGPUMemory())
         print("Total Memory in USS:", self.getMemoryUSS())
         print("Total Memory in RSS", self.getMemoryRSS())
         print("Total ExecutionTime in ms:", self.getRuntime())
@@ -38,6 +38,7 @@ import psutil as _psutil
 import sys as _sys
 import validators as _validators
 from urllib.request import urlopen as _urlopen
+from PAMI.extras.dbLoader import compactDatabase as _compactDatabase
 
 
 class _frequentPatterns(_ABC):
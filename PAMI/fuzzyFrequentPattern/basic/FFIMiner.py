@@ -54,6 +54,32 @@ Copyright (C)  2021 Rage Uday Kiran
 from PAMI.fuzzyFrequentPattern.basic import abstract as _ab
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
 from deprecated import deprecated
+import numpy as _np
+
+
+def _intersect(tids1: _np.ndarray, values1: _np.ndarray, tids2: _np.ndarray, values2: _np.ndarray) -> Tuple[_np.ndarray, _np.ndarray]:
+    """
+    Intersects two fuzzy lists, keeping the smaller fuzzy value of every common transaction
+
+    :param tids1: sorted transaction ids of the first fuzzy list
+    :type tids1: numpy.ndarray
+    :param values1: fuzzy values of the first fuzzy list
+    :type values1: numpy.ndarray
+    :param tids2: sorted transaction ids of the second fuzzy list
+    :type tids2: numpy.ndarray
+    :param values2: fuzzy values of the second fuzzy list
+    :type values2: numpy.ndarray
+    :return: transaction ids and fuzzy values of the intersection
+    :rtype: tuple
+    """
+    if len(tids1) > len(tids2):
+        tids1, values1, tids2, values2 = tids2, values2, tids1, values1
+    if len(tids1) == 0:
+        return tids1, values1
+    # the shorter list is looked up in the longer one
+    positions = _np.minimum(_np.searchsorted(tids2, tids1), len(tids2) - 1)
+    common = tids2[positions] == tids1
+    return tids1[common], _np.minimum(values1[common], values2[positions[common]])
 
 class FFIMiner(_ab._fuzzyFrequentPattenrs):
     """
@@ -275,36 +301,100 @@ class FFIMiner(_ab._fuzzyFrequentPattenrs):
             if len(newCands) > 1:
                 self.dfs(newCands)
 
-    def mine(self):
+    def _dfsArrays(self, prefix: tuple, cands: list) -> None:
+        """
+        Perform depth-first search (DFS) over fuzzy lists stored as arrays.
+
+        Every candidate of an equivalence class is extended with the candidates that follow it, by intersecting their
+        sorted transaction ids. The class of a candidate is released once it is mined, and a candidate is released
+        once all of its extensions are built, so only the fuzzy lists of the current path are kept in memory.
+
+        :param prefix: pattern shared by the candidates
+        :type prefix: tuple
+        :param cands: candidates as [item, transaction ids, fuzzy values]
+        :type cands: list
+        :return: None
+        """
+        for i in range(len(cands)):
+            item, tids, values = cands[i]
+            cands[i] = None
+            pattern = prefix + (item,)
+            newCands = []
+            for j in range(i + 1, len(cands)):
+                newTids, newValues = _intersect(tids, values, cands[j][1], cands[j][2])
+                # summed one transaction after another, like the dictionaries of the first version, so that
+                # supports on the threshold are decided the same way
+                count = float(newValues.cumsum()[-1]) if len(newValues) else 0
+                if count >= self._minSup:
+                    newCands.append([cands[j][0], newTids, newValues])
+                    self._finalPatterns[pattern + (cands[j][0],)] = count
+            del tids, values
+            if len(newCands) > 1:
+                self._dfsArrays(pattern, newCands)
+
+    def _mineArrays(self) -> None:
+        """
+        Mines the fuzzy frequent patterns with the fuzzy list of every candidate stored as a sorted array of
+        transaction ids and an array of fuzzy values
+        """
+        items = {}
+        for lineNo, (transactions, fuzzyValues) in enumerate(zip(self._transactions, self._fuzzyValues)):
+            for item, fuzzyValue in zip(transactions, fuzzyValues):
+                items.setdefault(item, {})[lineNo] = fuzzyValue
+        self._transactions, self._fuzzyValues = [], []
+        cands = []
+        for item, fuzzyList in items.items():
+            count = sum(fuzzyList.values())
+            if count >= self._minSup:
+                tids = _np.fromiter(fuzzyList.keys(), dtype=_np.int32, count=len(fuzzyList))
+                values = _np.fromiter(fuzzyList.values(), dtype=_np.float64, count=len(fuzzyList))
+                cands.append([item, tids, values, count])
+        del items
+        cands.sort(key=lambda x: x[3], reverse=True)
+        for item, _, _, count in cands:
+            self._finalPatterns[(item,)] = count
+        self._dfsArrays((), [cand[:3] for cand in cands])
+
+    def mine(self, sparse: bool = True) -> None:
         """
         Main() function start from here.
+
+        :param sparse: store the fuzzy list of a candidate as numpy arrays of its transaction ids and fuzzy values,
+                       intersected by vectorized lookups and released once the candidate is mined. If False, the fuzzy
+                       lists are dictionaries kept for all the patterns, as in the first version of this program.
+        :type sparse: bool
+        :return: None
         """
         self._startTime = _ab._time.time()
-        items = {}
-        lineNo = 0
+        self._finalPatterns = {}
+        self._Database = {}
         self._creatingItemsets()
-
         self._dbLen = len(self._transactions)
-        for transactions, fuzzyValues in zip(self._transactions, self._fuzzyValues):
-            for item, fuzzyValue in zip(transactions, fuzzyValues):
-                item = tuple([item])
-                if item not in items:
-                    items[item] = {}
-                items[item][lineNo] = fuzzyValue
-            lineNo += 1
-
         self._minSup = self._convert(self._minSup)
-        self._Database = items.copy()
-
-        supports = {k:sum(v.values()) for k,v in items.items()}
-        supports = {k:v for k,v in supports.items() if v >= self._minSup}
-        self._Database = {k:v for k,v in items.items() if k in supports}
-        self._Database = {k:v for k,v in sorted(self._Database.items(), key=lambda x: sum(x[1].values()), reverse=True)}
-
-        self._finalPatterns = supports.copy()
-
-        cands = list(self._Database.keys())
-        self.dfs(cands)
+        if sparse:
+            self._mineArrays()
+        else:
+            items = {}
+            lineNo = 0
+            for transactions, fuzzyValues in zip(self._transactions, self._fuzzyValues):
+                for item, fuzzyValue in zip(transactions, fuzzyValues):
+                    item = tuple([item])
+                    if item not in items:
+                        items[item] = {}
+                    items[item][lineNo] = fuzzyValue
+                lineNo += 1
+
+            self._Database = items.copy()
+
+            supports = {k:sum(v.values()) for k,v in items.items()}
+            supports = {k:v for k,v in supports.items() if v >= self._minSup}
+            self._Database = {k:v for k,v in items.items() if k in supports}
+            self._Database = {k:v for k,v in sorted(self._Database.items(), key=lambda x: sum(x[1].values()), reverse=True)}
+
+            self._finalPatterns = supports.copy()
+
+            cands = list(self._Database.keys())
+            self.dfs(cands)
 
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
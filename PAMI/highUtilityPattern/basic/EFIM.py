@@ -55,6 +55,7 @@ Copyright (C)  2021 Rage Uday Kiran
 from PAMI.highUtilityPattern.basic import abstract as _ab
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
 from deprecated import deprecated
+import numpy as _np
 
 
 class _Transaction:
@@ -307,6 +308,104 @@ class _Dataset:
         return self.transactions
 
 
+def _flatten(starts: _np.ndarray, ends: _np.ndarray) -> Tuple[_np.ndarray, _np.ndarray]:
+    """
+    Lists the positions of the ranges [starts[i], ends[i]) one range after the other
+
+    :param starts: first position of every range
+    :type starts: numpy.ndarray
+    :param ends: position following the last position of every range
+    :type ends: numpy.ndarray
+    :return: the range of every position and the positions
+    :rtype: tuple
+    """
+    lengths = ends - starts
+    rows = _np.repeat(_np.arange(len(starts)), lengths)
+    firsts = _np.cumsum(lengths) - lengths
+    return rows, starts[rows] + _np.arange(len(rows)) - firsts[rows]
+
+
+def _withinRows(rows: _np.ndarray, values: _np.ndarray) -> _np.ndarray:
+    """
+    Sums the values preceding every value in its range. The values of a range must be consecutive.
+
+    :param rows: range of every value
+    :type rows: numpy.ndarray
+    :param values: the values
+    :type values: numpy.ndarray
+    :return: sum of the values preceding every value in its range
+    :rtype: numpy.ndarray
+    """
+    before = _np.cumsum(values) - values
+    return before - before[_np.searchsorted(rows, rows)]
+
+
+def _rowTotals(rows: _np.ndarray, values: _np.ndarray, numRows: int) -> _np.ndarray:
+    """
+    Sums the values of every range. The values of a range must be consecutive and no range may be empty.
+
+    :param rows: range of every value
+    :type rows: numpy.ndarray
+    :param values: the values
+    :type values: numpy.ndarray
+    :param numRows: number of ranges
+    :type numRows: int
+    :return: sum of the values of every range
+    :rtype: numpy.ndarray
+    """
+    cumulative = _np.cumsum(values)
+    totals = cumulative[_np.searchsorted(rows, _np.arange(numRows), 'right') - 1]
+    totals[1:] -= totals[:-1].copy()
+    return totals
+
+
+class _TransactionStore:
+    """
+    Stores the items and utilities of all the transactions in two contiguous arrays. A transaction, or a projection
+    of a transaction, is the range [start, end) of the arrays, so projecting a transaction only moves its start.
+    The transactions created by merging are stacked on top of the arrays and are removed again once the projected
+    database containing them has been mined.
+
+    :Attributes:
+
+        items : numpy.ndarray
+            items of the transactions, sorted in every transaction
+        utilities : numpy.ndarray
+            utility of every item
+        hashes : numpy.ndarray
+            random 64 bit code of every item, used to find identical transactions
+        top : int
+            number of used entries of the arrays
+    """
+
+    def __init__(self, items: _np.ndarray, utilities: _np.ndarray, numItems: int) -> None:
+        self.items = items
+        self.utilities = utilities
+        self.hashes = _np.random.default_rng(0).integers(0, 2 ** 63, numItems + 1, dtype=_np.uint64)
+        self.top = len(items)
+
+    def push(self, items: _np.ndarray, utilities: _np.ndarray) -> int:
+        """
+        Stacks transactions on top of the arrays
+
+        :param items: items of the transactions
+        :type items: numpy.ndarray
+        :param utilities: utilities of the items
+        :type utilities: numpy.ndarray
+        :return: position of the first pushed entry
+        :rtype: int
+        """
+        start, end = self.top, self.top + len(items)
+        if end > len(self.items):
+            capacity = max(end, 2 * len(self.items))
+            self.items = _np.concatenate((self.items[:start], _np.zeros(capacity - start, self.items.dtype)))
+            self.utilities = _np.concatenate((self.utilities[:start], _np.zeros(capacity - start, self.utilities.dtype)))
+        self.items[start:end] = items
+        self.utilities[start:end] = utilities
+        self.top = end
+        return start
+
+
 class EFIM(_ab._utilityPatterns):
     """
     :Description:   EFIM is one of the fastest algorithm to mine High Utility ItemSets from transactional databases.
@@ -365,8 +464,9 @@ class EFIM(_ab._utilityPatterns):
 
     :Methods :
 
-        mine()
-                Mining process will start from here
+        mine(storage='arrays')
+                Mining process will start from here. storage='arrays' keeps the database in contiguous arrays and
+                merges identical projected transactions by hashing, storage='objects' uses a _Transaction per transaction
         getPatterns()
                 Complete set of patterns will be retrieved with this function
         save(oFile)
@@ -498,15 +598,38 @@ class EFIM(_ab._utilityPatterns):
         """
         self.mine()
 
-    def mine(self) -> None:
+    def mine(self, storage: str = 'arrays') -> None:
         """
         Start the EFIM algorithm.
+        :param storage: 'arrays' stores the database in contiguous arrays and projects a transaction by moving
+            its offset, while 'objects' creates a _Transaction object for every transaction and projection.
+        :type storage: str
         :return: None
         """
+        if storage not in ('arrays', 'objects'):
+            raise ValueError("storage must be either 'arrays' or 'objects'")
         self._startTime = _ab._time.time()
+        self._minUtil = int(self._minUtil)
+        self._finalPatterns = {}
+        if storage == 'arrays':
+            self._mineArrays()
+        else:
+            self._mineObjects()
+        self._endTime = _ab._time.time()
+        process = _ab._psutil.Process(_ab._os.getpid())
+        self._memoryUSS = float()
+        self._memoryRSS = float()
+        self._memoryUSS = process.memory_full_info().uss
+        self._memoryRSS = process.memory_info().rss
+        print("High Utility patterns were generated successfully using EFIM algorithm")
+
+    def _mineObjects(self) -> None:
+        """
+        Mines the patterns with a _Transaction object for every transaction
+        :return: None
+        """
         self._dataset = _Dataset(self._iFile, self._sep)
         self._useUtilityBinArrayToCalculateLocalUtilityFirstTime(self._dataset)
-        self._minUtil = int(self._minUtil)
         itemsToKeep = []
         for key in self._utilityBinArrayLU.keys():
             if self._utilityBinArrayLU[key] >= self._minUtil:
@@ -532,13 +655,193 @@ class EFIM(_ab._utilityPatterns):
             if self._utilityBinArraySU[item] >= self._minUtil:
                 itemsToExplore.append(item)
         self._backTrackingEFIM(self._dataset.getTransactions(), itemsToKeep, itemsToExplore, 0)
-        self._endTime = _ab._time.time()
-        process = _ab._psutil.Process(_ab._os.getpid())
-        self._memoryUSS = float()
-        self._memoryRSS = float()
-        self._memoryUSS = process.memory_full_info().uss
-        self._memoryRSS = process.memory_info().rss
-        print("High Utility patterns were generated successfully using EFIM algorithm")
+
+    def _mineArrays(self) -> None:
+        """
+        Mines the patterns with the database stored in a _TransactionStore
+        :return: None
+        """
+        try:
+            compactDatabase = _ab._compactDatabase.load(self._iFile, self._sep, 'utility')
+        except IOError:
+            print("File Not Found")
+            quit()
+        items = compactDatabase.items.astype(_np.int64)
+        utilities = compactDatabase.utilities
+        transactionUtilities = compactDatabase.transactionUtilities
+        rows = compactDatabase.getTransactionIds()
+        # the local utility of an item in the database is its transaction-weighted utility
+        localUtility = _np.bincount(items, transactionUtilities[rows], minlength=compactDatabase.getItemCount())
+        itemsToKeep = _np.flatnonzero(localUtility >= self._minUtil)
+        itemsToKeep = itemsToKeep[_np.argsort(localUtility[itemsToKeep], kind='stable')]
+        newNames = _np.zeros(compactDatabase.getItemCount(), dtype=_np.int64)
+        newNames[itemsToKeep] = _np.arange(1, len(itemsToKeep) + 1)
+        self._itemNames = [None] + compactDatabase.decode(itemsToKeep.tolist())
+        # rests holds the part of the transaction utility that is not the utility of a promising item
+        keep = newNames[items] > 0
+        rests = transactionUtilities - _np.bincount(rows[keep], utilities[keep], minlength=len(compactDatabase))
+        order = _np.lexsort((newNames[items][keep], rows[keep]))
+        rows, items, utilities = rows[keep][order], newNames[items][keep][order], utilities[keep][order]
+        lengths = _np.bincount(rows, minlength=len(compactDatabase))
+        nonEmpty = lengths > 0
+        ends = _np.cumsum(lengths)[nonEmpty]
+        starts = ends - lengths[nonEmpty]
+        self._store = _TransactionStore(items, utilities, len(itemsToKeep))
+        if len(starts) == 0:
+            return
+        entries = _flatten(starts, ends)
+        hashes = _rowTotals(entries[0], self._store.hashes[items], len(starts))
+        database = self._mergeArrays(starts, ends, _np.zeros(len(starts)), rests[nonEmpty], hashes)
+        entries = _flatten(database[0], database[1])
+        itemsToKeep = _np.arange(1, len(itemsToKeep) + 1)
+        subtreeUtility, _ = self._upperBoundsArrays(database, entries, itemsToKeep)
+        itemsToExplore = itemsToKeep[subtreeUtility[itemsToKeep] >= self._minUtil]
+        self._backTrackingArrays(database, entries, itemsToKeep, itemsToExplore, 0)
+
+    def _mergeArrays(self, starts: _np.ndarray, ends: _np.ndarray, prefixUtilities: _np.ndarray, rests: _np.ndarray,
+                     hashes: _np.ndarray) -> tuple:
+        """
+        Merges the identical transactions of a projected database. The transactions are grouped on the hash codes of
+        their items, the items of a group are compared with those of its first transaction, and the identical
+        transactions are replaced by one transaction, pushed on the store, holding the sums of their utilities.
+        :param starts: first position of every transaction
+        :type starts: numpy.ndarray
+        :param ends: position following the last item of every transaction
+        :type ends: numpy.ndarray
+        :param prefixUtilities: utility of the prefix in every transaction
+        :type prefixUtilities: numpy.ndarray
+        :param rests: utility of the transaction not held by its items
+        :type rests: numpy.ndarray
+        :param hashes: sum of the hash codes of the items of every transaction
+        :type hashes: numpy.ndarray
+        :return: the starts, ends, prefix utilities and rests of the merged database
+        :rtype: tuple
+        """
+        order = _np.argsort(hashes, kind='stable')
+        sortedHashes = hashes[order]
+        firstOfGroup = _np.concatenate(([True], sortedHashes[1:] != sortedHashes[:-1]))
+        if firstOfGroup.all():
+            return starts, ends, prefixUtilities, rests
+        representatives = order[_np.flatnonzero(firstOfGroup)[_np.cumsum(firstOfGroup) - 1]]
+        candidates = _np.flatnonzero(~firstOfGroup)
+        members, representatives = order[candidates], representatives[candidates]
+        equal = (ends[members] - starts[members]) == (ends[representatives] - starts[representatives])
+        members, representatives = members[equal], representatives[equal]
+        memberRows, memberPositions = _flatten(starts[members], ends[members])
+        _, representativePositions = _flatten(starts[representatives], ends[representatives])
+        store = self._store
+        different = store.items[memberPositions] != store.items[representativePositions]
+        equal = _np.bincount(memberRows, different, minlength=len(members)) == 0
+        members, representatives = members[equal], representatives[equal]
+        if len(members) == 0:
+            return starts, ends, prefixUtilities, rests
+        merged = _np.unique(representatives)
+        target = _np.searchsorted(merged, representatives)
+        lengths = ends[merged] - starts[merged]
+        mergedEnds = _np.cumsum(lengths)
+        mergedStarts = mergedEnds - lengths
+        _, positions = _flatten(starts[merged], ends[merged])
+        mergedUtilities = store.utilities[positions]
+        memberRows, memberPositions = _flatten(starts[members], ends[members])
+        offsets = memberPositions - starts[members][memberRows] + mergedStarts[target][memberRows]
+        _np.add.at(mergedUtilities, offsets, store.utilities[memberPositions])
+        base = store.push(store.items[positions], mergedUtilities)
+        mergedPrefixUtilities = prefixUtilities[merged].copy()
+        _np.add.at(mergedPrefixUtilities, target, prefixUtilities[members])
+        mergedRests = rests[merged].copy()
+        _np.add.at(mergedRests, target, rests[members])
+        single = _np.ones(len(starts), dtype=bool)
+        single[merged] = False
+        single[members] = False
+        return (_np.concatenate((starts[single], mergedStarts + base)),
+                _np.concatenate((ends[single], mergedEnds + base)),
+                _np.concatenate((prefixUtilities[single], mergedPrefixUtilities)),
+                _np.concatenate((rests[single], mergedRests)))
+
+    def _upperBoundsArrays(self, database: tuple, entries: tuple, itemsToKeep: _np.ndarray) -> tuple:
+        """
+        Calculates the subtree utility and the local utility of the items to keep in a projected database
+        :param database: the starts, ends, prefix utilities and rests of the transactions
+        :type database: tuple
+        :param entries: the transaction and the position of every item of the database, as returned by _flatten()
+        :type entries: tuple
+        :param itemsToKeep: the promising items
+        :type itemsToKeep: numpy.ndarray
+        :return: the subtree utility and the local utility of every item
+        :rtype: tuple
+        """
+        starts, ends, prefixUtilities, rests = database
+        rows, positions = entries
+        store = self._store
+        items = store.items[positions]
+        utilities = store.utilities[positions]
+        keep = _np.zeros(len(self._itemNames), dtype=bool)
+        keep[itemsToKeep] = True
+        keep = keep[items]
+        transactionUtilities = rests + _rowTotals(rows, utilities, len(starts)) + prefixUtilities
+        keptUtilities = _np.where(keep, utilities, 0)
+        remainingUtilities = _rowTotals(rows, keptUtilities, len(starts))[rows] - _withinRows(rows, keptUtilities)
+        rows, items = rows[keep], items[keep]
+        subtreeUtility = _np.bincount(items, remainingUtilities[keep] + prefixUtilities[rows],
+                                      minlength=len(self._itemNames))
+        localUtility = _np.bincount(items, transactionUtilities[rows], minlength=len(self._itemNames))
+        return subtreeUtility, localUtility
+
+    def _backTrackingArrays(self, database: tuple, entries: tuple, itemsToKeep: _np.ndarray,
+                            itemsToExplore: _np.ndarray, prefixLength: int) -> None:
+        """
+        A method to mine the HUIs recursively with the database stored in a _TransactionStore
+        :param database: the starts, ends, prefix utilities and rests of the transactions containing the prefix
+        :type database: tuple
+        :param entries: the transaction and the position of every item of the database, as returned by _flatten()
+        :type entries: tuple
+        :param itemsToKeep: the secondary items in the projected database
+        :type itemsToKeep: numpy.ndarray
+        :param itemsToExplore: the primary items in the projected database
+        :type itemsToExplore: numpy.ndarray
+        :param prefixLength: current prefixLength
+        :type prefixLength: int
+        :return: None
+        """
+        starts, ends, prefixUtilities, rests = database
+        rows, positions = entries
+        store = self._store
+        self._candidateCount += len(itemsToExplore)
+        items = store.items[positions]
+        utilities = store.utilities[positions]
+        codes = store.hashes[items]
+        # hash code of the items following every item of its transaction
+        followingCodes = _rowTotals(rows, codes, len(starts))[rows] - _withinRows(rows, codes) - codes
+        order = _np.argsort(items, kind='stable')
+        lows = _np.searchsorted(items[order], itemsToExplore)
+        highs = _np.searchsorted(items[order], itemsToExplore, 'right')
+        for e, low, high in zip(itemsToExplore.tolist(), lows.tolist(), highs.tolist()):
+            selected = order[low:high]
+            transactions = rows[selected]
+            utilityPe = float(utilities[selected].sum() + prefixUtilities[transactions].sum())
+            self._temp[prefixLength] = e
+            if utilityPe >= self._minUtil:
+                self._patternCount += 1
+                pattern = "\t".join(self._itemNames[item] for item in self._temp[:prefixLength + 1])
+                self._finalPatterns[pattern] = str(int(utilityPe)) if utilityPe.is_integer() else str(utilityPe)
+            projected = positions[selected] + 1 < ends[transactions]
+            selected, transactions = selected[projected], transactions[projected]
+            if len(selected) == 0:
+                continue
+            top = store.top
+            projectedDatabase = self._mergeArrays(positions[selected] + 1, ends[transactions],
+                                                  prefixUtilities[transactions] + utilities[selected],
+                                                  rests[transactions], followingCodes[selected])
+            projectedEntries = _flatten(projectedDatabase[0], projectedDatabase[1])
+            newItemsToKeep = itemsToKeep[itemsToKeep > e]
+            subtreeUtility, localUtility = self._upperBoundsArrays(projectedDatabase, projectedEntries, newItemsToKeep)
+            explore = subtreeUtility[newItemsToKeep] >= self._minUtil
+            newItemsToExplore = newItemsToKeep[explore]
+            newItemsToKeep = newItemsToKeep[explore | (localUtility[newItemsToKeep] >= self._minUtil)]
+            if len(newItemsToExplore) > 0:
+                self._backTrackingArrays(projectedDatabase, projectedEntries, newItemsToKeep, newItemsToExplore,
+                                         prefixLength + 1)
+            store.top = top
 
     def _backTrackingEFIM(self, transactionsOfP: list, itemsToKeep: list, itemsToExplore: list, prefixLength: int) -> None:
         """
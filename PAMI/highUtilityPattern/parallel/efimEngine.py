@@ -0,0 +1,333 @@
+# efimEngine is the mining engine of efimParallel. The utility database is kept in three flat arrays (the items and
+# utilities of all transactions and the offsets of the transactions), and a projected database is described by three
+# index arrays: the transactions containing the prefix, the position following the prefix in every transaction and the
+# utility of the prefix in every transaction. With several workers, the arrays of the database are placed in shared
+# memory and a persistent pool of processes mines the search space depth-first. A worker gives the shallowest node of
+# its stack to the pool whenever another worker is idle, so only these small descriptors are ever pickled.
+#
+# **Importing this module into a python program**
+#
+#             from PAMI.highUtilityPattern.parallel import efimEngine
+#
+#             database = efimEngine.readDatabase('utilityDB.txt', '\t', 35)
+#
+#             patterns = efimEngine.mine(database, 35, numWorkers=4)     # {(item, item, ...): utility}
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import multiprocessing as _mp
+import traceback as _traceback
+from multiprocessing import shared_memory as _sharedMemory
+from typing import Dict, List, Tuple, Union
+import numpy as _np
+import pandas as _pd
+from PAMI.extras.dbLoader import compactDatabase as _compactDatabase
+from PAMI.highUtilityPattern.basic.EFIM import _flatten, _withinRows
+
+
+class UtilityDatabase:
+    """
+    A utility database stored in flat arrays. Items are renamed to 0, 1, ... in ascending order of their
+    transaction-weighted utility (TWU), and the items of every transaction are sorted on their new names.
+
+    :Attributes:
+
+        items : numpy.ndarray
+            items of all the transactions, one transaction after the other
+        utilities : numpy.ndarray
+            utility of every entry of items
+        offsets : numpy.ndarray
+            transaction t occupies the entries offsets[t] to offsets[t + 1] - 1
+        itemNames : list
+            name of every item
+    """
+
+    def __init__(self, items: _np.ndarray, utilities: _np.ndarray, offsets: _np.ndarray, itemNames: List[str]) -> None:
+        self.items = items
+        self.utilities = utilities
+        self.offsets = offsets
+        self.itemNames = itemNames
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+
+def readDatabase(iFile: Union[str, _pd.DataFrame], sep: str, minUtil: int) -> UtilityDatabase:
+    """
+    Reads a utility database in which every line is items:transactionUtility:utilities. Items whose TWU is below
+    minUtil are removed, and transactions consisting of the same items are merged by adding their utilities.
+
+    :param iFile: name of the input file, its URL or a data frame
+    :type iFile: str or pandas.DataFrame
+    :param sep: separator of the items and of the utilities
+    :type sep: str
+    :param minUtil: minimum utility
+    :type minUtil: int
+    :return: the database
+    :rtype: UtilityDatabase
+    """
+    try:
+        database = _compactDatabase.load(iFile, sep, 'utility')
+    except IOError:
+        print("File Not Found")
+        quit()
+    tids = database.getTransactionIds()
+    items = database.items.astype(_np.int64)
+    twu = _np.bincount(items, database.transactionUtilities[tids], minlength=database.getItemCount())
+    promising = _np.flatnonzero(twu >= minUtil)
+    promising = promising[_np.argsort(twu[promising], kind='stable')]
+    itemNames = database.decode(promising.tolist())
+    rename = _np.full(database.getItemCount(), -1, dtype=_np.int64)
+    rename[promising] = _np.arange(len(promising))
+    keep = rename[items] >= 0
+    tids, items, utilities = tids[keep], rename[items[keep]], database.utilities[keep]
+    order = _np.lexsort((items, tids))
+    tids, items, utilities = tids[order], items[order], utilities[order]
+    ends = _np.cumsum(_np.bincount(tids, minlength=len(database)))
+    starts = _np.concatenate(([0], ends[:-1]))
+    merged = {}
+    for start, end in zip(starts.tolist(), ends.tolist()):
+        if start == end:
+            continue
+        key = items[start:end].tobytes()
+        if key in merged:
+            merged[key][1] += utilities[start:end]
+        else:
+            merged[key] = [items[start:end], utilities[start:end].copy()]
+    offsets = _np.zeros(len(merged) + 1, dtype=_np.int64)
+    _np.cumsum([len(transaction) for transaction, _ in merged.values()], out=offsets[1:])
+    if merged:
+        items = _np.concatenate([transaction for transaction, _ in merged.values()]).astype(_np.int32)
+        utilities = _np.concatenate([value for _, value in merged.values()])
+    else:
+        items, utilities = _np.zeros(0, dtype=_np.int32), _np.zeros(0)
+    return UtilityDatabase(items, utilities, offsets, itemNames)
+
+
+class _Engine:
+    """
+    Expands the nodes of the search space. A node is a tuple (prefix, tids, positions, prefixUtilities, keep) where
+    keep marks the items that may still extend the prefix (the secondary items of EFIM).
+    """
+
+    def __init__(self, items: _np.ndarray, utilities: _np.ndarray, offsets: _np.ndarray, minUtil: int) -> None:
+        self._items = items
+        self._utilities = utilities
+        self._ends = offsets[1:]
+        self._numItems = int(items.max()) + 1 if len(items) else 0
+        self._minUtil = minUtil
+
+    def root(self) -> tuple:
+        """
+        :return: the node of the empty prefix
+        :rtype: tuple
+        """
+        n = len(self._ends)
+        starts = _np.concatenate(([0], self._ends[:-1])).astype(_np.int64) if n else _np.zeros(0, _np.int64)
+        return (), _np.arange(n, dtype=_np.int64), starts, _np.zeros(n), \
+            _np.ones(self._numItems, dtype=bool)
+
+    def expand(self, node: tuple) -> Tuple[float, list]:
+        """
+        Computes the utility of the prefix of a node and the nodes of its promising extensions
+
+        :param node: the node to expand
+        :type node: tuple
+        :return: the utility of the prefix and the child nodes
+        :rtype: tuple
+        """
+        prefix, tids, positions, prefixUtilities, keep = node
+        utility = float(prefixUtilities.sum())
+        rows, entries = _flatten(positions, self._ends[tids])
+        if len(rows) == 0:
+            return utility, []
+        entryItems = self._items[entries]
+        mask = keep[entryItems]
+        rows, entries, entryItems = rows[mask], entries[mask], entryItems[mask]
+        if len(rows) == 0:
+            return utility, []
+        entryUtilities = self._utilities[entries]
+        # remaining utility of every transaction and utility of the entries preceding an entry in its transaction
+        remaining = _np.bincount(rows, entryUtilities, minlength=len(tids))
+        before = _withinRows(rows, entryUtilities)
+        bound = remaining[rows] + prefixUtilities[rows]
+        localUtility = _np.bincount(entryItems, bound, minlength=self._numItems)
+        subtreeUtility = _np.bincount(entryItems, bound - before, minlength=self._numItems)
+        primary = _np.flatnonzero(subtreeUtility >= self._minUtil)
+        secondary = keep if not prefix else localUtility >= self._minUtil
+        order = _np.argsort(entryItems, kind='stable')
+        sortedItems = entryItems[order]
+        children = []
+        for item in primary.tolist():
+            selected = order[_np.searchsorted(sortedItems, item):_np.searchsorted(sortedItems, item, 'right')]
+            childRows = rows[selected]
+            children.append((prefix + (item,), tids[childRows], entries[selected] + 1,
+                              prefixUtilities[childRows] + entryUtilities[selected], secondary))
+        return utility, children
+
+
+def _depthFirst(engine: _Engine, stack: list, patterns: Dict[tuple, int], step=None) -> None:
+    """
+    Mines the nodes of a stack depth-first. step(stack) is called after every node, e.g., to give nodes of the stack
+    to another worker.
+    """
+    while stack:
+        node = stack.pop()
+        utility, children = engine.expand(node)
+        if node[0] and utility >= engine._minUtil:
+            patterns[node[0]] = utility
+        stack.extend(reversed(children))
+        if step is not None:
+            step(stack)
+
+
+def _attach(descriptor: tuple) -> Tuple[_sharedMemory.SharedMemory, _np.ndarray]:
+    """
+    Attaches to an array placed in shared memory by _share()
+    """
+    name, dtype, length = descriptor
+    block = _sharedMemory.SharedMemory(name=name)
+    return block, _np.ndarray((length,), dtype=dtype, buffer=block.buf)
+
+
+def _share(array: _np.ndarray) -> Tuple[_sharedMemory.SharedMemory, tuple]:
+    """
+    Copies an array into a new block of shared memory
+    """
+    block = _sharedMemory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    _np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[:] = array
+    return block, (block.name, array.dtype.str, len(array))
+
+
+def _worker(arrays: list, minUtil: int, tasks, results, idle, batchSize: int) -> None:
+    """
+    Worker process of the pool. idle counts the idle workers minus the queued nodes, so a worker gives away the
+    shallowest node of its stack while idle is positive.
+    """
+    blocks, views, engine = [], [], None
+    try:
+        for descriptor in arrays:
+            block, view = _attach(descriptor)
+            blocks.append(block)
+            views.append(view)
+        engine = _Engine(views[0], views[1], views[2], minUtil)
+        patterns = {}
+
+        def step(stack):
+            if len(stack) > 1 and idle.value > 0:
+                with idle.get_lock():
+                    steal = idle.value > 0
+                    if steal:
+                        idle.value -= 1
+                if steal:
+                    results.put(('node', stack.pop(0)))
+            if len(patterns) >= batchSize:
+                results.put(('patterns', dict(patterns)))
+                patterns.clear()
+
+        while True:
+            with idle.get_lock():
+                idle.value += 1
+            node = tasks.get()
+            if node is None:
+                break
+            _depthFirst(engine, [node], patterns, step)
+            results.put(('done', dict(patterns)))
+            patterns.clear()
+    except Exception:
+        results.put(('error', _traceback.format_exc()))
+    finally:
+        del engine, views
+        for block in blocks:
+            block.close()
+
+
+def mine(database: UtilityDatabase, minUtil: int, numWorkers: int = 1, batchSize: int = 10000) -> Dict[tuple, int]:
+    """
+    Mines the high utility itemsets of a database
+
+    :param database: the database returned by readDatabase()
+    :type database: UtilityDatabase
+    :param minUtil: minimum utility
+    :type minUtil: int
+    :param numWorkers: number of worker processes. With one worker, the patterns are mined in the calling process.
+    :type numWorkers: int
+    :param batchSize: number of patterns a worker sends to the calling process at a time
+    :type batchSize: int
+    :return: the utility of every high utility itemset, given as a tuple of item names. Whole utilities are ints.
+    :rtype: dict
+    """
+    if numWorkers < 1:
+        raise ValueError("numWorkers must be at least 1")
+    engine = _Engine(database.items, database.utilities, database.offsets, minUtil)
+    patterns = {}
+    if numWorkers == 1 or len(database) == 0:
+        _depthFirst(engine, [engine.root()], patterns)
+    else:
+        _, children = engine.expand(engine.root())
+        _mineInPool(database, minUtil, children, numWorkers, batchSize, patterns)
+    names = database.itemNames
+    return {tuple(names[i] for i in pattern): int(utility) if utility.is_integer() else utility
+            for pattern, utility in patterns.items()}
+
+
+def _mineInPool(database: UtilityDatabase, minUtil: int, nodes: list, numWorkers: int, batchSize: int,
+                patterns: Dict[tuple, int]) -> None:
+    """
+    Mines the subtrees of nodes with a pool of processes sharing the arrays of the database
+    """
+    context = _mp.get_context()
+    shared = [_share(array) for array in (database.items, database.utilities, database.offsets)]
+    tasks, results = context.Queue(), context.Queue()
+    idle = context.Value('i', 0)
+    workers = [context.Process(target=_worker, daemon=True,
+                               args=([descriptor for _, descriptor in shared], minUtil, tasks, results, idle,
+                                     batchSize)) for _ in range(numWorkers)]
+    try:
+        for worker in workers:
+            worker.start()
+        with idle.get_lock():
+            idle.value -= len(nodes)
+        for node in nodes:
+            tasks.put(node)
+        pending = len(nodes)
+        while pending:
+            kind, value = results.get()
+            if kind == 'node':
+                # the donor has already counted this node in idle
+                tasks.put(value)
+                pending += 1
+            elif kind == 'error':
+                raise RuntimeError("An efimParallel worker failed:\n" + value)
+            else:
+                patterns.update(value)
+                if kind == 'done':
+                    pending -= 1
+        for _ in workers:
+            tasks.put(None)
+        for worker in workers:
+            worker.join()
+    finally:
+        for worker in workers:
+            if worker.is_alive():
+                worker.terminate()
+        for block, _ in shared:
+            block.close()
+            block.unlink()
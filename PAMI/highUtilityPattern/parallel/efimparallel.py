@@ -53,11 +53,10 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 import os
-import mmap
 import time
 import psutil
-from joblib import Parallel, delayed
 from deprecated import deprecated
+from PAMI.highUtilityPattern.parallel import efimEngine as _efimEngine
 
 
 from PAMI.highUtilityPattern.parallel import abstract as _ab
@@ -90,7 +89,9 @@ class efimParallel(_ab._utilityPatterns):
         sep (str):
             The separator used in the input file.
         threads (int):
-            The number of threads to use.
+            The number of worker processes. The database is placed in shared memory and the workers mine the
+            projected databases depth-first, handing nodes to idle workers. With one worker, the patterns are mined
+            in the calling process.
         Patterns (dict):
             A dictionary containing the discovered patterns.
         rename (dict):
@@ -104,14 +105,6 @@ class efimParallel(_ab._utilityPatterns):
 
     :Methods:
 
-        read_file():
-            Read the input file and return the filtered transactions, primary items, and secondary items.
-        binarySearch(arr, item):
-            Perform a binary search on the given array to find the given item.
-        project(beta, file_data, secondary):
-            Project the given beta itemset on the given database.
-        search(collections):
-            Search for high utility itemsets in the given collections.
         mine():
             Start the EFIM algorithm.
         savePatterns(outputFile):
@@ -138,252 +131,6 @@ class efimParallel(_ab._utilityPatterns):
         self.rename = {}
         self.threads = threads
 
-    # Read input file
-    def _read_file(self):
-        """
-        Read the input file and return the filtered transactions, primary items, and secondary items.
-
-        :return:
-
-            filtered_transactions (dict): A dictionary containing the filtered transactions.
-            primary (set): A set containing the primary items.
-            secondary (set): A set containing the secondary items.
-        """
-
-
-        file_data = []
-        twu = {}
-
-        with open(self.inputFile, 'r') as f:
-            fd = mmap.mmap(f.fileno(), 0, prot=mmap.PROT_READ)
-
-            for line in iter(fd.readline, b""):
-                line = line.decode('utf-8').strip().split(":")
-                
-                # Parse and process the line
-                line = [x.split(self.sep) for x in line]
-                weight = int(line[1][0])
-
-                # Update file data with the parsed items
-                file_data.append([line[0], [int(x) for x in line[2]]])
-
-                for k in line[0]:
-                    if k not in twu:
-                        twu[k] = weight
-                    else:
-                        twu[k] += weight
-
-        # Filter TWU dictionary based on minUtil (minimum utility threshold)
-        twu = {k: v for k, v in twu.items() if v >= self.minUtil}
-
-        # Sort TWU items by utility
-        twu = {k: v for k, v in sorted(twu.items(), key=lambda item: item[1], reverse=True)}
-
-        strToInt = {}
-        t = len(twu)
-        for k in twu.keys():
-            strToInt[k] = t
-            self.rename[t] = k
-            t -= 1
-
-        secondary = set(self.rename.keys())
-
-        # Filter and sort transactions
-        subtree = {}
-        filtered_transactions = {}
-        for col in file_data:
-            zipped = zip(col[0], col[1])
-            transaction = [(strToInt[x], y) for x, y in zipped if x in strToInt]
-            transaction = sorted(transaction, key=lambda x: x[0])
-            if len(transaction) > 0:
-                val = [x[1] for x in transaction]
-                key = [x[0] for x in transaction]
-                
-                fs = frozenset(key)
-
-                if fs not in filtered_transactions:
-                    filtered_transactions[fs] = [key, val, 0]
-                else:
-                    filtered_transactions[fs][1] = [x + y for x, y in zip(filtered_transactions[fs][1], val)]
-
-                subUtil = sum([x[1] for x in transaction])
-                temp = 0
-
-                for i in range(len(transaction)):
-                    item = key[i]
-                    if item not in subtree:
-                        subtree[item] = subUtil - temp
-                    else:
-                        subtree[item] += subUtil - temp
-                    temp += val[i]
-
-        primary = [key for key in subtree.keys() if subtree[key] >= self.minUtil]
-
-        return filtered_transactions, primary, secondary
-    
-
-    def _binarySearch(self, arr, item):
-        """
-        Do a binary search on the given array to find the given item.
-
-        :param arr: The array to search in
-
-        :type arr: list
-
-        :param item: The item to search for
-
-        :type item: int
-
-        :return:
-
-            mid (int):
-                The index of the item if found, -1 otherwise.
-
-        """
-
-        low = 0
-        high = len(arr) - 1
-        mid = 0
-
-        while low <= high:
-            mid = (high + low) // 2
-            if arr[mid] < item:
-                low = mid + 1
-            elif arr[mid] > item:
-                high = mid - 1
-            else:
-                return mid
-
-        return -1
-
-    def _project(self, beta, file_data, secondary):
-        """
-        Project the given beta itemset on the given database.
-
-        :param beta: The beta itemset to project
-
-        :type beta: list
-
-        :param file_data: The database to project on
-
-        :type file_data: dict
-
-        :param secondary: The set of secondary items
-
-        :type secondary: set
-
-        :return:
-
-            projected_db (dict): The projected database.
-            local_utils (dict): The local utilities of the projected database.
-            subtree_utils (dict): The subtree utilities of the projected database.
-            utility (int): The utility of the projected database.
-
-        """
-
-
-        projected_db = {}
-        local_utils = {}
-        subtree_utils = {}
-        utility = 0     
-
-        added = set()
-
-        item = beta[-1]
-
-        temp = [v for k, v in file_data.items() if item in k]
-        start = time.time()
-
-        for v in temp:
-            index = self._binarySearch(v[0], item)
-
-            curr = v[1][index] + v[2]
-            utility += curr
-
-            newKey = []
-            newVal = []
-
-            for i in range(index+1, len(v[0])):
-                if v[0][i] in secondary:
-                    newKey.append(v[0][i])
-                    newVal.append(v[1][i])
-
-            if len(newKey) == 0:
-                continue
-
-            s = sum(newVal)
-            temp = 0
-
-            for i in range(len(newKey)):
-                if newKey[i] in added:
-                    local_utils[newKey[i]] += s + curr
-                    subtree_utils[newKey[i]] += s + curr - temp
-                else:
-                    local_utils[newKey[i]] = s + curr
-                    subtree_utils[newKey[i]] = s + curr - temp
-                    added.add(newKey[i])
-                
-                temp += newVal[i]
-            
-            fs = frozenset(newKey)
-
-            if fs not in projected_db:
-                projected_db[fs] = [newKey, newVal, curr]
-            else:
-                projected_db[fs][1] = [x + y for x, y in zip(projected_db[fs][1], newVal)]
-                projected_db[fs][2] += curr
-
-        nprimary = [key for key in subtree_utils.keys() if subtree_utils[key] >= self.minUtil]
-        nsecondary = set([key for key in local_utils.keys() if local_utils[key] >= self.minUtil])
-
-        return beta, projected_db, nsecondary, nprimary, utility
-    
-
-    def _search(self, collections):
-
-        """
-        Search for frequent patterns in the given collections.
-
-        :param collections: The collections to search in
-
-        :type collections: list
-        """
-
-        if (self.threads > 1):
-            with Parallel(n_jobs=self.threads) as parallel:
-                while len(collections) > 0:
-                    new_collections = []
-
-                    # print("Num of tasks:", sum(len(collections[i][2]) for i in range(len(collections))))
-                    results = parallel(delayed(self._project)(collections[i][0] + [collections[i][2][j]], collections[i][1], collections[i][3]) for i in range(len(collections)) for j in range(len(collections[i][2])))
-
-                    for i in range(len(results)):
-                        beta, projected_db, secondary, primary, utility = results[i]
-                        if utility >= self.minUtil:
-                            pattern = "\t".join([self.rename[x] for x in beta])
-                            # self.Patterns[tuple(beta)] = utility
-                            self.Patterns[pattern] = utility
-                        if len(primary) > 0:
-                            new_collections.append([beta, projected_db, primary, secondary])
-                    
-                    collections = new_collections
-
-        else:
-            while len(collections) > 0:
-                new_collections = []
-                for i in range(len(collections)):
-                    for j in range(len(collections[i][2])):
-                        beta, projected_db, secondary, primary, utility = self._project(collections[i][0] + [collections[i][2][j]], collections[i][1], collections[i][3])
-                        if utility >= self.minUtil:
-                            pattern = "\t".join([self.rename[x] for x in beta])
-                            # self.Patterns[tuple(beta)] = utility
-                            self.Patterns[pattern] = utility
-                        if len(primary) > 0:
-                            new_collections.append([beta, projected_db, primary, secondary])
-
-                collections = new_collections
-
-
     @deprecated("It is recommended to use 'mine()' instead of 'startMine()' for mining process. Starting from January 2025, 'startMine()' will be completely terminated.")
     def startMine(self):
         """
@@ -401,11 +148,11 @@ class efimParallel(_ab._utilityPatterns):
 
         self.start = time.time()
 
-        fileData, primary, secondary = self._read_file()
-
-        collection = [[[], fileData, primary, secondary]]
-
-        self._search(collection)
+        database = _efimEngine.readDatabase(self.inputFile, self.sep, self.minUtil)
+        self.rename = dict(enumerate(database.itemNames))
+        patterns = _efimEngine.mine(database, self.minUtil, self.threads)
+        self.Patterns = {"\t".join(pattern): utility for pattern, utility in patterns.items()}
+        self._finalPatterns = self.Patterns
 
         self.memoryRSS = ps.memory_info().rss
         self.memoryUSS = ps.memory_full_info().uss
@@ -0,0 +1,522 @@
+# HUPStream discovers high-utility patterns over a sliding window of a data stream. The stream arrives in panes of
+# transactions, which are pushed one at a time, so the stream can be read from a file, an iterator or a socket
+# without loading it first. Every node of the HUS-tree keeps the utility of each pane of the window in a ring
+# buffer, so that a pane expires by clearing its slot in the nodes it touched. When the patterns are requested, only
+# the patterns made of items of the arriving and expiring panes are mined again.
+#
+# **Importing this algorithm into a python program**
+# --------------------------------------------------------
+#
+#             from PAMI.highUtilityPatternsInStreams import HUPStream as alg
+#
+#             obj = alg.HUPStream("input.txt", 100, 5, 1000)    # minUtil 100, 5 panes of 1000 transactions
+#
+#             obj.mine()
+#
+#             Patterns = obj.getPatterns()
+#
+#             print("Total number of Windows Processed:", len(Patterns))
+#
+#             obj.save("output")
+#
+#             stream = alg.HUPStream(None, 100, 5)
+#
+#             for start, end, patterns in stream.stream(socket.makefile(), 1000):
+#
+#                 print(start, end, len(patterns))
+#
+#             memUSS = obj.getMemoryUSS()
+#
+#             print("Total Memory in USS:", memUSS)
+#
+#             memRSS = obj.getMemoryRSS()
+#
+#             print("Total Memory in RSS", memRSS)
+#
+#             run = obj.getRuntime()
+#
+#             print("Total ExecutionTime in seconds:", run)
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from PAMI.highUtilityPatternsInStreams import abstract as _hus
+from deprecated import deprecated
+
+
+class _Node:
+    """
+    A node of the HUS-tree
+
+    :Attributes:
+
+        item : int
+            rank of the item of the node
+
+        parent : _Node
+            parent of the node
+
+        children : dict
+            children of the node by item
+
+        utilities : list
+            ring buffer of the transaction utilities of the node in every pane of the window, indexed by the slot of
+            the pane
+    """
+
+    __slots__ = ('item', 'parent', 'children', 'utilities')
+
+    def __init__(self, item, parent, windowSize):
+        self.item = item
+        self.parent = parent
+        self.children = {}
+        self.utilities = [0] * windowSize
+
+
+class HUPStream(_hus._highUtilityPatternStreamMining):
+    """
+    :Description:   HUPStream discovers the high-utility patterns of a sliding window over a data stream. The window
+                    holds windowSize panes. The transactions of a pane are inserted into a HUS-tree whose nodes keep
+                    the transaction utility of every pane in a ring buffer. The slot of the oldest pane is reused by
+                    the arriving pane: the nodes touched by the oldest pane are recorded with the pane, so only their
+                    slot is cleared, and nodes left without utility are unlinked.
+
+                    The candidates are the itemsets whose transaction-weighted utility in the window reaches minUtil.
+                    They are generated from the conditional pattern bases of the tree, and their exact utility is
+                    computed from the transactions of the window indexed by item. The utility of a pattern changes
+                    only if a transaction containing all its items arrives or expires, so after a slide only the
+                    itemsets made of items of the arriving and expiring panes are mined again. The other patterns of
+                    the previous window are kept.
+
+    :References:   Chowdhury Farhan Ahmed and Syed Khairuzzaman Tanbeer and Byeong-Soo Jeong and Ho-Jin Choi : Interactive
+                   mining of high utility patterns over data streams. Expert Systems with Applications Vol 39, 11979 - 11991, 2012.
+                   https://doi.org/10.1016/j.eswa.2012.03.062
+
+    :param  iFile: str :
+                   Name of the Input file of the stream. None if the panes are pushed by the caller.
+    :param minUtil: int :
+                   Minimum utility threshold
+    :param windowSize: int :
+                   Number of panes of the sliding window
+    :param paneSize: int :
+                   Number of transactions of a pane, used by mine()
+    :param  sep: str :
+                   This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+
+    :Methods:
+
+        push(pane)
+            Adds a pane of transactions to the window, removing the oldest pane when the window is full
+
+        currentPatterns()
+            Returns the high-utility patterns of the current window
+
+        stream(source, paneSize)
+            Reads transactions from an iterable, pushes them in panes and yields the patterns after every pane
+
+        mine()
+            Streams the input file in panes of paneSize transactions and keeps the patterns of every full window
+
+    **Executing the code on terminal:**
+    -------------------------------------
+
+    .. code-block:: console
+
+      Format:
+
+      (.venv) $ python3 HUPStream.py <inputFile> <outputFile> <minUtil> <windowSize> <paneSize> <separator>
+
+      Example Usage:
+
+      (.venv) $ python3 HUPStream.py retail.txt output.txt 107 5 1000 ','
+
+    .. note:: Here minimum utility is 107, the window holds 5 panes of 1000 transactions. The separator is comma for the input file
+
+    **Credits:**
+    -------------
+
+    The code is written under the supervision of Prof. Rage Uday Kiran.
+
+    """
+
+    def __init__(self, iFile, minUtil, windowSize, paneSize=None, sep="\t"):
+        super().__init__(iFile, minUtil, windowSize, paneSize, sep)
+        self._minUtil = float(minUtil)
+        self._windowSize = int(windowSize)
+        self._ranks = {}
+        self._itemNames = []
+        self._root = _Node(None, None, self._windowSize)
+        self._header = {}
+        self._paneNodes = [set() for _ in range(self._windowSize)]
+        self._paneTids = [[] for _ in range(self._windowSize)]
+        self._transactions = {}
+        self._itemTids = {}
+        self._nextTid = 0
+        self._panes = 0
+        self._startIndex = 0
+        self._endIndex = 0
+        self._affected = None
+        self._patterns = {}
+
+    def _parseTransaction(self, transaction):
+        """
+        :param transaction: a line 'items:transaction utility:utilities', a dictionary of the utility of every item,
+            or a pair of the items and their utilities
+        :type transaction: str or dict or tuple
+        :return: the utility of every item and the transaction utility
+        :rtype: tuple
+        """
+        if isinstance(transaction, bytes):
+            transaction = transaction.decode("utf-8")
+        if isinstance(transaction, str):
+            parts = transaction.strip().split(":")
+            items = [x.strip() for x in parts[0].split(self._sep)]
+            utilities = [float(x) for x in parts[2].split(self._sep) if x.strip()]
+            itemUtilities = {}
+            for item, utility in zip(items, utilities):
+                if item:
+                    itemUtilities[item] = itemUtilities.get(item, 0) + utility
+            return itemUtilities, float(parts[1])
+        if isinstance(transaction, dict):
+            return transaction, sum(transaction.values())
+        items, utilities = transaction
+        itemUtilities = {}
+        for item, utility in zip(items, utilities):
+            itemUtilities[item] = itemUtilities.get(item, 0) + utility
+        return itemUtilities, sum(utilities)
+
+    def _rank(self, item):
+        """
+        :return: the rank of an item in the order of the tree, i.e., the order of first appearance in the stream
+        :rtype: int
+        """
+        rank = self._ranks.get(item)
+        if rank is None:
+            rank = self._ranks[item] = len(self._itemNames)
+            self._itemNames.append(item)
+        return rank
+
+    def _expire(self, slot):
+        """
+        Removes the pane of a slot from the tree and from the transactions of the window
+
+        :param slot: slot of the pane in the ring buffers
+        :type slot: int
+        """
+        for node in self._paneNodes[slot]:
+            node.utilities[slot] = 0
+            if not any(node.utilities):
+                if node.parent.children.get(node.item) is node:
+                    del node.parent.children[node.item]
+                nodes = self._header[node.item]
+                nodes.discard(node)
+                if not nodes:
+                    del self._header[node.item]
+        self._paneNodes[slot] = set()
+        for tid in self._paneTids[slot]:
+            for item in self._transactions.pop(tid):
+                tids = self._itemTids[item]
+                tids.discard(tid)
+                if not tids:
+                    del self._itemTids[item]
+        self._paneTids[slot] = []
+
+    def push(self, pane):
+        """
+        Adds a pane of transactions to the window. When the window already holds windowSize panes, the oldest pane
+        expires first.
+
+        :param pane: transactions of the pane, as accepted by the input file, a dictionary of the utility of every
+            item, or a pair of the items and their utilities
+        :type pane: iterable
+        """
+        slot = self._panes % self._windowSize
+        expiring = set()
+        if self._panes >= self._windowSize:
+            for tid in self._paneTids[slot]:
+                expiring.update(self._transactions[tid])
+            self._startIndex += len(self._paneTids[slot])
+            self._expire(slot)
+        touched = self._paneNodes[slot]
+        for transaction in pane:
+            itemUtilities, transactionUtility = self._parseTransaction(transaction)
+            if not itemUtilities:
+                continue
+            ranked = {self._rank(item): utility for item, utility in itemUtilities.items()}
+            tid = self._nextTid
+            self._nextTid += 1
+            self._transactions[tid] = ranked
+            self._paneTids[slot].append(tid)
+            node = self._root
+            for item in sorted(ranked):
+                self._itemTids.setdefault(item, set()).add(tid)
+                child = node.children.get(item)
+                if child is None:
+                    child = node.children[item] = _Node(item, node, self._windowSize)
+                    self._header.setdefault(item, set()).add(child)
+                child.utilities[slot] += transactionUtility
+                touched.add(child)
+                node = child
+            expiring.update(ranked)
+        self._endIndex += len(self._paneTids[slot])
+        self._panes += 1
+        if self._affected is not None:
+            self._affected |= expiring
+
+    def _candidates(self, allowed):
+        """
+        Generates the itemsets of allowed items whose transaction-weighted utility reaches minUtil
+
+        :param allowed: ranks of the items to mine, or None for all the items of the window
+        :type allowed: set
+        :return: the candidates as tuples of ranks in decreasing order
+        :rtype: list
+        """
+        candidates = []
+        for item, nodes in self._header.items():
+            if allowed is not None and item not in allowed:
+                continue
+            base = {}
+            twu = 0
+            for node in nodes:
+                utility = sum(node.utilities)
+                twu += utility
+                path = []
+                parent = node.parent
+                while parent.item is not None:
+                    if allowed is None or parent.item in allowed:
+                        path.append(parent.item)
+                    parent = parent.parent
+                if path:
+                    path = tuple(reversed(path))
+                    base[path] = base.get(path, 0) + utility
+            if twu >= self._minUtil:
+                self._growCandidates((item,), base, candidates)
+        return candidates
+
+    def _growCandidates(self, suffix, base, candidates):
+        """
+        Adds a candidate and the candidates extending it with the items of its conditional pattern base
+
+        :param suffix: the candidate, as ranks in decreasing order
+        :type suffix: tuple
+        :param base: conditional pattern base of the candidate, mapping every prefix path to its utility
+        :type base: dict
+        :param candidates: the candidates found so far
+        :type candidates: list
+        """
+        candidates.append(suffix)
+        twu = {}
+        for path, utility in base.items():
+            for item in path:
+                twu[item] = twu.get(item, 0) + utility
+        for item, utility in twu.items():
+            if utility < self._minUtil:
+                continue
+            newBase = {}
+            for path, pathUtility in base.items():
+                if item in path:
+                    prefix = tuple(x for x in path[:path.index(item)] if twu[x] >= self._minUtil)
+                    if prefix:
+                        newBase[prefix] = newBase.get(prefix, 0) + pathUtility
+            self._growCandidates(suffix + (item,), newBase, candidates)
+
+    def _utility(self, candidate):
+        """
+        :param candidate: ranks of the items of the candidate
+        :type candidate: tuple
+        :return: utility of the candidate in the window
+        :rtype: float
+        """
+        tidSets = sorted((self._itemTids[item] for item in candidate), key=len)
+        tids = tidSets[0].intersection(*tidSets[1:])
+        return sum(sum(self._transactions[tid][item] for item in candidate) for tid in tids)
+
+    def currentPatterns(self):
+        """
+        Returns the high-utility patterns of the current window. Only the itemsets made of items of the panes pushed
+        or expired since the last call are mined again.
+
+        :return: the utility of every pattern, with the items of a pattern in the order of first appearance
+        :rtype: dict
+        """
+        allowed = self._affected
+        if allowed is None:
+            self._patterns = {}
+        else:
+            self._patterns = {pattern: utility for pattern, utility in self._patterns.items()
+                              if not allowed.issuperset(pattern)}
+        for candidate in self._candidates(allowed):
+            utility = self._utility(candidate)
+            if utility >= self._minUtil:
+                self._patterns[tuple(sorted(candidate))] = utility
+        self._affected = set()
+        return {tuple(self._itemNames[item] for item in pattern): utility for pattern, utility in self._patterns.items()}
+
+    def stream(self, source, paneSize):
+        """
+        Reads transactions from an iterable, e.g., an open file, a generator or socket.makefile(), pushes them in
+        panes of paneSize transactions and yields the patterns after every pane. A last incomplete pane is pushed
+        when the source ends.
+
+        :param source: transactions in any format accepted by push()
+        :type source: iterable
+        :param paneSize: number of transactions of a pane
+        :type paneSize: int
+        :return: start index and end index of the window in the stream, and its patterns
+        :rtype: generator
+        """
+        pane = []
+        for transaction in source:
+            if isinstance(transaction, (str, bytes)) and not transaction.strip():
+                continue
+            pane.append(transaction)
+            if len(pane) == paneSize:
+                self.push(pane)
+                pane = []
+                yield self._startIndex, self._endIndex, self.currentPatterns()
+        if pane:
+            self.push(pane)
+            yield self._startIndex, self._endIndex, self.currentPatterns()
+
+    @deprecated("It is recommended to use 'mine()' instead of 'startMine()' for mining process. Starting from January 2025, 'startMine()' will be completely terminated.")
+    def startMine(self):
+        """
+        This function will start the mining process
+        """
+        self.mine()
+
+    def mine(self):
+        """
+        Streams the input file in panes of paneSize transactions. The patterns of every window holding windowSize
+        complete panes are kept in getPatterns().
+        """
+        self._startTime = _hus._time.time()
+        if self._iFile is None:
+            raise Exception("Please enter the file path or file name:")
+        if self._paneSize is None:
+            raise Exception("Please enter the Pane Size")
+        self._finalPatterns = {}
+        paneSize = int(self._paneSize)
+        if _hus._validators.url(self._iFile):
+            source = _hus._urlopen(self._iFile)
+        else:
+            try:
+                source = open(self._iFile, 'r', encoding='utf-8')
+            except IOError:
+                print("File Not Found")
+                quit()
+        with source:
+            for start, end, patterns in self.stream(source, paneSize):
+                if self._panes >= self._windowSize and end - start == self._windowSize * paneSize:
+                    self._finalPatterns[(start, end)] = [[list(pattern), utility] for pattern, utility in
+                                                         patterns.items()]
+        self._endTime = _hus._time.time()
+        process = _hus._psutil.Process(_hus._os.getpid())
+        self._memoryUSS = process.memory_full_info().uss
+        self._memoryRSS = process.memory_info().rss
+
+    def getMemoryRSS(self):
+        """
+        Total amount of RSS memory consumed by the mining process will be retrieved from this function
+
+        :return: returning RSS memory consumed by the mining process
+        :rtype: float
+        """
+        return self._memoryRSS
+
+    def getMemoryUSS(self):
+        """
+        Total amount of USS memory consumed by the mining process will be retrieved from this function
+
+        :return: returning USS memory consumed by the mining process
+        :rtype: float
+        """
+        return self._memoryUSS
+
+    def getPatterns(self):
+        """
+        Returns the patterns of every full window of mine(), by (start index, end index) of the window
+
+        :return: returning the patterns of every window
+        :rtype: dict
+        """
+        return self._finalPatterns
+
+    def getPatternsAsDataFrame(self):
+        """
+        Stores the patterns of every window of mine() in a dataframe.
+
+        :return: returning dataframe containing the patterns of every window
+        :rtype: pandas.DataFrame
+        """
+        data = []
+        for x, y in self._finalPatterns.items():
+            for pattern in y:
+                data.append([x[0], x[1], ' '.join(pattern[0]), pattern[1]])
+        return _hus._pd.DataFrame(data, columns=['Window Start Index', 'Window End Index', 'Pattern', 'Utility'])
+
+    def getRuntime(self):
+        """
+        Total amount of time taken by the mining process will be retrieved from this function
+
+        :return: returning time taken by the mining process
+        :rtype: float
+        """
+        return self._endTime - self._startTime
+
+    def printResults(self):
+        """
+        Prints the results of the mining process
+        """
+        print("Total number of Windows Processed:", len(self.getPatterns()))
+        print("Total Memory in USS:", self.getMemoryUSS())
+        print("Total Memory in RSS", self.getMemoryRSS())
+        print("Total ExecutionTime in ms:", self.getRuntime())
+
+    def save(self, oFile):
+        """
+        The patterns of every window will be loaded in to an output file
+
+        :param oFile: name of the output file
+        :type oFile: str
+        """
+        self._oFile = oFile
+        with open(self._oFile, 'w') as writer:
+            for x, y in self._finalPatterns.items():
+                writer.write("Window Start Index : %s , End Index : %s \n" % (x[0], x[1]))
+                for pattern in y:
+                    writer.write('\t'.join(pattern[0]) + ":" + str(pattern[1]) + "\n")
+
+
+if __name__ == "__main__":
+    _ap = str()
+    if len(_hus._sys.argv) == 6 or len(_hus._sys.argv) == 7:
+        if len(_hus._sys.argv) == 7:
+            _ap = HUPStream(_hus._sys.argv[1], _hus._sys.argv[3], _hus._sys.argv[4], _hus._sys.argv[5], _hus._sys.argv[6])
+        if len(_hus._sys.argv) == 6:
+            _ap = HUPStream(_hus._sys.argv[1], _hus._sys.argv[3], _hus._sys.argv[4], _hus._sys.argv[5])
+        _ap.mine()
+        print("Total number of Windows Processed:", len(_ap.getPatterns()))
+        _ap.save(_hus._sys.argv[2])
+        print("Total Memory in USS:", _ap.getMemoryUSS())
+        print("Total Memory in RSS", _ap.getMemoryRSS())
+        print("Total ExecutionTime in ms:", _ap.getRuntime())
+    else:
+        print("Error! The number of input parameters do not match the total number of parameters provided")
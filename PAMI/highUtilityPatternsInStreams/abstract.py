@@ -29,6 +29,7 @@ import psutil as _psutil
 from array import *
 import functools as _functools
 import sys as _sys
+from PAMI.extras.dbLoader import compactDatabase as _compactDatabase
 
 class _highUtilityPatternStreamMining(_ABC):
     """
@@ -63,6 +63,7 @@ Copyright (C)  2021 Rage Uday Kiran
 from PAMI.localPeriodicPattern.basic import abstract as _ab
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
 from deprecated import deprecated
+from PAMI.extras.periodicity import periodicMeasures as _periodicMeasures
 
 class Node:
     """
@@ -664,30 +665,9 @@ class LPPGrowth(_ab._localPeriodicPatterns):
         :return: PTL
         :rtype: set
         """
-        start = -1
-        PTL = set()
-        tsList = sorted(tsList)
-        tsPre = tsList[0]
-        soPer = ' '
-        for ts in tsList[1:]:
-            per = ts - tsPre
-            if per <= self._localPeriodicPatterns__maxPer and start == -1:
-                start = tsPre
-                soPer = self._localPeriodicPatterns__maxSoPer
-            if start != -1:
-                soPer = max(0, soPer + per - self._localPeriodicPatterns__maxPer)
-                if soPer > self._localPeriodicPatterns__maxSoPer:
-                    if tsPre - start >= self._localPeriodicPatterns__minDur:
-                        PTL.add((start, tsPre))
-                    start = -1
-            tsPre = ts
-        if start != -1:
-            soPer = max(0, soPer + self.__tsMax - tsPre - self._localPeriodicPatterns__maxPer)
-            if soPer > self._localPeriodicPatterns__maxSoPer and tsPre - start >= self._localPeriodicPatterns__minDur:
-                PTL.add((start, tsPre))
-            if soPer <= self._localPeriodicPatterns__maxSoPer and self.__tsMax - start >= self._localPeriodicPatterns__minDur:
-                PTL.add((start, self.__tsMax))
-        return PTL
+        return _periodicMeasures.localPeriodicIntervals(sorted(tsList), self._localPeriodicPatterns__maxPer,
+                                                        self._localPeriodicPatterns__maxSoPer,
+                                                        self._localPeriodicPatterns__minDur, self.__tsMax)
 
     def __calculatePTLbit(self, tsList: List[int]) -> set:
         """
@@ -60,6 +60,7 @@ from urllib.request import urlopen as _urlopen
 import sys as _sys
 import pandas as pd
 import numpy as np
+from PAMI.extras.periodicity import periodicMeasures as _periodicMeasures
 from deprecated import deprecated
 
 _minPS = float()
@@ -344,12 +345,7 @@ class PPPGrowth(_abstract._partialPeriodicPatterns):
         self.mine()
 
     def _getPerSup(self, arr):
-        arr = list(arr)
-        arr = np.sort(arr)
-        arr = np.diff(arr)
-        locs = len(np.where(arr <= self._period)[0])
-
-        return locs
+        return _periodicMeasures.periodicSupport(np.sort(list(arr)), self._period)
     
 
     def _construct(self, items, data):
@@ -445,7 +441,9 @@ class PPPGrowth(_abstract._partialPeriodicPatterns):
 
             # Precompute getMaxPer results for itemLocs
             # maxPerResults = {item: self._getMaxPer(itemLocs[item], maxTS) for item in itemLocs if len(itemLocs[item]) >= minSup}
-            maxPerResults = {item: self._getPerSup(itemLocs[item]) for item in itemLocs}
+            values, offsets = _periodicMeasures.pack([np.sort(itemLocs[item]) for item in itemLocs])
+            perSups = _periodicMeasures.periodicSupports(values, offsets, self._period).tolist()
+            maxPerResults = dict(zip(itemLocs, perSups))
 
             # Filter itemLocs based on minSup and maxPer
             itemLocs = {k: len(v) for k, v in itemLocs.items() if maxPerResults[k] >= self._minPS}
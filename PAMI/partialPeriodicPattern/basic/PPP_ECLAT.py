@@ -56,6 +56,7 @@ from PAMI.partialPeriodicPattern.basic import abstract as _ab
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
 import pandas as pd
 import numpy as np
+from PAMI.extras.periodicity import periodicMeasures as _periodicMeasures
 from deprecated import deprecated
 
 class PPP_ECLAT(_ab._partialPeriodicPatterns):
@@ -243,15 +244,7 @@ class PPP_ECLAT(_ab._partialPeriodicPatterns):
         return per
     
     def _getPerSup(self, arr):
-        arr = list(arr)
-        arr.append(self._maxTS)
-        arr.append(0)
-        arr = np.sort(arr)
-        arr = np.diff(arr)
-
-        locs = len(np.where(arr <= self._period)[0])
-
-        return locs
+        return _periodicMeasures.periodicSupport(np.sort(list(arr)), self._period, first=0, last=self._maxTS)
 
     def _creatingItemSets(self) -> None:
         """
@@ -309,20 +302,16 @@ class PPP_ECLAT(_ab._partialPeriodicPatterns):
         self.mine()
 
     def _getPerSup(self, arr):
-        arr = list(arr)
-        arr = np.sort(arr)
-        arr = np.diff(arr)
-        locs = len(np.where(arr <= self._period)[0])
-
-        return locs
+        return _periodicMeasures.periodicSupport(np.sort(list(arr)), self._period)
     
     def _recursive(self, cands, items):
         for i in range(len(cands)):
             newCands = []
             nitems = {}
-            for j in range(i + 1, len(cands)):
-                intersection = items[cands[i]].intersection(items[cands[j]])
-                perSup = self._getPerSup(intersection)
+            intersections = [items[cands[i]].intersection(items[cands[j]]) for j in range(i + 1, len(cands))]
+            values, offsets = _periodicMeasures.pack([np.sort(list(x)) for x in intersections])
+            perSups = _periodicMeasures.periodicSupports(values, offsets, self._period).tolist()
+            for j, intersection, perSup in zip(range(i + 1, len(cands)), intersections, perSups):
                 if perSup >= self._minPS:
                     nCand = cands[i] + tuple([cands[j][-1]])
                     newCands.append(nCand)
@@ -51,6 +51,7 @@ __copyright__ = """
 import pandas as pd
 from deprecated import deprecated
 from PAMI.partialPeriodicPatternInMultipleTimeSeries import abstract as _ab
+from PAMI.extras.periodicity import periodicMeasures as _periodicMeasures
 
 
 
@@ -237,19 +238,8 @@ class _Tree(object):
 
         global _maxPer, _lno,_period,_periodicSupport
         timeStamps.sort()
-        cur = 0
-        per = list()
-        sup = 0
-        for j in range(len(timeStamps)):
-            timedif=timeStamps[j] - cur
-            per.append(timedif)
-            cur = timeStamps[j]
-            if(_period>=timedif):
-                sup += 1
-        per.append(_lno - cur)
-        if len(per) == 0:
-            return [0, 0]
-        return [sup, max(per)]
+        sup = _periodicMeasures.periodicSupport(timeStamps, _period, first=0)
+        return [sup, _periodicMeasures.maxPeriod(timeStamps, _lno)]
 
     def conditionalDatabases(self, conditionalPatterns, conditionalTimeStamps):
         """
@@ -60,6 +60,7 @@ from deprecated import deprecated
 import numpy as np
 
 from PAMI.periodicFrequentPattern.basic import abstract as _ab
+from PAMI.extras.periodicity import periodicMeasures as _periodicMeasures
 
 
 class PFECLAT(_ab._periodicFrequentPatterns):
@@ -82,7 +83,7 @@ class PFECLAT(_ab._periodicFrequentPatterns):
                         - **finalPatterns** (*dict*) -- *Storing the complete set of patterns in a dictionary variable.*
                         - **memoryUSS** (*float*) -- *To store the total amount of USS memory consumed by the program.*
                         - **memoryRSS** (*float*) -- *To store the total amount of RSS memory consumed by the program.*
-                        - **Database** (*list*) -- *To store the transactions of a database in list.*
+                        - **Database** (*CompactDatabase*) -- *To store the transactions of a database as integer-encoded arrays.*
                         - **mapSupport** (*Dictionary*) -- *To maintain the information of item and their frequency.*
                         - **lno** (*int*) -- *It represents the total no of transactions*
                         - **tree** (*class*) -- *it represents the Tree class.*
@@ -198,58 +199,22 @@ class PFECLAT(_ab._periodicFrequentPatterns):
     def _creatingItemSets(self) -> None:
         """
 
-        Storing the complete transactions of the database/input file in a database variable
+        Storing the complete transactions of the database/input file in a compact, integer-encoded database variable
 
         :return: None
         """
-        self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
-            data, ts = [], []
-            if self._iFile.empty:
-                print("its empty..")
-            i = self._iFile.columns.values.tolist()
-            if 'TS' in i:
-                ts = self._iFile['TS'].tolist()
-            if 'Transactions' in i:
-                data = self._iFile['Transactions'].tolist()
-            for i in range(len(data)):
-                if data[i]:
-                    tr = [str(ts[i])] + [x for x in data[i].split(self._sep)]
-                    self._Database.append(tr)
-                else:
-                    self._Database.append([str(ts[i])])
-
-        if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
-                data = _ab._urlopen(self._iFile)
-                for line in data:
-                    line.strip()
-                    line = line.decode("utf-8")
-                    temp = [i.rstrip() for i in line.split(self._sep)]
-                    temp = [x for x in temp if x]
-                    self._Database.append(temp)
-            else:
-                try:
-                    with open(self._iFile, 'r', encoding='utf-8') as f:
-                        for line in f:
-                            line.strip()
-                            temp = [i.rstrip() for i in line.split(self._sep)]
-                            temp = [x for x in temp if x]
-                            self._Database.append(temp)
-                except IOError:
-                    print("File Not Found")
-                    quit()
+        try:
+            self._Database = _ab._compactDatabase.load(self._iFile, self._sep, 'temporal')
+        except IOError:
+            print("File Not Found")
+            quit()
 
     @deprecated("It is recommended to use 'mine()' instead of 'startMine()' for mining process. Starting from January 2025, 'startMine()' will be completely terminated.")
     def startMine(self) -> None:
         self.mine()
 
     def _getMaxPer(self, arr, maxTS):
-        arr = np.append(list(arr), [0, maxTS])
-        arr = np.sort(arr)
-        arr = np.diff(arr)
-
-        return np.max(arr)
+        return _periodicMeasures.maxPeriod(np.sort(list(arr)), maxTS)
 
     def mine(self) -> None:
         """
@@ -260,15 +225,9 @@ class PFECLAT(_ab._periodicFrequentPatterns):
         self._finalPatterns = {}
         frequentSets = self._creatingItemSets()
 
-        items = {}
-        maxTS = 0
-        for line in self._Database:
-            index = int(line[0])
-            maxTS = max(maxTS, index)
-            for item in line[1:]:
-                if tuple([item]) not in items:
-                    items[tuple([item])] = set()
-                items[tuple([item])].add(index)
+        names = self._Database.itemNames
+        items = {tuple([names[item]]): np.unique(ts) for item, ts in self._Database.getTimestampLists().items()}
+        maxTS = int(self._Database.timestamps.max()) if len(self._Database) else 0
 
         self._dbSize = maxTS
 
@@ -282,28 +241,35 @@ class PFECLAT(_ab._periodicFrequentPatterns):
         items = {k: v for k, v in sorted(items.items(), key = lambda x: len(x[1]), reverse = True)}
 
         keys = []
-        for item in list(items.keys()):
-            per = self._getMaxPer(items[item], maxTS)
+        candidates = list(items.keys())
+        values, offsets = _periodicMeasures.pack([items[item] for item in candidates])
+        for item, per in zip(candidates, _periodicMeasures.maxPeriods(values, offsets, maxTS).tolist()):
             if per <= maxPer:
                 keys.append(item)
-                self._finalPatterns[item] = [len(items[item]), per, set(items[item])]
+                self._finalPatterns[item] = [len(items[item]), per, set(items[item].tolist())]
 
         while keys:
             newKeys = []
             for i in range(len(keys)):
+                # the keys sharing the prefix of keys[i] are evaluated together, so that the periods of all the
+                # intersections are computed in one batch
+                newItems = {}
                 for j in range(i + 1, len(keys)):
                     if keys[i][:-1] == keys[j][:-1] and keys[i][-1] != keys[j][-1]:
-                        # print(keys[i], keys[j])
-                        newKey = tuple(keys[i] + (keys[j][-1],))
-                        intersect = items[keys[i]].intersection(items[keys[j]])
-                        per = self._getMaxPer(intersect, maxTS)
-                        sup = len(intersect)
-                        if sup >= minSup and per <= maxPer:
-                            items[newKey] = intersect
-                            newKeys.append(newKey)
-                            self._finalPatterns[newKey] = [sup, per, set(intersect)]
+                        intersect = np.intersect1d(items[keys[i]], items[keys[j]], assume_unique=True)
+                        if len(intersect) >= minSup:
+                            newItems[tuple(keys[i] + (keys[j][-1],))] = intersect
                     else:
                         break
+                if not newItems:
+                    continue
+                values, offsets = _periodicMeasures.pack(list(newItems.values()))
+                periods = _periodicMeasures.maxPeriods(values, offsets, maxTS).tolist()
+                for (newKey, intersect), per in zip(newItems.items(), periods):
+                    if per <= maxPer:
+                        items[newKey] = intersect
+                        newKeys.append(newKey)
+                        self._finalPatterns[newKey] = [len(intersect), per, set(intersect.tolist())]
             keys = newKeys
 
         newPattern = {}
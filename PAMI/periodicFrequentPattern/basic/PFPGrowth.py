@@ -60,6 +60,7 @@ from typing import Dict, Tuple
 import pandas as pd
 from deprecated import deprecated
 import numpy as np
+from PAMI.extras.periodicity import periodicMeasures as _periodicMeasures
 
 _maxPer = float()
 _minSup = float()
@@ -71,7 +72,7 @@ class _Node(object):
     A class used to represent the node of frequentPatternTree
 
     :**Attributes**:    - **item** (*int or None*) -- *Storing item of a node.*
-                        - **timeStamps** (*list*) -- *To maintain the timestamps of a database at the end of the branch.*
+                        - **locations** (*list*) -- *Sorted chunks of the timestamps of the transactions passing through the node. The chunks are merged once, when the node is traversed.*
                         - **parent** (*list*) -- *To maintain the parent of every node.*
                         - **children** (*list*) -- *To maintain the children of a node.*
 
@@ -88,22 +89,33 @@ class _Node(object):
         """
         This method takes an item and locations as input, adds a new child node
         if the item does not already exist among the current node's children, or
-        updates the locations of the existing child node if the item is already present.
+        appends the locations as a new chunk of the existing child node. Appending a
+        chunk does not copy the timestamps, so inserting a branch is linear in its length.
 
         :param item: Represents the distinct item to be added as a child node.
         :type item: Any
-        :param locations: Represents the locations associated with the item.
-        :type locations: list
+        :param locations: Represents the sorted timestamps associated with the item.
+        :type locations: numpy.ndarray
         :return: The child node associated with the item.
         :rtype: _Node
         """
         if item not in self.children:
-            self.children[item] = _Node(item, locations, self)
+            self.children[item] = _Node(item, [locations], self)
         else:
-            self.children[item].locations = locations + self.children[item].locations
-            
+            self.children[item].locations.append(locations)
         return self.children[item]
 
+    def getLocations(self):
+        """
+        Merges the chunks of timestamps of the node into a single sorted array
+
+        :return: sorted timestamps of the node
+        :rtype: numpy.ndarray
+        """
+        if len(self.locations) > 1:
+            self.locations = [_merge(self.locations)]
+        return self.locations[0]
+
     def traverse(self):
         """
         This method constructs a transaction by traversing from the current node to the root node, collecting items along the way.
@@ -112,7 +124,7 @@ class _Node(object):
         :rtype: tuple(list, Any)
         """
         transaction = []
-        locs = self.locations
+        locs = self.getLocations()
         node = self.parent
         while node.parent is not None:
             transaction.append(node.item)
@@ -120,6 +132,21 @@ class _Node(object):
         return transaction[::-1], locs
 
 
+def _merge(chunks):
+    """
+    Merges sorted chunks of timestamps into one sorted array. The stable sort of numpy detects the sorted runs, so the
+    merge is close to linear in the number of timestamps.
+
+    :param chunks: sorted arrays of timestamps
+    :type chunks: list
+    :return: sorted timestamps
+    :rtype: numpy.ndarray
+    """
+    if len(chunks) == 1:
+        return chunks[0]
+    return np.sort(np.concatenate(chunks), kind='stable')
+
+
 class PFPGrowth(_ab._periodicFrequentPatterns):
     """
     **About this algorithm**
@@ -141,7 +168,7 @@ class PFPGrowth(_ab._periodicFrequentPatterns):
                         - **finalPatterns** (*dict*) -- *Storing the complete set of patterns in a dictionary variable.*
                         - **memoryUSS** (*float*) -- *To store the total amount of USS memory consumed by the program.*
                         - **memoryRSS** (*float*) -- *To store the total amount of RSS memory consumed by the program.*
-                        - **Database** (*list*) -- *To store the transactions of a database in list.*
+                        - **Database** (*CompactDatabase*) -- *To store the transactions of a database as integer-encoded arrays.*
                         - **mapSupport** (*Dictionary*) -- *To maintain the information of item and their frequency.*
                         - **lno** (*int*) -- *It represents the total no of transactions*
                         - **tree** (*class*) -- *it represents the Tree class.*
@@ -224,6 +251,7 @@ class PFPGrowth(_ab._periodicFrequentPatterns):
     _minSup = str()
     _maxPer = float()
     _finalPatterns = {}
+    _supportsPatternSink = True
     _iFile = " "
     _oFile = " "
     _sep = " "
@@ -236,47 +264,15 @@ class PFPGrowth(_ab._periodicFrequentPatterns):
 
     def _creatingItemSets(self) -> None:
         """
-        Storing the complete transactions of the database/input file in a database variable
+        Storing the complete transactions of the database/input file in a compact, integer-encoded database variable
 
         :return: None
         """
-        self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
-            data, ts = [], []
-            if self._iFile.empty:
-                print("its empty..")
-            i = self._iFile.columns.values.tolist()
-            if 'TS' in i:
-                ts = self._iFile['TS'].tolist()
-            if 'Transactions' in i:
-                data = self._iFile['Transactions'].tolist()
-            for i in range(len(data)):
-                if data[i]:
-                    tr = [str(ts[i])] + [x for x in data[i].split(self._sep)]
-                    self._Database.append(tr)
-                else:
-                    self._Database.append([str(ts[i])])
-
-        if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
-                data = _ab._urlopen(self._iFile)
-                for line in data:
-                    line.strip()
-                    line = line.decode("utf-8")
-                    temp = [i.rstrip() for i in line.split(self._sep)]
-                    temp = [x for x in temp if x]
-                    self._Database.append(temp)
-            else:
-                try:
-                    with open(self._iFile, 'r', encoding='utf-8') as f:
-                        for line in f:
-                            line.strip()
-                            temp = [i.rstrip() for i in line.split(self._sep)]
-                            temp = [x for x in temp if x]
-                            self._Database.append(temp)
-                except IOError:
-                    print("File Not Found")
-                    quit()
+        try:
+            self._Database = _ab._compactDatabase.load(self._iFile, self._sep, 'temporal')
+        except IOError:
+            print("File Not Found")
+            quit()
 
     def _convert(self, value) -> int:
         """
@@ -303,20 +299,18 @@ class PFPGrowth(_ab._periodicFrequentPatterns):
 
     def _getMaxPer(self, arr, maxTS):
         """
-        This method appends `0` and `maxTS` to the input array, sorts the array,
-        and then computes the differences between consecutive elements.
+        This method computes the maximum period of a sorted array of timestamps,
+        i.e., the largest difference between consecutive elements after adding `0`
+        and `maxTS` at both ends. The input is already sorted, so it is not sorted again.
 
-        :param arr: The input array of elements.
+        :param arr: The sorted array of timestamps.
         :type arr: numpy.ndarray
         :param maxTS: The maximum timestamp to be appended to the array.
         :type maxTS: int or float
-        :return: None
+        :return: maximum period
+        :rtype: int
         """
-        arr = np.append(arr, [0, maxTS])
-        arr = np.sort(arr)
-        arr = np.diff(arr)
-
-        return np.max(arr)
+        return _periodicMeasures.maxPeriod(arr, maxTS)
 
     def _construct(self, items, data, minSup, maxPer, maxTS, patterns):
 
@@ -327,9 +321,9 @@ class PFPGrowth(_ab._periodicFrequentPatterns):
 
         :param items: A dictionary where keys are items and values are lists of timestamps.
         :type items: dict
-        :param data: The dataset used to construct the tree, where each entry is a list with
-                     an index followed by items.
-        :type data: list of lists
+        :param data: The dataset used to construct the tree, where each entry is a pair of
+                     a timestamp and the list of items.
+        :type data: iterable
         :param minSup: The minimum support threshold.
         :type minSup: int
         :param maxPer: The maximum period threshold.
@@ -354,15 +348,22 @@ class PFPGrowth(_ab._periodicFrequentPatterns):
             # patterns[pat] = (len(ts), self.getMaxPer(ts, maxTS))
             patterns[tuple([item])] = [len(ts), self._getMaxPer(ts, maxTS)]
 
+        # identical branches are grouped first, so that every branch is inserted once with all of its timestamps
+        branches = {}
+        for index, line in data:
+            line = tuple(sorted([item for item in line if item in items], key = lambda x: (-len(items[x]), x)))
+            if line in branches:
+                branches[line].append(index)
+            else:
+                branches[line] = [index]
+
         root = _Node([], None, None)
         itemNodes = {}
-        for line in data:
+        for line, indexes in branches.items():
             currNode = root
-            index = int(line[0])
-            line = line[1:]
-            line = sorted([item for item in line if item in items], key = lambda x: len(items[x]), reverse = True)
+            locs = np.sort(np.array(indexes, dtype=np.int64))
             for item in line:
-                currNode = currNode.addChild(item, [index])   # heavy
+                currNode = currNode.addChild(item, locs)
                 if item in itemNodes:
                     itemNodes[item].add(currNode)
                 else:
@@ -395,55 +396,62 @@ class PFPGrowth(_ab._periodicFrequentPatterns):
         for item in itemNode:
             newRoot = _Node(root.item + [item], None, None)
 
+            # the timestamps of the conditional pattern base are collected as chunks and merged once per item
             itemLocs = {}
             transactions = {}
             for node in itemNode[item]:
                 transaction, locs = node.traverse()
                 if len(transaction) < 1:
                     continue
-                # transactions.append((transaction, locs))
                 if tuple(transaction) in transactions:
-                    transactions[tuple(transaction)].extend(locs)
+                    transactions[tuple(transaction)].append(locs)
                 else:
-                    transactions[tuple(transaction)] = locs
+                    transactions[tuple(transaction)] = [locs]
 
-                for item in transaction:
-                    if item in itemLocs:
-                        itemLocs[item] += locs
+                for prefixItem in transaction:
+                    if prefixItem in itemLocs:
+                        itemLocs[prefixItem].append(locs)
                     else:
-                        itemLocs[item] = list(locs)
+                        itemLocs[prefixItem] = [locs]
 
             # Precompute getMaxPer results for itemLocs
-            maxPerResults = {item: self._getMaxPer(itemLocs[item], maxTS) for item in itemLocs if len(itemLocs[item]) >= minSup}
-
-            # Filter itemLocs based on minSup and maxPer
-            itemLocs = {k: len(v) for k, v in itemLocs.items() if k in maxPerResults and maxPerResults[k] <= maxPer}
+            maxPerResults = {}
+            supports = {}
+            candidates = {}
+            for prefixItem, chunks in itemLocs.items():
+                support = sum(len(chunk) for chunk in chunks)
+                if support >= minSup:
+                    candidates[prefixItem] = _merge(chunks)
+            values, offsets = _periodicMeasures.pack(list(candidates.values()))
+            periods = _periodicMeasures.maxPeriods(values, offsets, maxTS).tolist()
+            for (prefixItem, locs), per in zip(candidates.items(), periods):
+                if per <= maxPer:
+                    maxPerResults[prefixItem] = per
+                    supports[prefixItem] = len(locs)
 
             # Iterate over filtered itemLocs
-            for item in itemLocs:
-                # pat = "\t".join([str(x) for x in newRoot.item + [item]])
-                # self.patCount += 1
-                # patterns[pat] = [itemLocs[item], maxPerResults[item]]
-                patterns[tuple(newRoot.item + [item])] = [itemLocs[item], maxPerResults[item]]
-            
-            if not itemLocs:
+            for prefixItem in supports:
+                patterns[tuple(newRoot.item + [prefixItem])] = [supports[prefixItem], maxPerResults[prefixItem]]
+
+            if not supports:
                 continue
 
             newItemNodes = {}
 
-            for transaction, locs in transactions.items():
-                transaction = sorted([item for item in transaction if item in itemLocs], key = lambda x: itemLocs[x], reverse = True)
+            for transaction, chunks in transactions.items():
+                transaction = sorted([x for x in transaction if x in supports], key = lambda x: (-supports[x], x))
                 if len(transaction) < 1:
                     continue
+                locs = _merge(chunks)
                 currNode = newRoot
-                for item in transaction:
-                    currNode = currNode.addChild(item, locs)
-                    if item in newItemNodes:
-                        newItemNodes[item].add(currNode)
+                for prefixItem in transaction:
+                    currNode = currNode.addChild(prefixItem, locs)
+                    if prefixItem in newItemNodes:
+                        newItemNodes[prefixItem].add(currNode)
                     else:
-                        newItemNodes[item] = set([currNode])
+                        newItemNodes[prefixItem] = set([currNode])
 
-            self._recursive(newRoot, newItemNodes, minSup, maxPer, patterns, _lno)
+            self._recursive(newRoot, newItemNodes, minSup, maxPer, patterns, maxTS)
 
     def mine(self) -> None:
         """
@@ -463,6 +471,7 @@ class PFPGrowth(_ab._periodicFrequentPatterns):
         if self._sep is None:
             raise Exception("Default separator is tab space, please enter the separator if you have different separator in the input file")
 
+        self._finalPatterns = {}
         self._creatingItemSets()
         self._minSup = self._convert(self._minSup)
         self._maxPer = self._convert(self._maxPer)
@@ -472,25 +481,19 @@ class PFPGrowth(_ab._periodicFrequentPatterns):
             raise Exception("Please enter the minSup in range between 0 to 1")
         
 
-        items = {}
-
-        # tested ok
-        for line in self._Database:
-            index = int(line[0])
-            for item in line[1:]:
-                if item not in items:
-                    items[item] = []
-                items[item].append(index)
+        db = self._Database
+        items = {item: np.sort(ts) for item, ts in db.getTimestampLists().items()}
+        data = ((db.getTimestamp(tid), db.getTransaction(tid).tolist()) for tid in range(len(db)))
 
-        root, itemNodes = self._construct(items, self._Database, _minSup, _maxPer, _lno, self._finalPatterns)
+        sink = self._openPatternSink()
+        # the patterns are mined on item ids and decoded into item names when they are passed to the sink
+        patterns = sink.mapped(lambda pattern: "\t".join([db.itemNames[x] for x in pattern]))
 
-        self._recursive(root, itemNodes, _minSup, _maxPer, self._finalPatterns, _lno)
+        root, itemNodes = self._construct(items, data, _minSup, _maxPer, _lno, patterns)
 
-        newPattern = {}
-        for k, v in self._finalPatterns.items():
-            newPattern["\t".join([str(x) for x in k])] = v
+        self._recursive(root, itemNodes, _minSup, _maxPer, patterns, _lno)
 
-        self._finalPatterns = newPattern
+        self._closePatternSink(sink)
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = float()
@@ -26,6 +26,8 @@ import psutil as _psutil
 import sys as _sys
 import validators as _validators
 from urllib.request import urlopen as _urlopen
+from PAMI.extras.dbLoader import compactDatabase as _compactDatabase
+from PAMI.extras.sinks import patternSinks as _patternSinks
 
 
 class _periodicFrequentPatterns(_ABC):
@@ -79,8 +81,13 @@ class _periodicFrequentPatterns(_ABC):
             Total amount of RSS memory consumed by the program will be retrieved from this function
         getRuntime()
             Total amount of runtime taken by the program will be retrieved from this function
+        setPatternSink(sink)
+            Streams the patterns of mine() to a file, a callback or a bounded buffer instead of keeping them in memory
     """
 
+    # algorithms writing their patterns through _openPatternSink() set this to True
+    _supportsPatternSink = False
+
     def __init__(self, iFile, minSup, maxPer, sep = '\t'):
         """
         :param iFile: Input file name or path of the input file
@@ -109,6 +116,40 @@ class _periodicFrequentPatterns(_ABC):
         self._memoryRSS = float()
         self._memoryUSS = float()
         self._oFile = " "
+        self._patternSink = None
+
+    def setPatternSink(self, sink):
+        """
+        Streams the patterns of the following mine() calls to a sink instead of keeping them in memory. While a sink
+        is set, getPatterns() returns an empty dictionary. The sink is closed at the end of every mine() call.
+
+        :param sink: a sink of PAMI.extras.sinks.patternSinks, or None to keep the patterns in memory again
+        :type sink: PatternSink
+        :return: None
+        :raises NotImplementedError: if the algorithm does not write its patterns to a sink
+        """
+        if sink is not None and not self._supportsPatternSink:
+            raise NotImplementedError(type(self).__name__ + " keeps its patterns in memory and does not support "
+                                      "pattern sinks")
+        self._patternSink = sink
+
+    def _openPatternSink(self):
+        """
+        :return: the sink receiving the patterns of the current mine() call
+        :rtype: PatternSink
+        """
+        return self._patternSink if self._patternSink is not None else _patternSinks.MemorySink()
+
+    def _closePatternSink(self, sink):
+        """
+        Closes the sink of the current mine() call and keeps its patterns if they were kept in memory
+
+        :param sink: the sink returned by _openPatternSink()
+        :type sink: PatternSink
+        :return: None
+        """
+        sink.close()
+        self._finalPatterns = sink.getPatterns() if isinstance(sink, _patternSinks.MemorySink) else {}
 
     @_abstractmethod
     def startMine(self):
@@ -53,6 +53,7 @@ __copyright__ = """
 from PAMI.recurringPattern.basic import abstract as _ab
 import pandas as pd
 from deprecated import deprecated
+from PAMI.extras.periodicity import periodicMeasures as _periodicMeasures
 from PAMI.recurringPattern.basic import abstract as _ab
 
 _maxPer = float()
@@ -237,31 +238,7 @@ class _Tree(object):
 
         global _maxPer,_minPS
         timeStamps.sort()
-        cur = ' '
-        st = ' '
-        end = ' '
-        if len(timeStamps) > 0:
-            cur = timeStamps[0]
-            st = timeStamps[0]
-            end = timeStamps[0]
-        ps = 0
-        lps = 1
-        recli = []
-        for i in range(1, len(timeStamps)):
-            if abs(timeStamps[i] - cur) <= _maxPer:
-                lps += 1
-            else:
-                if lps >= _minPS:
-                    recli.append([st, end, lps])
-                    ps += lps
-                lps = 1
-                st = timeStamps[i]
-            cur = timeStamps[i]
-            end = cur
-        if lps >= _minPS:
-            recli.append([st, end, lps])
-            ps+=lps
-        # print(recli)
+        recli, ps = _periodicMeasures.periodicIntervals(timeStamps, _maxPer, _minPS)
         return [recli, ps, len(timeStamps)]
 
     def conditionalDatabases(self, conditionalPatterns, conditionalTimeStamps):
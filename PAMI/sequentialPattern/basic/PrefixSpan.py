@@ -15,8 +15,29 @@
 #      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 from PAMI.sequentialPattern.basic import abstract as _ab
 import sys
+import numpy as np
 sys.setrecursionlimit(10000)
 
+
+def _ranges(starts, ends):
+    """
+    Concatenates the ranges [starts[k], ends[k]) of positions
+
+    :param starts: first position of every range
+    :type starts: numpy.ndarray
+    :param ends: end of every range, not included
+    :type ends: numpy.ndarray
+    :return: the positions of all the ranges, in the order of the ranges
+    :rtype: numpy.ndarray
+    """
+    lengths = np.maximum(ends - starts, 0)
+    total = int(lengths.sum())
+    if total == 0:
+        return np.zeros(0, dtype=np.int64)
+    offsets = np.cumsum(lengths) - lengths
+    return np.repeat(starts - offsets, lengths) + np.arange(total, dtype=np.int64)
+
+
 class PrefixSpan(_ab._sequentialPatterns):
     """
         Prefix Span is one of the fundamental algorithm to discover sequential frequent patterns in a transactional database.
@@ -461,18 +482,150 @@ class PrefixSpan(_ab._sequentialPatterns):
 
 
 
+    def _encodeDatabase(self):
+        """
+        Encodes the frequent items of the database once into flat integer arrays. The items of a sequence are stored
+        contiguously, itemset after itemset, and the items of an itemset in sorted order.
+        """
+        counts = {}
+        for line in self._Database:
+            for item in set(line):
+                if item != self._sepSeq:
+                    counts[item] = counts.get(item, 0) + 1
+        self._itemNames = sorted(item for item, count in counts.items() if count >= self._minSup)
+        ranks = {item: rank for rank, item in enumerate(self._itemNames)}
+        items, seqOf, itemsetOf, itemsetStarts, itemsetEnds = [], [], [], [0], []
+        for sid, line in enumerate(self._Database):
+            itemset = None
+            first = len(itemsetStarts) - 1
+            for item in line + [self._sepSeq]:
+                if item != self._sepSeq:
+                    itemset = set() if itemset is None else itemset
+                    if item in ranks:
+                        itemset.add(ranks[item])
+                elif itemset is not None:
+                    # an itemset left without frequent items is kept, so that the gaps between itemsets do not change
+                    items.extend(sorted(itemset))
+                    seqOf.extend([sid] * len(itemset))
+                    itemsetOf.extend([len(itemsetStarts) - 1] * len(itemset))
+                    itemsetStarts.append(len(items))
+                    itemset = None
+            itemsetEnds.extend([len(itemsetStarts) - 1] * (len(itemsetStarts) - 1 - first))
+        #: rank of the item at every position
+        self._items = np.array(items, dtype=np.int64)
+        #: sequence of every position
+        self._seqOf = np.array(seqOf, dtype=np.int64)
+        #: itemset of every position, numbered over the whole database
+        self._itemsetOf = np.array(itemsetOf, dtype=np.int64)
+        #: first position of every itemset, followed by the number of positions
+        self._itemsetStarts = np.array(itemsetStarts, dtype=np.int64)
+        #: end of the sequence of every itemset, as the number of the first itemset of the next sequence
+        self._itemsetEnds = np.array(itemsetEnds, dtype=np.int64)
+        self._sequences = len(self._Database)
+
+    def _frequentExtensions(self, positions):
+        """
+        Groups the positions of the items that may extend a pattern by item, keeping the frequent items
+
+        :param positions: sorted positions of the candidate items
+        :type positions: numpy.ndarray
+        :return: every frequent item with its sorted positions
+        :rtype: list
+        """
+        if len(positions) == 0:
+            return []
+        items = self._items[positions]
+        keys = np.unique(items * self._sequences + self._seqOf[positions])
+        candidates, supports = np.unique(keys // self._sequences, return_counts=True)
+        frequent = supports >= self._minSup
+        if not frequent.any():
+            return []
+        order = np.argsort(items, kind='stable')
+        bounds = np.searchsorted(items[order], candidates)
+        bounds = np.append(bounds, len(order))
+        return [(item, support, positions[order[bounds[k]:bounds[k + 1]]]) for k, (item, support) in
+                enumerate(zip(candidates.tolist(), supports.tolist())) if frequent[k]]
+
+    def _growPseudoProjection(self, pattern, itemsets, occurrences):
+        """
+        Extends a pattern with the items of its pseudo-projected database. The projection is not copied: it is the set
+        of positions where an occurrence of the pattern ends, and the suffixes of the sequences are read from the
+        encoded database.
+
+        :param pattern: items of the pattern, with the separator after every itemset
+        :type pattern: tuple
+        :param itemsets: number of itemsets of the pattern
+        :type itemsets: int
+        :param occurrences: sorted positions of the last item of every occurrence of the pattern
+        :type occurrences: numpy.ndarray
+        """
+        itemsetOf = self._itemsetOf[occurrences]
+        # items after the last item of the pattern in the same itemset
+        extensions = [(True, self._frequentExtensions(_ranges(occurrences + 1, self._itemsetStarts[itemsetOf + 1])))]
+        if itemsets < self._maxLength:
+            if self._maxGap == float("inf"):
+                # the suffix after the earliest occurrence of every sequence holds the suffixes of the others
+                sequences = self._seqOf[occurrences]
+                earliest = np.ones(len(occurrences), dtype=bool)
+                earliest[1:] = sequences[1:] != sequences[:-1]
+                itemsetOf = itemsetOf[earliest]
+                ends = self._itemsetEnds[itemsetOf]
+            else:
+                ends = np.minimum(itemsetOf + int(self._maxGap), self._itemsetEnds[itemsetOf])
+            positions = _ranges(self._itemsetStarts[itemsetOf + 1], self._itemsetStarts[ends])
+            if self._maxGap != float("inf"):
+                positions = np.unique(positions)
+            extensions.append((False, self._frequentExtensions(positions)))
+        for sameItemset, frequent in extensions:
+            for item, support, positions in frequent:
+                if sameItemset:
+                    newPattern = pattern[:-1] + (self._itemNames[item], self._sepSeq)
+                    newItemsets = itemsets
+                else:
+                    newPattern = pattern + (self._itemNames[item], self._sepSeq)
+                    newItemsets = itemsets + 1
+                self._finalPatterns[str(list(newPattern))] = support
+                self._growPseudoProjection(newPattern, newItemsets, positions)
+
+    def _minePseudoProjection(self):
+        """
+        Mines the sequential patterns with pseudo-projections of the encoded database
+        """
+        self._encodeDatabase()
+        self._Database = []
+        for item, support, positions in self._frequentExtensions(np.arange(len(self._items), dtype=np.int64)):
+            pattern = (self._itemNames[item], self._sepSeq)
+            self._finalPatterns[str(list(pattern))] = support
+            self._growPseudoProjection(pattern, 1, positions)
+        self._items = self._seqOf = self._itemsetOf = self._itemsetStarts = self._itemsetEnds = None
+
     def startMine(self):
         """
             Frequent pattern mining process will start from here
         """
+        self.mine()
+
+    def mine(self, pseudoProjection=True):
+        """
+            Frequent pattern mining process will start from here
+
+        :param pseudoProjection: encode the database once into integer arrays and represent the projected databases by
+                                 the positions where the occurrences of a pattern end. If False, the projected
+                                 databases are built by copying the suffixes of the sequences, as in the first version
+                                 of this program.
+        :type pseudoProjection: bool
+        """
         self._Database = []
+        self._finalPatterns = {}
         self._startTime = _ab._time.time()
         self._creatingItemSets()
-        self._Database=self.makeSupDatabase(self._Database,"")
-        self._minSup = self._convert(self._minSup)
-        print(_ab._time.time()-self._startTime)
-        print(_ab._time.time()-self._startTime)
-        self.makeSeqDatabaseFirst(self._Database)
+        if pseudoProjection:
+            self._minSup = self._convert(self._minSup)
+            self._minePseudoProjection()
+        else:
+            self._Database = self.makeSupDatabase(self._Database, "")
+            self._minSup = self._convert(self._minSup)
+            self.makeSeqDatabaseFirst(self._Database)
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = float()
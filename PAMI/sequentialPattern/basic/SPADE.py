@@ -1,6 +1,6 @@
 # SPADE is one of the fundamental algorithm to discover sequential frequent patterns in a transactional database.
 # This program employs SPADE property (or downward closure property) to  reduce the search space effectively.
-# This algorithm employs breadth-first search technique when 1-2 length patterns and depth-first search when above 3 length patterns to find the complete set of frequent patterns in a transactional database.
+# This algorithm keeps the occurrences of every pattern in a vertical id-list and mines the equivalence classes of the patterns depth-first, joining the id-lists of the patterns of a class.
 #
 #
 # **Importing this algorithm into a python program**
@@ -56,19 +56,77 @@ __copyright__ = """
 
 
 import pandas as pd
+import numpy as np
 from deprecated import deprecated
 
 from PAMI.sequentialPattern.basic import abstract as _ab
 
 _ab._sys.setrecursionlimit(10000)
 
+
+def _support(idList, width):
+    """
+    Counts the sequences of an id-list
+
+    :param idList: sorted keys sid * width + eid of the occurrences of a pattern
+    :type idList: numpy.ndarray
+    :param width: number of itemsets of the longest sequence plus one
+    :type width: int
+    :return: number of distinct sequences of the id-list
+    :rtype: int
+    """
+    if len(idList) == 0:
+        return 0
+    sids = idList // width
+    return int(np.count_nonzero(sids[1:] != sids[:-1])) + 1
+
+
+def _earliest(idList, width):
+    """
+    Keeps the earliest occurrence of a pattern in every sequence
+
+    :param idList: sorted keys sid * width + eid of the occurrences of a pattern
+    :type idList: numpy.ndarray
+    :param width: number of itemsets of the longest sequence plus one
+    :type width: int
+    :return: sorted keys of the earliest occurrences
+    :rtype: numpy.ndarray
+    """
+    sids = idList // width
+    first = np.ones(len(idList), dtype=bool)
+    first[1:] = sids[1:] != sids[:-1]
+    return idList[first]
+
+
+def _temporalJoin(earliest, second, width):
+    """
+    Temporal join of two id-lists: keeps the occurrences of second that come after the earliest occurrence of the
+    earlier pattern in the same sequence
+
+    :param earliest: earliest occurrences of the earlier pattern, as returned by _earliest()
+    :type earliest: numpy.ndarray
+    :param second: sorted keys sid * width + eid of the occurrences of the later pattern
+    :type second: numpy.ndarray
+    :param width: number of itemsets of the longest sequence plus one
+    :type width: int
+    :return: sorted keys of the occurrences of the joined pattern
+    :rtype: numpy.ndarray
+    """
+    if len(earliest) == 0 or len(second) == 0:
+        return second[:0]
+    # the last earliest occurrence before the end of the sequence of every occurrence of second, if any
+    positions = np.searchsorted(earliest, (second // width + 1) * width) - 1
+    before = earliest[np.maximum(positions, 0)]
+    return second[(positions >= 0) & (before // width == second // width) & (before < second)]
+
+
 class SPADE(_ab._sequentialPatterns):
     """
     :Description:
 
         * SPADE is one of the fundamental algorithm to discover sequential frequent patterns in a transactional database.
         * This program employs SPADE property (or downward closure property) to  reduce the search space effectively.
-        * This algorithm employs breadth-first search technique when 1-2 length patterns and depth-first serch when above 3 length patterns to find the complete set of frequent patterns in a transactional database.
+        * This algorithm keeps the occurrences of every pattern in a vertical id-list, i.e., a sorted numpy array of (sequence id, itemset id) keys, and mines the equivalence classes of the patterns depth-first. The id-lists of the patterns of a class are joined with vectorized temporal and equality joins, and a class is freed once it is mined.
 
     :Reference:   Mohammed J. Zaki. 2001. SPADE: An Efficient Algorithm for Mining Frequent Sequences. Mach. Learn. 42, 1-2 (January 2001), 31-60. DOI=10.1023/A:1007652502315 http://dx.doi.org/10.1023/A:1007652502315
 
@@ -737,37 +795,105 @@ class SPADE(_ab._sequentialPatterns):
         bs2 = bs + (x2,)
         return  bs2,bs,x2
 
+    def _makeIdLists(self):
+        """
+        Builds the id-list of every frequent item. An id-list holds the sorted keys sid * width + eid of the
+        occurrences of a pattern, where sid is the number of the sequence, eid the number of the itemset holding the
+        last itemset of the pattern and width the number of itemsets of the longest sequence plus one.
+
+        :return: the frequent items in sorted order with their id-lists, and width
+        :rtype: tuple
+        """
+        width = max((len(line) for line in self._Database), default=0) + 1
+        keys = {}
+        for sid, line in enumerate(self._Database):
+            for eid, seq in enumerate(line):
+                for item in set(seq):
+                    keys.setdefault(item, []).append(sid * width + eid)
+        items = []
+        for item in sorted(keys):
+            idList = np.array(keys[item], dtype=np.int64)
+            support = _support(idList, width)
+            if support >= self._minSup:
+                self._finalPatterns[str(item)] = support
+                items.append((item, idList))
+        return items, width
+
+    def _extendClass(self, atoms, width):
+        """
+        Mines the equivalence classes of the atoms of a class depth-first. An atom extends the prefix of its class
+        either within the last itemset (itemset extension) or with a new itemset (sequence extension). The class of an
+        atom is built by joining its id-list with the id-lists of its siblings and is freed once it is mined.
+
+        :param atoms: atoms of the class, as (rank of the last item, itemset extension, id-list, pattern)
+        :type atoms: list
+        :param width: number of itemsets of the longest sequence plus one
+        :type width: int
+        """
+        for rank, isItemset, idList, pattern in atoms:
+            earliest = _earliest(idList, width)
+            children = []
+            for rank2, isItemset2, idList2, pattern2 in atoms:
+                item = pattern2[-2]
+                joined = []
+                if not isItemset2:
+                    # the item in a new itemset after the last itemset of the atom
+                    joined.append((rank2, False, _temporalJoin(earliest, idList2, width), pattern + (item, self._sepSeq)))
+                if rank2 > rank and isItemset == isItemset2:
+                    # the item added to the last itemset of the atom
+                    joined.append((rank2, True, np.intersect1d(idList, idList2, assume_unique=True),
+                                   pattern[:-1] + (item, self._sepSeq)))
+                for atom in joined:
+                    support = _support(atom[2], width)
+                    if support >= self._minSup:
+                        self._finalPatterns[str(atom[3])] = support
+                        children.append(atom)
+            if children:
+                self._extendClass(children, width)
+
+    def _mineIdLists(self):
+        """
+        Mines the sequential patterns with vertical id-lists
+        """
+        items, width = self._makeIdLists()
+        atoms = [(rank, False, idList, (item, self._sepSeq)) for rank, (item, idList) in enumerate(items)]
+        self._Database = []
+        self._extendClass(atoms, width)
+
     @deprecated("It is recommended to use mine() instead of startMine() for mining process")
     def startMine(self):
         """
         Frequent pattern mining process will start from here
         """
-        self._Database = []
-        self._startTime = _ab._time.time()
-        self._creatingItemSets()
-        self._minSup = self._convert(self._minSup)
-        self.make1LenDatabase()
-        self.make2LenDatabase()
-        self.make3LenDatabase()
-        self._endTime = _ab._time.time()
-        process = _ab._psutil.Process(_ab._os.getpid())
-        self._memoryUSS = float()
-        self._memoryRSS = float()
-        self._memoryUSS = process.memory_full_info().uss
-        self._memoryRSS = process.memory_info().rss
-        print("Sequential Frequent patterns were generated successfully using SPADE algorithm ")
+        self.mine()
 
     def Mine(self):
         """
         Frequent pattern mining process will start from here
         """
+        self.mine()
+
+    def mine(self, idLists=True):
+        """
+        Frequent pattern mining process will start from here
+
+        :param idLists: mine depth-first with the vertical id-lists of the patterns, as numpy arrays joined by
+                        vectorized merges. If False, the patterns of length one and two are mined breadth-first with
+                        dictionaries, as in the first version of this program.
+        :type idLists: bool
+        """
         self._Database = []
+        self._finalPatterns = {}
         self._startTime = _ab._time.time()
         self._creatingItemSets()
         self._minSup = self._convert(self._minSup)
-        self.make1LenDatabase()
-        self.make2LenDatabase()
-        self.make3LenDatabase()
+        if idLists:
+            self._mineIdLists()
+        else:
+            self._xLenDatabaseSame = {}
+            self.make1LenDatabase()
+            self.make2LenDatabase()
+            self.make3LenDatabase()
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = float()
@@ -55,11 +55,47 @@ __copyright__ = """
 
 
 import pandas as pd
+import numpy as np
 from deprecated import deprecated
 
 from PAMI.sequentialPattern.basic import abstract as _ab
 _ab._sys.setrecursionlimit(10000)
 
+
+def _sStep(bitmap):
+    """
+    S-step transform of packed bitmaps: in the block of every sequence, the bits up to the first set bit are cleared
+    and all the bits after it are set (like 010100=>001111 read from the first itemset)
+
+    :param bitmap: one block of uint64 words per sequence, the bit of itemset e being bit e % 64 of word e // 64
+    :type bitmap: numpy.ndarray
+    :return: the transformed bitmap
+    :rtype: numpy.ndarray
+    """
+    lowest = bitmap & (~bitmap + np.uint64(1))
+    # the bits after the lowest set bit of a word; an empty word gives no bits
+    after = ~(lowest | (lowest - np.uint64(1)))
+    if bitmap.shape[1] == 1:
+        return after
+    nonEmpty = bitmap != 0
+    first = np.argmax(nonEmpty, axis=1)[:, None]
+    words = np.arange(bitmap.shape[1])[None, :]
+    later = (words > first) & nonEmpty.any(axis=1)[:, None]
+    return np.where(words == first, after, np.where(later, ~np.uint64(0), np.uint64(0)))
+
+
+def _support(bitmap):
+    """
+    Counts the sequences of a bitmap
+
+    :param bitmap: one block of uint64 words per sequence
+    :type bitmap: numpy.ndarray
+    :return: number of sequences having a set bit in their block
+    :rtype: int
+    """
+    return int(np.count_nonzero(bitmap.any(axis=1)))
+
+
 class SPAM(_ab._sequentialPatterns):
     """
     :Description:    SPAM is one of the fundamental algorithm to discover sequential frequent patterns in a transactional database.
@@ -123,7 +159,11 @@ class SPAM(_ab._sequentialPatterns):
                 the main algorithm of spam. This can search sstep and istep items and find next patterns, its sstep, and its istep. And call this function again by using them. Recursion until there are no more items available for exploration.
             Sstep(s):
                 To convert bit to ssteo bit.The first time you get 1, you set it to 0 and subsequent ones to 1.(like 010101=>001111, 00001001=>00000111)
-            startMine()
+            _makeBitmaps():
+                To make the packed uint64 bitmaps of the frequent items, one block of words per sequence
+            _dfsBitmaps(key, bitmap, sStep, iStep, bitmaps):
+                To extend a pattern depth-first with the S-step transform and the AND of packed bitmaps
+            mine(bitmaps)
                 Mining process will start from here
             getPatterns()
                 Complete set of patterns will be retrieved with this function
@@ -413,23 +453,119 @@ class SPAM(_ab._sequentialPatterns):
                 count+=1
         return count
 
+    def _makeBitmaps(self):
+        """
+        Builds the packed bitmap of every frequent item. A bitmap has one block of uint64 words per sequence, large
+        enough for the longest sequence, and the bit of itemset e of a sequence is bit e % 64 of word e // 64 of its
+        block.
+
+        :return: the frequent items in sorted order with their bitmaps
+        :rtype: list
+        """
+        words = (max((len(line) for line in self._Database), default=0) + 63) // 64
+        positions = {}
+        for sid, line in enumerate(self._Database):
+            for eid, seq in enumerate(line):
+                for item in set(seq):
+                    positions.setdefault(item, []).append(sid * words * 64 + eid)
+        items = []
+        for item in sorted(positions):
+            bits = np.array(positions[item], dtype=np.int64)
+            bitmap = np.zeros(len(self._Database) * words, dtype=np.uint64)
+            np.bitwise_or.at(bitmap, bits // 64, np.left_shift(np.uint64(1), (bits % 64).astype(np.uint64)))
+            bitmap = bitmap.reshape(len(self._Database), words)
+            support = _support(bitmap)
+            if support >= self._minSup:
+                self._finalPatterns[str(item) + self._sep + "-2"] = support
+                items.append((str(item), bitmap))
+        return items
+
+    def _dfsBitmaps(self, key, bitmap, sStep, iStep, bitmaps):
+        """
+        Extends a pattern depth-first with its packed bitmap. The S-step candidates are joined with the S-step
+        transform of the bitmap and the I-step candidates with the bitmap itself, both by a plain AND of all the
+        sequences at once.
+
+        :param key: the pattern
+        :type key: str
+        :param bitmap: bitmap of the pattern
+        :type bitmap: numpy.ndarray
+        :param sStep: items which may follow the pattern in a new itemset
+        :type sStep: list
+        :param iStep: items which may be added to the last itemset of the pattern
+        :type iStep: list
+        :param bitmaps: bitmaps of the frequent items
+        :type bitmaps: dict
+        """
+        transformed = _sStep(bitmap)
+        sNext, iNext = [], []
+        for item in sStep:
+            nextBitmap = transformed & bitmaps[item]
+            support = _support(nextBitmap)
+            if support >= self._minSup:
+                nextKey = key + self._sep + self._sepSeq + self._sep + item
+                self._finalPatterns[nextKey + self._sep + self._sepSeq + self._sep + "-2"] = support
+                sNext.append((item, nextKey, nextBitmap))
+        for item in iStep:
+            nextBitmap = bitmap & bitmaps[item]
+            support = _support(nextBitmap)
+            if support >= self._minSup:
+                nextKey = key + self._sep + item
+                self._finalPatterns[nextKey + self._sep + self._sepSeq + self._sep + "-2"] = support
+                iNext.append((item, nextKey, nextBitmap))
+        del transformed
+        sItems = [item for item, _, _ in sNext]
+        iItems = [item for item, _, _ in iNext]
+        for item, nextKey, nextBitmap in sNext:
+            self._dfsBitmaps(nextKey, nextBitmap, sItems, [k for k in sItems if k > item], bitmaps)
+        for item, nextKey, nextBitmap in iNext:
+            self._dfsBitmaps(nextKey, nextBitmap, sItems, [k for k in iItems if k > item], bitmaps)
+
+    def _mineBitmaps(self):
+        """
+        Mines the sequential patterns with packed bitmaps
+        """
+        items = self._makeBitmaps()
+        self._Database = []
+        bitmaps = dict(items)
+        names = [item for item, _ in items]
+        for item, bitmap in items:
+            self._dfsBitmaps(item, bitmap, names, [k for k in names if k > item], bitmaps)
+
+    @deprecated("It is recommended to use mine() instead of startMine() for mining process")
     def startMine(self):
         """
         Frequent pattern mining process will start from here
         """
+        self.mine()
+
+    def mine(self, bitmaps=True):
+        """
+        Frequent pattern mining process will start from here
+
+        :param bitmaps: mine with numpy bitmaps packed into uint64 words, one block per sequence, so that every step
+                        processes all the sequences at once. If False, every sequence is a python integer and the
+                        steps loop over the sequences, as in the first version of this program.
+        :type bitmaps: bool
+        """
         self._Database = []
+        self._finalPatterns = {}
+        self._idDatabase = {}
         self._startTime = _ab._time.time()
         self._creatingItemSets()
         self._minSup = self._convert(self._minSup)
-        self.make2BitDatabase()
-        self._Database = [i for i in self._idDatabase.keys()]
-        for i in self._Database:
-            x=[]
-            for j in self._Database:
-                if self._Database.index(i)<self._Database.index(j):
-                    x.append(j)
-
-            self.DfsPruning(i,self._Database,x)
+        if bitmaps:
+            self._mineBitmaps()
+        else:
+            self.make2BitDatabase()
+            self._Database = [i for i in self._idDatabase.keys()]
+            for i in self._Database:
+                x=[]
+                for j in self._Database:
+                    if self._Database.index(i)<self._Database.index(j):
+                        x.append(j)
+
+                self.DfsPruning(i,self._Database,x)
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = float()
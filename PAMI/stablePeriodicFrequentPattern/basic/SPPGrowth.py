@@ -57,6 +57,7 @@ __copyright__ = """
 
 
 from PAMI.stablePeriodicFrequentPattern.basic import abstract as _ab
+from PAMI.extras.periodicity import periodicMeasures as _periodicMeasures
 from deprecated import deprecated
 
 
@@ -193,18 +194,7 @@ class _Tree:
         :return: support, periodicity
         """
         global _maxPer, _last
-        previous = 0
-        la = 0
-        tsList = sorted(timeStamps)
-        laList = []
-        for ts in tsList:
-            la = max(0, la + ts - previous - _maxPer)
-            laList.append(la)
-            previous = ts
-        la = max(0, la + _last - previous - _maxPer)
-        laList.append(la)
-
-        maxla = max(laList)
+        maxla = _periodicMeasures.lability(sorted(timeStamps), _maxPer, _last)
         return len(timeStamps), maxla
 
     def conditionalDatabases(self, conditionalPatterns, conditionalTimeStamps):
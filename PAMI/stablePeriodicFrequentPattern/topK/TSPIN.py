@@ -52,6 +52,7 @@ __copyright__ = """
 """
 
 from PAMI.stablePeriodicFrequentPattern.topK import abstract as _ab
+from PAMI.extras.periodicity import periodicMeasures as _periodicMeasures
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
 
 
@@ -237,13 +238,7 @@ class _Tree(object):
         """
 
         global _maxPer, _last
-        previous = 0
-        la = 0
-        tsList = sorted(timeStamps)
-        for ts in tsList:
-            la = max(0, la + ts - previous - _maxPer)
-            previous = ts
-        la = max(0, la + _last - previous - _maxPer)
+        la = _periodicMeasures.lability(sorted(timeStamps), _maxPer, _last, final=True)
         return len(timeStamps), la
 
     def conditionalDatabases(self, conditionalPatterns, conditionalTimeStamps) -> tuple:
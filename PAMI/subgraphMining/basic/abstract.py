@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from .graph import Graph
+from .graphArrays import GraphArrays
 from .dfsCode import DFSCode
 from .frequentSubgraph import FrequentSubgraph
 from .vertex import Vertex
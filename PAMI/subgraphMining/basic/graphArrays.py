@@ -0,0 +1,73 @@
+# GraphArrays stores a graph of gSpan in integer arrays, so that the embeddings of a pattern can be kept as tuples of
+# vertex numbers and extended without searching the pattern again in the graph
+#
+# **Importing this class into a python program**
+#
+#             from PAMI.subgraphMining.basic import abstract as _ab
+#
+#             graphArrays = _ab.GraphArrays(graph)
+#
+#             for v in graphArrays.findAllWithLabel(label):
+#
+#                 for k in range(graphArrays.offsets[v], graphArrays.offsets[v + 1]):
+#
+#                     print(v, graphArrays.neighbors[k], graphArrays.edgeLabels[k])
+#
+
+
+__copyright__ = """
+ Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from array import array
+
+
+class GraphArrays:
+    """
+    A graph stored in integer arrays for the embedding lists of gSpan. The vertices are numbered 0, 1, ... in the
+    order of graph.getAllVertices(), and the neighbours of vertex v are neighbors[offsets[v]:offsets[v + 1]], in the
+    order of graph.getAllNeighbors(), with the labels of the edges in edgeLabels.
+    """
+
+    def __init__(self, graph):
+        vertices = graph.getAllVertices()
+        index = {vertex.getId(): i for i, vertex in enumerate(vertices)}
+        self.id = graph.getId()
+        self.edgeCount = graph.getEdgeCount()
+        self.labels = array('i', [vertex.getLabel() for vertex in vertices])
+        self.offsets = array('i', [0])
+        self.neighbors = array('i')
+        self.edgeLabels = array('i')
+        for vertex in vertices:
+            for neighbor in graph.getAllNeighbors(vertex.getId()):
+                self.neighbors.append(index[neighbor.getId()])
+                self.edgeLabels.append(graph.getEdgeLabel(vertex.getId(), neighbor.getId()))
+            self.offsets.append(len(self.neighbors))
+        self.mapLabelToVertices = {}
+        for i, vertex in enumerate(vertices):
+            self.mapLabelToVertices.setdefault(vertex.getLabel(), []).append(i)
+
+    def findAllWithLabel(self, label):
+        """
+        :param label: label of the vertices
+        :type label: int
+        :return: numbers of the vertices having the label
+        :rtype: list
+        """
+        return self.mapLabelToVertices.get(label, [])
+
+    def getEdgeCount(self):
+        return self.edgeCount
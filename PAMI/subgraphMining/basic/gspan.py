@@ -63,10 +63,20 @@ class GSpan(_ab._gSpan):
         self._memoryRSS = float()
 
 
-    def mine(self):
+    def mine(self, embeddingLists=True):
+        """
+        Mines the frequent subgraphs
+
+        :param embeddingLists: if True, every pattern keeps the list of its embeddings in every graph, stored as
+            tuples of vertex numbers of GraphArrays next to their inverse mappings, and extends them incrementally.
+            If False, the embeddings of every pattern are searched again in every graph with subgraphIsomorphisms().
+        :type embeddingLists: bool
+        """
 
         if self.maxNumberOfEdges <= 0:
             return
+
+        self._embeddingLists = embeddingLists
         
         self.frequentSubgraphs = []
 
@@ -433,6 +443,173 @@ class GSpan(_ab._gSpan):
                     self.gspanDFS(newC, graphDb, newGraphIds)
 
 
+    def rightMostPathExtensionsFromEmbeddings(self, c: _ab.DFSCode, graphArrays, graphIds, embeddings, prune=True):
+        """
+        The function `rightMostPathExtensionsFromEmbeddings` generates the rightmost path extensions of a non-empty
+        DFS code from the embeddings of the code, and extends the embeddings along with the code.
+
+        :param c: the DFS code to extend
+        :type c: _ab.DFSCode
+        :param graphArrays: the graphs stored in integer arrays, by graph id
+        :type graphArrays: dict
+        :param graphIds: ids of the graphs containing the code
+        :type graphIds: set
+        :param embeddings: the embeddings of the code in every graph. An embedding is a pair of a tuple holding the
+            vertex of the graph mapped to every vertex of the code and a dict mapping these vertices back to the
+            vertices of the code.
+        :type embeddings: dict
+        :param prune: skip the graphs having no more edges than the code
+        :type prune: bool
+        :return: the extended edges, each with the set of ids of the graphs containing the extended code and the
+            embeddings of the extended code
+        :rtype: dict
+        """
+        extensions = {}
+        rightMost = c.getRightMost()
+        rightMostPath = c.getRightMostPath()
+        backwardTargets = {v for v in rightMostPath if c.notPreOfRm(v) and not c.containEdge(rightMost, v)}
+        for id in graphIds:
+            g = graphArrays[id]
+            if prune and GSpan.edge_count_pruning and c.size >= g.getEdgeCount():
+                self.pruneByEdgeCount += 1
+                continue
+            labels, offsets, neighbors, edgeLabels = g.labels, g.offsets, g.neighbors, g.edgeLabels
+            for embedding in embeddings[id]:
+                isom, invertedIsom = embedding
+                mappedRM = isom[rightMost]
+                mappedRMLabel = labels[mappedRM]
+                for k in range(offsets[mappedRM], offsets[mappedRM + 1]):
+                    x = neighbors[k]
+                    invertedX = invertedIsom.get(x)
+                    if invertedX is not None and invertedX in backwardTargets:
+                        key = (rightMost, invertedX, mappedRMLabel, labels[x], edgeLabels[k])
+                        extension = extensions.get(key)
+                        if extension is None:
+                            extension = extensions[key] = (set(), {})
+                        extension[0].add(id)
+                        extension[1].setdefault(id, []).append(embedding)
+
+                for v in rightMostPath:
+                    mappedV = isom[v]
+                    mappedVLabel = labels[mappedV]
+                    for k in range(offsets[mappedV], offsets[mappedV + 1]):
+                        x = neighbors[k]
+                        if x not in invertedIsom:
+                            key = (v, rightMost + 1, mappedVLabel, labels[x], edgeLabels[k])
+                            extension = extensions.get(key)
+                            if extension is None:
+                                extension = extensions[key] = (set(), {})
+                            extension[0].add(id)
+                            newInvertedIsom = invertedIsom.copy()
+                            newInvertedIsom[x] = rightMost + 1
+                            extension[1].setdefault(id, []).append((isom + (x,), newInvertedIsom))
+        return {_ab.ExtendedEdge(*key): extension for key, extension in extensions.items()}
+
+
+    def singleEdgeEmbeddings(self, ee: _ab.ExtendedEdge, graphArrays, graphIds):
+        """
+        The function `singleEdgeEmbeddings` finds the embeddings of a DFS code consisting of the single edge ee
+
+        :param ee: the edge
+        :type ee: _ab.ExtendedEdge
+        :param graphArrays: the graphs stored in integer arrays, by graph id
+        :type graphArrays: dict
+        :param graphIds: ids of the graphs containing the edge
+        :type graphIds: set
+        :return: the embeddings of the edge in every graph
+        :rtype: dict
+        """
+        embeddings = {}
+        for id in graphIds:
+            g = graphArrays[id]
+            labels, offsets, neighbors, edgeLabels = g.labels, g.offsets, g.neighbors, g.edgeLabels
+            isoms = []
+            for v in g.findAllWithLabel(ee.getVLabel1()):
+                for k in range(offsets[v], offsets[v + 1]):
+                    if labels[neighbors[k]] == ee.getVLabel2() and edgeLabels[k] == ee.getEdgeLabel():
+                        isoms.append(((v, neighbors[k]), {v: 0, neighbors[k]: 1}))
+            embeddings[id] = isoms
+        return embeddings
+
+
+    def gspanDFSEmbeddings(self, c: _ab.DFSCode, graphDb, graphArrays, graphIds, embeddings):
+        """
+        The `gspanDFSEmbeddings` function explores the patterns like `gspanDFS`, but passes the embeddings of every
+        pattern on to its extensions instead of searching them again.
+
+        :param c: the DFS code of the current pattern
+        :type c: _ab.DFSCode
+        :param graphDb: the graph database
+        :param graphArrays: the graphs stored in integer arrays, by graph id
+        :type graphArrays: dict
+        :param graphIds: ids of the graphs containing the pattern
+        :type graphIds: set
+        :param embeddings: the embeddings of the pattern in every graph, or None for the empty pattern
+        :type embeddings: dict
+        """
+        if c.size == self.maxNumberOfEdges - 1:
+            return
+        if c.isEmpty():
+            extensions = {ee: (ids, None) for ee, ids in self.rightMostPathExtensions(c, graphDb, graphIds).items()}
+        else:
+            extensions = self.rightMostPathExtensionsFromEmbeddings(c, graphArrays, graphIds, embeddings)
+
+        for extension, (newGraphIds, newEmbeddings) in extensions.items():
+            sup = len(newGraphIds)
+
+            if sup >= self.minSup:
+                newC = c.copy()
+                newC.add(extension)
+
+                if self.isCanonicalFromEmbeddings(newC):
+                    subgraph = _ab.FrequentSubgraph(newC, newGraphIds, sup)
+                    self.frequentSubgraphs.append(subgraph)
+
+                    if newEmbeddings is None:
+                        newEmbeddings = self.singleEdgeEmbeddings(extension, graphArrays, newGraphIds)
+                    self.gspanDFSEmbeddings(newC, graphDb, graphArrays, newGraphIds, newEmbeddings)
+
+
+    def isCanonicalFromEmbeddings(self, c: _ab.DFSCode):
+        """
+        The function `isCanonicalFromEmbeddings` checks if a DFS code is canonical like `isCanonical`, building the
+        minimum DFS code of the pattern with embedding lists.
+
+        :param c: The parameter `c` is an instance of the `_ab.DFSCode` class
+        :type c: _ab.DFSCode
+        :return: True if the DFS code is canonical
+        :rtype: bool
+        """
+        g = _ab.GraphArrays(_ab.Graph(-1, None, c))
+        graphArrays = {0: g}
+        canC = _ab.DFSCode()
+        embeddings = None
+        for i in range(c.size):
+            if canC.isEmpty():
+                extensions = {}
+                for v in range(len(g.labels)):
+                    for k in range(g.offsets[v], g.offsets[v + 1]):
+                        v1Label, v2Label = sorted((g.labels[v], g.labels[g.neighbors[k]]))
+                        extensions[_ab.ExtendedEdge(0, 1, v1Label, v2Label, g.edgeLabels[k])] = None
+            else:
+                extensions = self.rightMostPathExtensionsFromEmbeddings(canC, graphArrays, [0], embeddings, False)
+            minEe = None
+            for ee in extensions.keys():
+                if minEe is None or ee.smallerThan(minEe):
+                    minEe = ee
+
+            if minEe is not None and minEe.smallerThan(c.getAt(i)):
+                return False
+
+            if minEe is not None:
+                if canC.isEmpty():
+                    embeddings = self.singleEdgeEmbeddings(minEe, graphArrays, [0])
+                else:
+                    embeddings = extensions[minEe][1]
+                canC.add(minEe)
+        return True
+
+
     def isCanonical(self, c: _ab.DFSCode):
         """
         The function `isCanonical` checks if a given DFS code is canonical by comparing it with its
@@ -491,7 +668,11 @@ class GSpan(_ab._gSpan):
                 self.emptyGraphsRemoved += 1
 
         if len(self.frequentVertexLabels) != 0:
-            self.gspanDFS(_ab.DFSCode(), graphDb, graphIds)
+            if getattr(self, '_embeddingLists', False):
+                graphArrays = {i: _ab.GraphArrays(graphDb[i]) for i in graphIds}
+                self.gspanDFSEmbeddings(_ab.DFSCode(), graphDb, graphArrays, graphIds, None)
+            else:
+                self.gspanDFS(_ab.DFSCode(), graphDb, graphIds)
 
 
     class Pair:
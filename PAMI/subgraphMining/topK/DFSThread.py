@@ -6,7 +6,7 @@ class DfsThread(threading.Thread):
 
        Args:
            graphDb (GraphDatabase): The graph database containing the input graphs.
-           candidates (Queue): A queue containing candidate subgraphs to be mined.
+           candidates (list): A heap containing candidate subgraphs to be mined.
            minSup (int): The minimum support threshold for frequent subgraph mining.
            tkgInstance (TKGInstance): An instance of the Top-K Graphs (TKG) algorithm for dynamic subgraph mining.
        """
@@ -25,17 +25,15 @@ class DfsThread(threading.Thread):
             This method is invoked when the thread is started using the `start()` method.
 
             Within the mining loop:
-            - Retrieves a candidate subgraph from the candidates queue.
-            - Checks if the candidate's support meets the minimum support threshold.
-            - If the support is sufficient, invokes the gspanDynamicDFS method of the TKGInstance
+            - Retrieves the candidate subgraph of highest support from the TKGInstance, which checks
+              the candidate's support against the current minimum support threshold.
+            - Invokes the gspanDynamicDFS method of the TKGInstance
               to perform dynamic DFS-based subgraph mining with the candidate's DFS code,
               the graph database, and the set of graph IDs associated with the candidate.
 
-            This method continues to run until the candidates queue is empty or until a candidate
-            with insufficient support is encountered.
+            This method continues to run until no candidate with sufficient support is left.
             """
-        while not self.candidates.empty():
-            _, candidate = self.candidates.get()
-            if len(candidate.setOfGraphsIds) < self.minSup:
-                break
+        candidate = self.tkgInstance.nextCandidate()
+        while candidate is not None:
             self.tkgInstance.gspanDynamicDFS(candidate.dfsCode, self.graphDb, candidate.setOfGraphsIds)
+            candidate = self.tkgInstance.nextCandidate()
@@ -8,6 +8,10 @@ from .edge import Edge
 from .extendedEdge import ExtendedEdge
 from .sparseTriangularMatrix import SparseTriangularMatrix
 from queue import PriorityQueue
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+import heapq
+import multiprocessing
+import threading
 import time
 import math
 import matplotlib.pyplot as plt
@@ -24,10 +24,55 @@
 
 # print("Minimum support:", minSup)
 
+# obj = alg.TKG(iFile, k, numWorkers=4)   # expands the candidates in 4 processes
+
+# obj.mine()
+
 
 from PAMI.subgraphMining.topK import abstract as _ab
 
 
+_workerMiner = None
+_workerGraphDB = None
+_workerMinSup = None
+
+
+def _initWorker(k, maxNumberOfEdges, graphDB, minSup):
+    """
+    Prepares a worker process of the pool of TKG
+
+    :param k: number of patterns to find
+    :param maxNumberOfEdges: maximum number of edges of a pattern
+    :param graphDB: the preprocessed graph database
+    :param minSup: the minimum support shared by all processes. Only the parent process raises it.
+    :type minSup: multiprocessing.Value
+    """
+    global _workerMiner, _workerGraphDB, _workerMinSup
+    _workerMiner = TKG(None, k, maxNumberOfEdges)
+    _workerMiner.minSup = minSup.value
+    _workerGraphDB = graphDB
+    _workerMinSup = minSup
+
+
+def _extendCandidate(dfsCode, graphIds):
+    """
+    Finds the frequent canonical extensions of a candidate in a worker process. The shared minimum support is read
+    again after every extension, so that the extensions pruned by the patterns found in the other processes are not
+    checked.
+
+    :param dfsCode: the DFS code of the candidate
+    :param graphIds: ids of the graphs containing the candidate
+    :return: the extensions with support of at least the minimum support
+    :rtype: list
+    """
+    _workerMiner.minSup = max(_workerMiner.minSup, _workerMinSup.value)
+    subgraphs = []
+    for subgraph in _workerMiner.frequentExtensions(dfsCode, _workerGraphDB, graphIds):
+        subgraphs.append(subgraph)
+        _workerMiner.minSup = max(_workerMiner.minSup, _workerMinSup.value)
+    return subgraphs
+
+
 class TKG(_ab._TKG):
     ELIMINATE_INFREQUENT_VERTICES = True
     ELIMINATE_INFREQUENT_VERTEX_PAIRS = True
@@ -36,7 +81,12 @@ class TKG(_ab._TKG):
     DYNAMIC_SEARCH = True
     THREADED_DYNAMIC_SEARCH = True
 
-    def __init__(self, iFile, k, maxNumberOfEdges=float('inf'), outputSingleVertices=True, outputGraphIds=False):
+    def __init__(self, iFile, k, maxNumberOfEdges=float('inf'), outputSingleVertices=True, outputGraphIds=False, numWorkers=1):
+        """
+        :param numWorkers: number of worker processes expanding the candidates. The default is 1, i.e., the
+            candidates are expanded by threads of the main process.
+        :type numWorkers: int
+        """
         self.iFile = iFile
         self.k = k
         self.outputGraphIds = outputGraphIds
@@ -49,6 +99,7 @@ class TKG(_ab._TKG):
         self.infrequentVertexPairsRemovedCount = 0
         self.skipStrategyCount = 0
         self.threadCount = 1
+        self.numWorkers = numWorkers
         self.edgeRemovedByLabel = 0
         self.eliminatedWithMaxSize = 0
         self.emptyGraphsRemoved = 0
@@ -63,8 +114,9 @@ class TKG(_ab._TKG):
         if self.maxNumberOfEdges <= 0:
             return
 
-        self.kSubgraphs = _ab.PriorityQueue()
-        self.candidates = _ab.PriorityQueue()
+        self.kSubgraphs = []
+        self.candidates = []
+        self._lock = _ab.threading.Lock()
         
         self.runtime = 0
 
@@ -163,31 +215,22 @@ class TKG(_ab._TKG):
                 bw.write("".join(sb))
 
 
-    def savePattern(self, subgraph):        
-        # previousMinSup = self.minSup
-
-        self.kSubgraphs.put(subgraph)
-        if self.kSubgraphs.qsize() > self.k:
-            while self.kSubgraphs.qsize() > self.k:
-                lower = self.kSubgraphs.get()
+    def savePattern(self, subgraph):
+        """
+        Adds a pattern to the heap of the k patterns of highest support. The minimum support is raised to the
+        support of the patterns removed from the heap.
+        """
+        with self._lock:
+            _ab.heapq.heappush(self.kSubgraphs, subgraph)
+            while len(self.kSubgraphs) > self.k:
+                lower = _ab.heapq.heappop(self.kSubgraphs)
 
                 if lower.support > self.minSup:
                     self.minSup = lower.support
 
 
     def getQueueSize(self, queue):
-        size = 0
-        tempQueue = _ab.PriorityQueue()
-        
-        while not queue.empty():
-            item = queue.get()
-            tempQueue.put(item)
-            size += 1
-        
-        while not tempQueue.empty():
-            queue.put(tempQueue.get())
-        
-        return size
+        return len(queue)
 
     def subgraphIsomorphisms(self, c, g):
         isoms = []
@@ -324,16 +367,18 @@ class TKG(_ab._TKG):
         if not outputFrequentVertices or self.frequentVertexLabels:
             if self.DYNAMIC_SEARCH:
                 self.gspanDynamicDFS(_ab.DfsCode(), graphDB, graphIds)
-                
-                if self.THREADED_DYNAMIC_SEARCH:
+
+                if self.numWorkers > 1:
+                    self.expandCandidatesInPool(graphDB)
+
+                elif self.THREADED_DYNAMIC_SEARCH:
                     self.startThreads(graphDB, self.candidates, self.minSup)
 
                 else:
-                    while self.candidates:
-                        candidate = self.candidates.pop()
-                        if len(candidate.setOfGraphsIds) < self.minSup:
-                            continue
+                    candidate = self.nextCandidate()
+                    while candidate is not None:
                         self.gspanDynamicDFS(candidate.dfsCode, graphDB, candidate.setOfGraphsIds)
+                        candidate = self.nextCandidate()
             else:
                 self.gspanDfs(_ab.DfsCode(), graphDB, graphIds)
 
@@ -347,6 +392,36 @@ class TKG(_ab._TKG):
         for thread in threads:
             thread.join()
 
+    def expandCandidatesInPool(self, graphDB):
+        """
+        Expands the candidates in a pool of numWorkers processes, the candidate of highest support first. The
+        workers return the frequent extensions of their candidate, and the main process adds them to the top-k
+        patterns and the candidates. Whenever this raises the minimum support, the new value is published to the
+        workers in a shared value, which only increases.
+
+        :param graphDB: the preprocessed graph database
+        """
+        minSup = _ab.multiprocessing.Value('i', self.minSup)
+        with _ab.ProcessPoolExecutor(self.numWorkers, initializer=_initWorker,
+                                     initargs=(self.k, self.maxNumberOfEdges, graphDB, minSup)) as pool:
+            pending = set()
+            while True:
+                while len(pending) < 2 * self.numWorkers:
+                    candidate = self.nextCandidate()
+                    if candidate is None:
+                        break
+                    pending.add(pool.submit(_extendCandidate, candidate.dfsCode, candidate.setOfGraphsIds))
+                if not pending:
+                    break
+                done, pending = _ab.wait(pending, return_when=_ab.FIRST_COMPLETED)
+                for future in done:
+                    for subgraph in future.result():
+                        if subgraph.support >= self.minSup:
+                            self.savePattern(subgraph)
+                            self.registerAsCandidate(subgraph)
+                if self.minSup > minSup.value:
+                    minSup.value = self.minSup
+
     def gspanDfs(self, c: _ab.DfsCode, graphDB, subgraphId):
         if c.size == self.maxNumberOfEdges - 1:
             return
@@ -362,7 +437,16 @@ class TKG(_ab._TKG):
                     self.gspanDfs(newC, graphDB, newGraphIds)
 
     
-    def gspanDynamicDFS(self, c, graphDB, graphIds):
+    def frequentExtensions(self, c, graphDB, graphIds):
+        """
+        Generates the canonical extensions of a DFS code having support of at least minSup. minSup is checked when
+        the next extension is requested, so raising it in between prunes the remaining extensions.
+
+        :param c: the DFS code to extend
+        :param graphDB: the graph database
+        :param graphIds: ids of the graphs containing the DFS code
+        :return: the extensions as frequent subgraphs
+        """
         if c.size == self.maxNumberOfEdges - 1:
             return
 
@@ -374,12 +458,28 @@ class TKG(_ab._TKG):
                 newC = c.copy()
                 newC.add(extension)
                 if self.isCanonical(newC):
-                    subgraph = _ab.FrequentSubgraph(newC, newGraphIds, support)
-                    self.savePattern(subgraph)
-                    self.registerAsCandidate(subgraph)
-    
+                    yield _ab.FrequentSubgraph(newC, newGraphIds, support)
+
+    def gspanDynamicDFS(self, c, graphDB, graphIds):
+        for subgraph in self.frequentExtensions(c, graphDB, graphIds):
+            self.savePattern(subgraph)
+            self.registerAsCandidate(subgraph)
+
     def registerAsCandidate(self, subgraph):
-        self.candidates.put((-subgraph.support, subgraph))
+        with self._lock:
+            _ab.heapq.heappush(self.candidates, (-subgraph.support, subgraph))
+
+    def nextCandidate(self):
+        """
+        Removes the candidate of highest support from the candidates
+
+        :return: the candidate, or None if no candidate has support of at least minSup
+        """
+        with self._lock:
+            if self.candidates and -self.candidates[0][0] >= self.minSup:
+                return _ab.heapq.heappop(self.candidates)[1]
+            self.candidates.clear()
+            return None
 
     
     def isCanonical(self, c: _ab.DfsCode):
@@ -541,7 +641,7 @@ class TKG(_ab._TKG):
 
     def getSubgraphsList(self):
         """Creates a copy of the queue's contents without emptying the original queue."""
-        subgraphsList = list(self.kSubgraphs.queue)
+        subgraphsList = list(self.kSubgraphs)
         subgraphsList.sort(key=lambda sg: sg.support, reverse=True)
         return subgraphsList
 
@@ -52,6 +52,7 @@ __copyright__ = """
 import operator as _operator
 from PAMI.uncertainFrequentPattern.basic import abstract as _ab
 import deprecated
+import numpy as _np
 
 _minSup = float()
 _finalPatterns = {}
@@ -225,6 +226,7 @@ class UVEclat(_ab._frequentPatterns):
     _Database = []
     _tidList = {}
     _rank = {}
+    _logProbabilities = False
 
     def _creatingItemSets(self):
         """
@@ -457,15 +459,133 @@ class UVEclat(_ab._frequentPatterns):
             self._Generation(newPrefix, classItemSets, classTidSets)
             self._save(prefix, list(set(itemSetX)), tidSetI)
 
-    def mine(self):
+    def _intersectArrays(self, tidSetX, tidSetY):
+        """
+        This function is used to find the intersection of the tid-lists of two patterns Px and Py of the same
+        equivalence class, stored as arrays. The probability of Pxy in a transaction is the probability of Px times the
+        probability of the item y, as multiplying the probabilities of Px and Py would count P twice.
+
+        :param tidSetX: sorted tids, probabilities of the pattern and probabilities of its last item (or their logs)
+        :type tidSetX: tuple
+        :param tidSetY: sorted tids, probabilities of the pattern and probabilities of its last item (or their logs)
+        :type tidSetY: tuple
+        :return: the tid-list of the union of both patterns
+        :rtype: tuple
+        """
+        tids, first, second = _np.intersect1d(tidSetX[0], tidSetY[0], assume_unique=True, return_indices=True)
+        itemProbabilities = tidSetY[2][second]
+        if self._logProbabilities:
+            return tids, tidSetX[1][first] + itemProbabilities, itemProbabilities
+        return tids, tidSetX[1][first] * itemProbabilities, itemProbabilities
+
+    def _expectedSupport(self, tidSet):
+        """
+        This function is used to calculate the expected support of a tid-list stored as arrays
+
+        :param tidSet: sorted tids, probabilities of the pattern and probabilities of its last item (or their logs)
+        :type tidSet: tuple
+        :return: sum of the probabilities of the pattern over its tids
+        :rtype: float
+        """
+        if self._logProbabilities:
+            return float(_np.exp(tidSet[1]).sum())
+        return float(tidSet[1].sum())
+
+    def _generateArrays(self, prefix, itemSets, tidSets, supports):
+        """
+        Equivalence class is followed with the tid-lists stored as arrays. The expected supports of the intersections
+        are exact, so the patterns are stored without removing false positives.
+
+        :param prefix:  main equivalence prefix
+        :type prefix: list
+        :param itemSets: items which extend the prefix to a frequent pattern
+        :type itemSets: list
+        :param tidSets: tid-lists of the prefix extended with the items of itemSets
+        :type tidSets: list
+        :param supports: expected supports of the prefix extended with the items of itemSets
+        :type supports: list
+        """
+        for i in range(len(itemSets)):
+            itemI = itemSets[i]
+            tidSetI = tidSets[i]
+            classItemSets = []
+            classTidSets = []
+            classSupports = []
+            for j in range(i + 1, len(itemSets)):
+                y = self._intersectArrays(tidSetI, tidSets[j])
+                support = self._expectedSupport(y)
+                if support >= self._minSup:
+                    classItemSets.append(itemSets[j])
+                    classTidSets.append(y)
+                    classSupports.append(support)
+            tidSets[i] = None
+            self._generateArrays([itemI] + prefix, classItemSets, classTidSets, classSupports)
+            self._finalPatterns["\t".join(prefix + [itemI]) + "\t"] = supports[i]
+
+    def _mineArrays(self):
+        """
+        Mines the patterns with the tid-list of every pattern stored as a sorted array of tids and an array of
+        probabilities
+        """
+        plist = self._frequentOneItem()
+        tidSets, supports = [], []
+        for item in plist:
+            tidList = self._tidList[item]
+            tids = _np.fromiter(tidList.keys(), dtype=_np.int64, count=len(tidList))
+            probabilities = _np.fromiter(tidList.values(), dtype=_np.float64, count=len(tidList))
+            if self._logProbabilities:
+                with _np.errstate(divide='ignore'):
+                    probabilities = _np.log(probabilities)
+            tidSets.append((tids, probabilities, probabilities))
+            supports.append(self._calculateExpSup(tidList))
+        self._Database = []
+        self._generateArrays([], plist, tidSets, supports)
+
+    @deprecated.deprecated("It is recommended to use 'mine()' instead of 'startMine()' for mining process. Starting from January 2025, 'startMine()' will be completely terminated.")
+    def startMine(self):
         """
         Main method where the patterns are mined by constructing tree and remove the false patterns by counting the original support of a patterns
         """
-        global _minSup
+        self.mine()
+
+    def mine(self, vectorized=True, logProbabilities=False):
+        """
+        Main method where the patterns are mined by constructing tree and remove the false patterns by counting the original support of a patterns
+
+        :param vectorized: store the tid-lists as sorted numpy arrays of tids and probabilities, intersected with
+                           np.intersect1d. If False, the tid-lists are dictionaries intersected by comparing every pair
+                           of tids, as in the first version of this program.
+        :type vectorized: bool
+        :param logProbabilities: store the logarithms of the probabilities, which are added instead of multiplied, so
+                                 that the probabilities of long patterns do not underflow. Used when vectorized is True.
+        :type logProbabilities: bool
+        """
+        global _minSup, _finalPatterns
         self._startTime = _ab._time.time()
+        self._finalPatterns = {}
+        self._tidList = {}
+        _finalPatterns = {}
         self._creatingItemSets()
         self._minSup = self._convert(self._minSup)
         _minSup = self._minSup
+        if vectorized:
+            self._logProbabilities = logProbabilities
+            self._mineArrays()
+        else:
+            self._mineDictionaries()
+        print("Frequent patterns were generated from uncertain databases successfully using PUF algorithm")
+        self._endTime = _ab._time.time()
+        process = _ab._psutil.Process(_ab._os.getpid())
+        self._memoryRSS = float()
+        self._memoryUSS = float()
+        self._memoryUSS = process.memory_full_info().uss
+        self._memoryRSS = process.memory_info().rss
+
+    def _mineDictionaries(self):
+        """
+        Mines the patterns with the tid-lists stored as dictionaries and removes the false patterns by counting the
+        original support of the patterns
+        """
         plist = self._frequentOneItem()
         for i in range(len(plist)):
             itemI = plist[i]
@@ -483,13 +603,6 @@ class UVEclat(_ab._frequentPatterns):
             self._Generation(itemSetX, itemSets, tidSets)
             self._save(None, itemSetX, tidSetI)
         self._removeFalsePositives()
-        print("Frequent patterns were generated from uncertain databases successfully using PUF algorithm")
-        self._endTime = _ab._time.time()
-        process = _ab._psutil.Process(_ab._os.getpid())
-        self._memoryRSS = float()
-        self._memoryUSS = float()
-        self._memoryUSS = process.memory_full_info().uss
-        self._memoryRSS = process.memory_info().rss
 
     def getMemoryUSS(self):
         """
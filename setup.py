@@ -34,8 +34,9 @@ setuptools.setup(
     extras_require={
         'gpu':  ['cupy', 'pycuda'],
         'spark': ['pyspark'],
+        'parquet': ['pyarrow'],
         'dev': ['twine', 'setuptools', 'build'],
-        'all': ['cupy', 'pycuda', 'pyspark', 'twine', 'setuptools', 'build']
+        'all': ['cupy', 'pycuda', 'pyspark', 'pyarrow', 'twine', 'setuptools', 'build']
     },
     classifiers=[
         'Development Status :: 5 - Production/Stable',      # Chose either "3 - Alpha", "4 - Beta" or "5 - Production/Stable" as the current state of your package
@@ -0,0 +1,84 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/AssociationRules/basic/test_RuleEngine.py
+
+import unittest
+import os
+import random
+import warnings
+from itertools import combinations
+from PAMI.frequentPattern.basic.FPGrowth import FPGrowth
+from PAMI.AssociationRules.basic.RuleEngine import RuleEngine
+
+warnings.filterwarnings("ignore")
+
+
+class TestRuleEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_rule_engine_input.txt"
+        self.patterns_file = "test_rule_engine_patterns.txt"
+        rng = random.Random(1)
+        with open(self.input_file, "w") as f:
+            for _ in range(300):
+                transaction = set(rng.sample([str(i) for i in range(12)], rng.randint(2, 6)))
+                if rng.random() < 0.5:
+                    transaction |= {x for x in "abcd" if rng.random() < 0.85}
+                f.write("\t".join(transaction) + "\n")
+        miner = FPGrowth(self.input_file, 40)
+        miner.mine()
+        self.patterns = miner.getPatterns()
+        miner.save(self.patterns_file)
+        self.patternsDataFrame = miner.getPatternsAsDataFrame()
+
+    def tearDown(self):
+        for file in [self.input_file, self.patterns_file]:
+            if os.path.exists(file):
+                os.remove(file)
+
+    def expectedRules(self, minConf, dbSize):
+        supports = {frozenset(k): v for k, v in self.patterns.items()}
+        rules = {}
+        for itemset, support in supports.items():
+            for size in range(1, len(itemset)):
+                for antecedent in map(frozenset, combinations(itemset, size)):
+                    consequent = itemset - antecedent
+                    confidence = support / supports[antecedent]
+                    if confidence >= minConf:
+                        y = supports[consequent] / dbSize
+                        rules[(antecedent, consequent)] = [support / dbSize, confidence, confidence / y,
+                                                           support / dbSize - supports[antecedent] / dbSize * y,
+                                                           (1 - y) / (1 - confidence) if confidence < 1 else float('inf')]
+        return rules
+
+    def test_rules_match_brute_force(self):
+        for minConf in [0.3, 0.7]:
+            engine = RuleEngine(self.patterns, minConf, dbSize=300)
+            engine.mine()
+            got = {(frozenset(a), frozenset(c)): v for (a, c), v in engine.getAssociationRules().items()}
+            expected = self.expectedRules(minConf, 300)
+            self.assertGreater(len(expected), 0)
+            self.assertEqual(got.keys(), expected.keys())
+            for rule, values in expected.items():
+                for x, y in zip(got[rule], values):
+                    self.assertAlmostEqual(x, y)
+
+    def test_inputs_and_filters(self):
+        fromDict = RuleEngine(self.patterns, 0.5, dbSize=300)
+        fromDict.mine()
+        fromFile = RuleEngine(self.patterns_file, 0.5, dbSize=300)
+        fromFile.mine()
+        self.assertEqual(set(map(frozenset, fromFile.getAssociationRules())), set(map(frozenset, fromDict.getAssociationRules())))
+        fromDataFrame = RuleEngine(self.patternsDataFrame, 0.5, dbSize=300)
+        fromDataFrame.mine()
+        self.assertGreater(len(fromDict.getAssociationRules()), 0)
+        self.assertEqual(fromDataFrame.getAssociationRules(), fromDict.getAssociationRules())
+        lifted = RuleEngine(self.patterns, 0.5, dbSize=300, minLift=1.2)
+        lifted.mine()
+        self.assertTrue(all(v[2] >= 1.2 for v in lifted.getAssociationRules().values()))
+        self.assertEqual(len(lifted.getAssociationRulesAsDataFrame()), len(lifted.getAssociationRules()))
+        with self.assertRaises(ValueError):
+            RuleEngine(self.patterns, 0.5).mine()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/AssociationRules/basic/test_RuleEngine_parallel.py
+
+import unittest
+import os
+import random
+import warnings
+from PAMI.frequentPattern.basic.FPGrowth import FPGrowth
+from PAMI.AssociationRules.basic.RuleEngine import RuleEngine, measures
+from PAMI.extras.sinks import patternSinks
+
+warnings.filterwarnings("ignore")
+
+
+class TestRuleEngineParallel(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_rule_engine_parallel_input.txt"
+        self.output_file = "test_rule_engine_parallel_rules.txt"
+        rng = random.Random(2)
+        with open(self.input_file, "w") as f:
+            for _ in range(300):
+                transaction = set(rng.sample([str(i) for i in range(12)], rng.randint(2, 6)))
+                if rng.random() < 0.5:
+                    transaction |= {x for x in "abcd" if rng.random() < 0.85}
+                f.write("\t".join(transaction) + "\n")
+        miner = FPGrowth(self.input_file, 25)
+        miner.mine()
+        self.patterns = miner.getPatterns()
+        engine = RuleEngine(self.patterns, 0.2, dbSize=300)
+        engine.mine()
+        self.rules = engine.getAssociationRules()
+
+    def tearDown(self):
+        for file in [self.input_file, self.output_file]:
+            if os.path.exists(file):
+                os.remove(file)
+
+    def test_workers_match_serial(self):
+        engine = RuleEngine(self.patterns, 0.2, dbSize=300, numWorkers=2, chunkSize=30)
+        engine.mine()
+        self.assertEqual(engine.getAssociationRules(), self.rules)
+
+    def test_top_rules(self):
+        for measure in ['confidence', 'lift']:
+            index = measures.index(measure)
+            serial = RuleEngine(self.patterns, 0.2, dbSize=300, topN=10, measure=measure)
+            serial.mine()
+            top = serial.getAssociationRules()
+            self.assertEqual(sorted(v[index] for v in top.values()),
+                             sorted(sorted((v[index] for v in self.rules.values()), reverse=True)[:10]))
+            parallel = RuleEngine(self.patterns, 0.2, dbSize=300, topN=10, measure=measure, numWorkers=2, chunkSize=30)
+            parallel.mine()
+            self.assertEqual(parallel.getAssociationRules(), top)
+
+        perConsequent = RuleEngine(self.patterns, 0.2, dbSize=300, topN=2, perConsequent=True)
+        perConsequent.mine()
+        consequents = {}
+        for (_, consequent), values in self.rules.items():
+            consequents.setdefault(consequent, []).append(values[1])
+        got = {}
+        for (_, consequent), values in perConsequent.getAssociationRules().items():
+            got.setdefault(consequent, []).append(values[1])
+        self.assertEqual({c: sorted(v) for c, v in got.items()},
+                         {c: sorted(sorted(v, reverse=True)[:2]) for c, v in consequents.items()})
+
+    def test_rule_sink(self):
+        engine = RuleEngine(self.patterns, 0.2, dbSize=300, numWorkers=2, chunkSize=30)
+        engine.setRuleSink(patternSinks.FileSink(self.output_file))
+        engine.mine()
+        self.assertEqual(engine.getAssociationRules(), {})
+        with open(self.output_file) as f:
+            self.assertEqual(len(f.readlines()), len(self.rules))
+
+
+if __name__ == '__main__':
+    unittest.main()
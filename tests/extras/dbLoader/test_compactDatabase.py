@@ -0,0 +1,70 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/extras/dbLoader/test_compactDatabase.py
+
+import unittest
+import os
+import pandas as pd
+from PAMI.extras.dbLoader import compactDatabase as cdb
+
+
+class TestCompactDatabase(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_compact_input.txt"
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def write(self, data):
+        with open(self.input_file, 'w') as f:
+            f.write(data)
+
+    def test_transactional(self):
+        self.write("a\tb\tc\nb\tc\n\nc\td\n")
+        db = cdb.load(self.input_file)
+        self.assertEqual(len(db), 3)
+        self.assertEqual(db.itemNames, ['a', 'b', 'c', 'd'])
+        self.assertEqual(db.getItemSupports().tolist(), [1, 2, 3, 1])
+        self.assertEqual(db.toLists(), [['a', 'b', 'c'], ['b', 'c'], ['c', 'd']])
+        self.assertEqual(db.getTidLists()[db.itemIds['c']].tolist(), [0, 1, 2])
+        self.assertEqual(str(db.items.dtype), 'int32')
+
+    def test_repeated_items(self):
+        self.write("a\tb\ta\na\na\tc\tc\tc\n")
+        db = cdb.load(self.input_file)
+        self.assertEqual(db.getItemSupports().tolist(), [3, 1, 1])
+        self.assertEqual(cdb.parseLines([]).getItemSupports().tolist(), [])
+
+    def test_temporal(self):
+        self.write("1 a b\n3 b\n4\n7 a\n")
+        db = cdb.load(self.input_file, ' ', 'temporal')
+        self.assertEqual(db.timestamps.tolist(), [1, 3, 4, 7])
+        self.assertEqual(db.getTransactionLengths().tolist(), [2, 1, 0, 1])
+        self.assertEqual(db.getTimestampLists()[db.itemIds['a']].tolist(), [1, 7])
+
+    def test_utility(self):
+        self.write("a b:7:3 4\nb:2:2\n")
+        db = cdb.load(self.input_file, ' ', 'utility')
+        self.assertEqual(db.transactionUtilities.tolist(), [7.0, 2.0])
+        self.assertEqual(db.utilities.tolist(), [3.0, 4.0, 2.0])
+
+    def test_uncertain(self):
+        self.write("a b:0.5 0.25\nb(0.75) c(1.0)\n")
+        db = cdb.load(self.input_file, ' ', 'uncertain')
+        self.assertEqual(db.toLists(), [['a', 'b'], ['b', 'c']])
+        self.assertEqual(db.probabilities.tolist(), [0.5, 0.25, 0.75, 1.0])
+
+    def test_dataframe(self):
+        df = pd.DataFrame({'TS': [1, 2], 'Transactions': ['a\tb', 'b']})
+        db = cdb.load(df, dbType='temporal')
+        self.assertEqual(db.toLists(), [['a', 'b'], ['b']])
+        self.assertEqual(db.timestamps.tolist(), [1, 2])
+
+    def test_invalid_type(self):
+        with self.assertRaises(ValueError):
+            cdb.parseLines([], '\t', 'graph')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/extras/dbLoader/test_databaseCache.py
+
+import unittest
+import os
+import shutil
+import tempfile
+import numpy as np
+from PAMI.extras.dbLoader import compactDatabase as cdb
+from PAMI.extras.dbLoader import databaseCache
+
+
+class TestDatabaseCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.input_file = os.path.join(self.directory, "test_cache_input.txt")
+        with open(self.input_file, 'w') as f:
+            f.write("1\ta\tb\n2\tb\tc\n4\ta\n")
+
+    def tearDown(self):
+        databaseCache.disable()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_sidecar_is_reused(self):
+        first = cdb.load(self.input_file, '\t', 'temporal', cache=True)
+        self.assertTrue(os.path.isdir(databaseCache.cachePath(self.input_file, '\t', 'temporal')))
+        second = cdb.load(self.input_file, '\t', 'temporal', cache=True)
+        self.assertIsInstance(second.items, np.memmap)
+        self.assertEqual(first.toLists(), second.toLists())
+        self.assertEqual(first.timestamps.tolist(), second.timestamps.tolist())
+
+    def test_sidecar_is_invalidated(self):
+        cdb.load(self.input_file, '\t', 'temporal', cache=True)
+        with open(self.input_file, 'a') as f:
+            f.write("5\td\n")
+        db = cdb.load(self.input_file, '\t', 'temporal', cache=True)
+        self.assertEqual(len(db), 4)
+        self.assertIn('d', db.itemNames)
+
+    def test_enable(self):
+        databaseCache.enable()
+        cdb.load(self.input_file)
+        self.assertIsNotNone(databaseCache.read(self.input_file, '\t', 'transactional'))
+        self.assertIsNone(databaseCache.read(self.input_file, ',', 'transactional'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/extras/neighbours/test_findNeighboursUsingEuclidean.py
+
+import unittest
+import os
+import math
+import random
+import numpy as np
+from PAMI.extras.neighbours.spatialIndex import GridIndex
+from PAMI.extras.neighbours.findNeighboursUsingEuclidean import createNeighborhoodFileUsingEuclideanDistance
+
+
+class TestFindNeighboursUsingEuclidean(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_neighbours_input.txt"
+        self.output_file = "test_neighbours_output.txt"
+        rand = random.Random(5)
+        self.points = [(str(rand.randint(-20, 20)), str(round(rand.uniform(-20, 20), 2))) for _ in range(200)]
+        with open(self.input_file, "w") as f:
+            for x, y in self.points:
+                f.write("Point(" + x + " " + y + ")\t1\n")
+
+    def tearDown(self):
+        for name in (self.input_file, self.output_file):
+            if os.path.exists(name):
+                os.remove(name)
+
+    def test_neighbourhood_file(self):
+        createNeighborhoodFileUsingEuclideanDistance(self.input_file, self.output_file, 4)
+        expected = {}
+        for i, a in enumerate(self.points):
+            for j, b in enumerate(self.points):
+                if i != j and math.dist([float(x) for x in a], [float(x) for x in b]) <= 4:
+                    expected.setdefault(a, []).append("Point(" + b[0] + " " + b[1] + ")")
+        lines = ["\t".join(["Point(" + k[0] + " " + k[1] + ")"] + v) + "\t\n" for k, v in expected.items()]
+        with open(self.output_file) as f:
+            self.assertEqual(f.read(), "".join(lines))
+
+    def test_grid_index_blocks(self):
+        points = np.random.default_rng(1).uniform(0, 50, (300, 2))
+        index = GridIndex(points, 3)
+        pairs = set()
+        for first, second in index.candidatePairs(blockSize=64):
+            close = ((points[first] - points[second]) ** 2).sum(axis=1) <= 9
+            pairs.update(zip(first[close].tolist(), second[close].tolist()))
+        distances = ((points[:, None, :] - points[None, :, :]) ** 2).sum(axis=2)
+        expected = {(i, j) for i, j in zip(*np.nonzero(distances <= 9)) if i != j}
+        self.assertEqual(pairs, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
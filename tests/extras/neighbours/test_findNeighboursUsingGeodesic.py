@@ -0,0 +1,58 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/extras/neighbours/test_findNeighboursUsingGeodesic.py
+
+import unittest
+import os
+import random
+from PAMI.extras.neighbours import findNeighboursUsingGeodesic
+from PAMI.extras.neighbours.findNeighboursUsingGeodesic import createNeighborhoodFileUsingGeodesicDistance
+
+
+class TestFindNeighboursUsingGeodesic(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_geodesic_input.txt"
+        self.output_file = "test_geodesic_output.txt"
+
+    def tearDown(self):
+        for name in (self.input_file, self.output_file):
+            if os.path.exists(name):
+                os.remove(name)
+
+    def write(self, points):
+        with open(self.input_file, "w") as f:
+            for x, y in points:
+                f.write("1\t1\tPoint(" + x + " " + y + ")\n")
+
+    def read(self):
+        with open(self.output_file) as f:
+            return [line.rstrip("\n").rstrip("\t").split("\t") for line in f]
+
+    def test_equator_across_date_line(self):
+        # consecutive points are 11.1 km apart, far from the threshold, so no exact geodesic distance is needed
+        points = [("%.2f" % (((179.7 + 0.1 * i) + 180) % 360 - 180), "0") for i in range(6)]
+        self.write(points)
+        createNeighborhoodFileUsingGeodesicDistance(self.input_file, self.output_file, 15)
+        names = ["Point(" + x + " " + y + ")" for x, y in points]
+        expected = [[names[i]] + [names[j] for j in (i - 1, i + 1) if 0 <= j < len(names)] for i in range(len(names))]
+        self.assertEqual(self.read(), expected)
+
+    @unittest.skipIf(findNeighboursUsingGeodesic.geodesic is None, "geopy is not installed")
+    def test_matches_geodesic(self):
+        geodesic = findNeighboursUsingGeodesic.geodesic
+        rand = random.Random(4)
+        points = [("%.4f" % (139.7 + rand.uniform(-0.2, 0.2)), "%.4f" % (35.6 + rand.uniform(-0.2, 0.2)))
+                  for _ in range(150)]
+        self.write(points)
+        createNeighborhoodFileUsingGeodesicDistance(self.input_file, self.output_file, 10, blockSize=100)
+        expected = []
+        for a in points:
+            line = ["Point(" + b[0] + " " + b[1] + ")" for b in points
+                    if b != a and geodesic((float(a[1]), float(a[0])), (float(b[1]), float(b[0]))).km <= 10]
+            if line:
+                expected.append(["Point(" + a[0] + " " + a[1] + ")"] + line)
+        self.assertEqual(self.read(), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/extras/periodicity/test_periodicMeasures.py
+
+import unittest
+import random
+from PAMI.extras.periodicity import periodicMeasures as pm
+
+
+def referenceLability(ts, maxPer, last):
+    previous, la, values = 0, 0, []
+    for t in ts + [last]:
+        la = max(0, la + t - previous - maxPer)
+        values.append(la)
+        previous = t
+    return max(values), values[-1]
+
+
+class TestPeriodicMeasures(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(7)
+        self.maxTS = 200
+        self.arrays = [sorted(rng.sample(range(1, self.maxTS + 1), rng.randint(0, 40))) for _ in range(50)]
+        self.arrays = [a for a in self.arrays if a] + [[]]
+
+    def test_maxPeriod(self):
+        self.assertEqual(pm.maxPeriod([1, 3, 4, 9], 10), 5)
+        values, offsets = pm.pack(self.arrays)
+        periods = pm.maxPeriods(values, offsets, self.maxTS).tolist()
+        for ts, per in zip(self.arrays, periods):
+            bounds = [0] + ts + [self.maxTS]
+            self.assertEqual(per, max(b - a for a, b in zip(bounds, bounds[1:])))
+
+    def test_periodicSupport(self):
+        values, offsets = pm.pack(self.arrays)
+        supports = pm.periodicSupports(values, offsets, 5).tolist()
+        withBounds = pm.periodicSupports(values, offsets, 5, first=0, last=self.maxTS).tolist()
+        for ts, sup, sup2 in zip(self.arrays, supports, withBounds):
+            self.assertEqual(sup, sum(1 for a, b in zip(ts, ts[1:]) if b - a <= 5))
+            self.assertEqual(sup, pm.periodicSupport(ts, 5))
+            if ts:
+                bounds = [0] + ts + [self.maxTS]
+                self.assertEqual(sup2, sum(1 for a, b in zip(bounds, bounds[1:]) if b - a <= 5))
+
+    def test_lability(self):
+        arrays = [a for a in self.arrays if a]
+        values, offsets = pm.pack(arrays)
+        maxima = pm.labilities(values, offsets, 6, self.maxTS).tolist()
+        finals = pm.labilities(values, offsets, 6, self.maxTS, final=True).tolist()
+        for ts, la, final in zip(arrays, maxima, finals):
+            self.assertEqual((la, final), referenceLability(ts, 6, self.maxTS))
+            self.assertEqual(pm.lability(ts, 6, self.maxTS), la)
+            self.assertEqual(pm.lability(ts, 6, self.maxTS, final=True), final)
+
+    def test_periodicIntervals(self):
+        intervals, ps = pm.periodicIntervals([1, 2, 4, 10, 11, 30], 2, 2)
+        self.assertEqual(intervals, [[1, 4, 3], [10, 11, 2]])
+        self.assertEqual(ps, 5)
+        self.assertEqual(pm.periodicIntervals([], 2, 1), ([], 0))
+
+    def test_localPeriodicIntervals(self):
+        self.assertEqual(pm.localPeriodicIntervals([1, 2, 3, 20, 21, 22], 2, 3, 1, 25), {(1, 3), (20, 25)})
+        self.assertEqual(pm.localPeriodicIntervals([5], 2, 3, 1, 25), set())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/extras/sinks/test_parquetSink.py
+
+import unittest
+import os
+import random
+import warnings
+from PAMI.extras.sinks import parquetSink
+from PAMI.periodicFrequentPattern.basic.PFPGrowth import PFPGrowth
+
+warnings.filterwarnings("ignore")
+
+
+@unittest.skipIf(parquetSink._pa is None, "pyarrow is not installed")
+class TestParquetSink(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_parquet_sink_input.txt"
+        self.output_file = "test_parquet_sink_output.parquet"
+        rng = random.Random(10)
+        with open(self.input_file, "w") as f:
+            for ts in range(1, 301):
+                items = rng.sample(range(1, 16), rng.randint(1, 10))
+                f.write("\t".join([str(ts)] + [str(i) for i in items]) + "\n")
+
+    def tearDown(self):
+        for name in [self.input_file, self.output_file]:
+            if os.path.exists(name):
+                os.remove(name)
+
+    def test_streamed_patterns(self):
+        obj = PFPGrowth(self.input_file, 60, 20)
+        obj.mine()
+        expected = {frozenset(k.split("\t")): list(v) for k, v in obj.getPatterns().items()}
+        obj.setPatternSink(parquetSink.ParquetSink(self.output_file, batchSize=16))
+        obj.mine()
+        df = parquetSink.readPatterns(self.output_file)
+        self.assertEqual(list(df.columns), ['Patterns', 'Support', 'Periodicity'])
+        got = {frozenset(r.Patterns): [r.Support, r.Periodicity] for r in df.itertuples()}
+        self.assertEqual(got, expected)
+
+    def test_save_patterns(self):
+        self.assertEqual(parquetSink.savePatterns({(1, 2): 3.5, (4,): 1.0}, self.output_file, ['Utility']), 2)
+        df = parquetSink.readPatterns(self.output_file)
+        self.assertEqual([list(p) for p in df['Patterns']], [['1', '2'], ['4']])
+        self.assertEqual(df['Utility'].tolist(), [3.5, 1.0])
+
+    def test_mixed_batches(self):
+        # integer supports and items come first, so nothing may be narrowed to the types of the first row group
+        patterns = {(1, 2): 3, (4,): 5, (6,): 2.5, ('a', 7): 4, ('b',): 1.25}
+        self.assertEqual(parquetSink.savePatterns(patterns, self.output_file, batchSize=2), 5)
+        df = parquetSink.readPatterns(self.output_file)
+        got = {tuple(r.Patterns): r.Support for r in df.itertuples()}
+        self.assertEqual(got, {('1', '2'): 3.0, ('4',): 5.0, ('6',): 2.5, ('a', '7'): 4.0, ('b',): 1.25})
+
+    def test_invalid_values(self):
+        sink = parquetSink.ParquetSink(self.output_file, batchSize=1)
+        sink.add((1,), 2)
+        with self.assertRaises(TypeError):
+            sink.add((2,), 'high')
+        with self.assertRaises(ValueError):
+            sink.add((3,), [1, 2])
+        with self.assertRaises(ValueError):
+            sink.add((4,), 2 ** 60 + 1)
+        sink.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
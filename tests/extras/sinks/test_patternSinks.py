@@ -0,0 +1,92 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/extras/sinks/test_patternSinks.py
+
+import unittest
+import os
+import random
+import warnings
+from PAMI.extras.sinks import patternSinks
+from PAMI.frequentPattern.basic.FPGrowth import FPGrowth
+from PAMI.frequentPattern.basic.ECLATbitset import ECLATbitset
+from PAMI.frequentPattern.basic.Apriori import Apriori
+from PAMI.frequentPattern.basic.ECLAT import ECLAT
+from PAMI.periodicFrequentPattern.basic.PFPGrowth import PFPGrowth
+from PAMI.periodicFrequentPattern.basic.PFECLAT import PFECLAT
+
+warnings.filterwarnings("ignore")
+
+
+class TestPatternSinks(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_pattern_sinks_input.txt"
+        self.output_file = "test_pattern_sinks_output.txt"
+        rng = random.Random(9)
+        with open(self.input_file, "w") as f:
+            for ts in range(1, 301):
+                items = rng.sample(range(1, 16), rng.randint(1, 10))
+                f.write("\t".join([str(ts)] + [str(i) for i in items]) + "\n")
+
+    def tearDown(self):
+        for name in [self.input_file, self.output_file]:
+            if os.path.exists(name):
+                os.remove(name)
+
+    def checkSinks(self, obj):
+        obj.mine()
+        expected = dict(obj.getPatterns())
+        self.assertGreater(len(expected), 0)
+        got = {}
+        obj.setPatternSink(patternSinks.CallbackSink(lambda p, v: got.__setitem__(p, v)))
+        obj.mine()
+        self.assertEqual(got, expected)
+        self.assertEqual(obj.getPatterns(), {})
+        obj.setPatternSink(patternSinks.FileSink(self.output_file))
+        obj.mine()
+        with open(self.output_file) as f:
+            self.assertEqual(len(f.readlines()), len(expected))
+        obj.setPatternSink(None)
+        obj.mine()
+        self.assertEqual(obj.getPatterns(), expected)
+
+    def test_fpgrowth(self):
+        self.checkSinks(FPGrowth(self.input_file, 60))
+
+    def test_eclat_bitset(self):
+        self.checkSinks(ECLATbitset(self.input_file, 60))
+
+    def test_apriori(self):
+        self.checkSinks(Apriori(self.input_file, 60))
+
+    def test_pfpgrowth(self):
+        self.checkSinks(PFPGrowth(self.input_file, 60, 20))
+
+    def test_unsupported_miners(self):
+        for obj in [ECLAT(self.input_file, 60), PFECLAT(self.input_file, 60, 20)]:
+            with self.assertRaises(NotImplementedError):
+                obj.setPatternSink(patternSinks.MemorySink())
+            obj.setPatternSink(None)
+
+    def test_buffered_sink(self):
+        batches = []
+        sink = patternSinks.BufferedSink(batches.append, capacity=3)
+        for i in range(7):
+            sink[(i,)] = i
+        self.assertEqual([len(b) for b in batches], [3, 3])
+        sink.close()
+        self.assertEqual([len(b) for b in batches], [3, 3, 1])
+        self.assertEqual(len(sink), 7)
+        with self.assertRaises(ValueError):
+            patternSinks.BufferedSink(batches.append, capacity=0)
+
+    def test_file_sink_format(self):
+        sink = patternSinks.FileSink(self.output_file)
+        sink.add(('a', 'b'), 4)
+        sink.add('c', [5, 2])
+        sink.close()
+        with open(self.output_file) as f:
+            self.assertEqual(f.read(), "a\tb:4\nc:5:2\n")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/frequentPattern/basic/test_eclat_incremental.py
+
+import unittest
+import os
+import warnings
+from gen import generate_transactional_dataset
+from PAMI.frequentPattern.basic.ECLAT import ECLAT
+
+warnings.filterwarnings("ignore")
+
+
+class TestECLATIncremental(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_eclat_incremental_input.csv"
+        self.state_file = "test_eclat_incremental_state.pkl"
+        items = ["item-{}".format(i) for i in range(1, 16)]
+        self.dataset = generate_transactional_dataset(300, items, 10)
+        self.batches = [generate_transactional_dataset(30, items + ["item-16", "item-17"], 10) for _ in range(3)]
+        with open(self.input_file, "w") as f:
+            f.write("\n".join([",".join(i) for i in self.dataset]))
+
+    def tearDown(self):
+        for name in (self.input_file, self.state_file):
+            if os.path.exists(name):
+                os.remove(name)
+
+    def mineAll(self, minSup, transactions):
+        obj = ECLAT(transactions, minSup)
+        obj.mine()
+        return {frozenset(k): v for k, v in obj.getPatterns().items()}
+
+    def test_update_matches_full_mining(self):
+        for minSup in [30, 0.1]:
+            obj = ECLAT(self.input_file, minSup, ',')
+            obj.mine(incremental=True)
+            database = [list(t) for t in self.dataset]
+            for batch in self.batches:
+                obj.update(batch)
+                database += batch
+                got = {frozenset(k): v for k, v in obj.getPatterns().items()}
+                self.assertEqual(got, self.mineAll(minSup, database))
+
+    def test_state_file(self):
+        obj = ECLAT(self.input_file, 30, ',')
+        obj.mine(incremental=True)
+        obj.saveState(self.state_file)
+        restored = ECLAT(None, 30)
+        restored.loadState(self.state_file)
+        restored.update(self.batches[0])
+        got = {frozenset(k): v for k, v in restored.getPatterns().items()}
+        self.assertEqual(got, self.mineAll(30, [list(t) for t in self.dataset] + self.batches[0]))
+
+    def test_update_requires_state(self):
+        obj = ECLAT(self.input_file, 30, ',')
+        obj.mine()
+        with self.assertRaises(Exception):
+            obj.update(self.batches[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/frequentPattern/basic/test_eclatbitset_engine.py
+
+import unittest
+import os
+import warnings
+import numpy as np
+from gen import generate_transactional_dataset
+from PAMI.frequentPattern.basic import ECLATbitset as eclatBitset
+from PAMI.frequentPattern.basic.ECLAT import ECLAT
+
+warnings.filterwarnings("ignore")
+
+
+class TestECLATbitsetEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_eclatbitset_input.csv"
+        self.output_file = "test_eclatbitset_output.txt"
+        items = ["item-{}".format(i) for i in range(1, 16)]
+        dataset = generate_transactional_dataset(300, items, 10)
+        with open(self.input_file, "w") as f:
+            f.write("\n".join([",".join(i) for i in dataset]))
+
+    def tearDown(self):
+        for name in [self.input_file, self.output_file]:
+            if os.path.exists(name):
+                os.remove(name)
+
+    def mine(self, alg, minSup, **kwargs):
+        obj = alg(self.input_file, minSup, ',')
+        obj.mine(**kwargs)
+        return obj, {frozenset(k): v for k, v in obj.getPatterns().items()}
+
+    def test_matches_eclat(self):
+        _, expected = self.mine(ECLAT, 40)
+        for kwargs in [{}, {'memorySaver': False}, {'memoryBudget': 0}]:
+            _, got = self.mine(eclatBitset.ECLATbitset, 40, **kwargs)
+            self.assertEqual(got, expected)
+
+    def test_outputs(self):
+        obj, patterns = self.mine(eclatBitset.ECLATbitset, 0.2)
+        self.assertTrue(all(isinstance(k, tuple) for k in obj.getPatterns()))
+        self.assertEqual(len(obj.getPatternsAsDataFrame()), len(patterns))
+        obj.save(self.output_file)
+        with open(self.output_file) as f:
+            self.assertEqual(len(f.readlines()), len(patterns))
+
+    def test_popcount(self):
+        words = np.array([[0, 1, 2 ** 64 - 1], [3, 0, 2 ** 63]], dtype=np.uint64)
+        self.assertEqual(eclatBitset._popcount(words).tolist(), [65, 3])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/frequentPattern/basic/test_fpgrowth_parallel.py
+
+import unittest
+import os
+import warnings
+from gen import generate_transactional_dataset
+from PAMI.frequentPattern.basic.FPGrowth import FPGrowth
+
+warnings.filterwarnings("ignore")
+
+
+class TestFPGrowthParallel(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_fpgrowth_parallel_input.csv"
+        items = ["item-{}".format(i) for i in range(1, 16)]
+        dataset = generate_transactional_dataset(300, items, 10)
+        with open(self.input_file, "w") as f:
+            f.write("\n".join([",".join(i) for i in dataset]))
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def test_workers_match_serial(self):
+        serial = FPGrowth(self.input_file, 30, ',')
+        serial.mine()
+        expected = {frozenset(k): v for k, v in serial.getPatterns().items()}
+        parallel = FPGrowth(self.input_file, 30, ',', numWorkers=2)
+        parallel.mine()
+        got = {frozenset(k): v for k, v in parallel.getPatterns().items()}
+        self.assertEqual(got, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/frequentPattern/basic/test_mineSweep.py
+
+import unittest
+import os
+import warnings
+from gen import generate_transactional_dataset
+from PAMI.frequentPattern.basic.FPGrowth import FPGrowth
+from PAMI.frequentPattern.basic.ECLAT import ECLAT
+
+warnings.filterwarnings("ignore")
+
+
+class TestMineSweep(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_sweep_input.csv"
+        items = ["item-{}".format(i) for i in range(1, 16)]
+        dataset = generate_transactional_dataset(300, items, 10)
+        with open(self.input_file, "w") as f:
+            f.write("\n".join([",".join(i) for i in dataset]))
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def test_sweep_matches_single_runs(self):
+        for alg in [FPGrowth, ECLAT]:
+            obj = alg(self.input_file, 0, ',')
+            results = obj.mineSweep([90, 60, 30])
+            for minSup, patterns in results.items():
+                single = alg(self.input_file, minSup, ',')
+                single.mine()
+                expected = {frozenset(k.split('\t') if isinstance(k, str) else k): v for k, v in single.getPatterns().items()}
+                got = {frozenset(k.split('\t') if isinstance(k, str) else k): v for k, v in patterns.items()}
+                self.assertEqual(got, expected)
+            self.assertEqual(list(obj.getSweepStatistics()['minSup']), [90, 60, 30])
+
+    def test_mixed_thresholds(self):
+        obj = FPGrowth(self.input_file, 0, ',')
+        with self.assertRaises(ValueError):
+            obj.mineSweep([0.2, 30])
+
+
+if __name__ == '__main__':
+    unittest.main()
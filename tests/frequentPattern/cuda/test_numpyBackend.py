@@ -0,0 +1,59 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/frequentPattern/cuda/test_numpyBackend.py
+
+import unittest
+import os
+import random
+import warnings
+from PAMI.frequentPattern.cuda import abstract as _ab
+from PAMI.frequentPattern.cuda.cuApriori import cuApriori
+from PAMI.frequentPattern.cuda.cuAprioriBit import cuAprioriBit
+from PAMI.frequentPattern.cuda.cuEclat import cuEclat
+from PAMI.frequentPattern.cuda.cuEclatBit import cuEclatBit
+from PAMI.frequentPattern.cuda.cudaAprioriGCT import cudaAprioriGCT
+from PAMI.frequentPattern.basic.ECLAT import ECLAT
+
+warnings.filterwarnings("ignore")
+
+
+class TestNumpyBackend(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_numpy_backend_input.txt"
+        rng = random.Random(3)
+        with open(self.input_file, "w") as f:
+            for _ in range(300):
+                f.write("\t".join(str(i) for i in rng.sample(range(1, 16), rng.randint(1, 10))) + "\n")
+        expected = ECLAT(self.input_file, 40)
+        expected.mine()
+        self.expected = {frozenset(k): v for k, v in expected.getPatterns().items()}
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def test_bit_matrix_miners(self):
+        for alg in [cuApriori, cuAprioriBit, cuEclat, cuEclatBit]:
+            obj = alg(self.input_file, 40, backend='numpy')
+            obj.mine()
+            got = {frozenset(k): v for k, v in obj.getPatterns().items()}
+            self.assertEqual(got, self.expected, alg.__name__)
+            self.assertEqual(len(obj.getPatternsAsDataFrame()), len(got))
+
+    def test_gct(self):
+        obj = cudaAprioriGCT(self.input_file, 40, '\t', backend='numpy')
+        obj.mine()
+        got = {frozenset(k.split(' ')): v for k, v in obj.getPatterns().items()}
+        self.assertEqual(got, self.expected)
+
+    def test_backend_selection(self):
+        self.assertEqual(_ab._selectBackend(None, False), 'numpy')
+        self.assertEqual(_ab._selectBackend(None, True), 'cuda')
+        with self.assertRaises(ValueError):
+            _ab._selectBackend('opencl', True)
+        with self.assertRaises(RuntimeError):
+            _ab._selectBackend('cuda', False)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/fuzzyFrequentPattern/basic/test_FFIMiner_sparse.py
+
+import unittest
+import os
+import random
+from itertools import combinations
+from PAMI.fuzzyFrequentPattern.basic.FFIMiner import FFIMiner
+
+
+class TestFFIMinerSparse(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_ffiminer_sparse_input.txt"
+        rand = random.Random(5)
+        # fuzzy values that are exact in binary, so that supports do not depend on the order of the additions
+        self.database = []
+        for _ in range(60):
+            items = rand.sample(["a", "b", "c", "d", "e", "f", "g"], rand.randint(1, 6))
+            self.database.append({item: rand.choice([0.25, 0.5, 0.75, 1.0]) for item in items})
+        with open(self.input_file, "w") as f:
+            for transaction in self.database:
+                f.write("\t".join(transaction) + ":" + "\t".join(str(x) for x in transaction.values()) + "\n")
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def test_brute_force(self):
+        obj = FFIMiner(self.input_file, 6)
+        obj.mine()
+        patterns = {frozenset(pattern): support for pattern, support in obj.getPatterns().items()}
+        expected = {}
+        for size in range(1, 8):
+            for itemSet in combinations("abcdefg", size):
+                support = sum(min(t[item] for item in itemSet) for t in self.database if all(item in t for item in itemSet))
+                if support >= 6:
+                    expected[frozenset(itemSet)] = support
+        self.assertGreater(len(expected), 7)
+        self.assertEqual(patterns, expected)
+
+    def test_same_as_dictionaries(self):
+        found = []
+        for sparse in (True, False):
+            obj = FFIMiner(self.input_file, 0.1)
+            obj.mine(sparse=sparse)
+            found.append(obj.getPatterns())
+        self.assertEqual(found[0], found[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/highUtilityPattern/basic/test_EFIM_storage.py
+
+import unittest
+import os
+import random
+import warnings
+from PAMI.highUtilityPattern.basic import EFIM as efim
+
+warnings.filterwarnings("ignore")
+
+
+class TestEFIMStorage(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_efim_storage_input.txt"
+        rng = random.Random(3)
+        with open(self.input_file, "w") as f:
+            for _ in range(1000):
+                items = rng.sample(range(1, 13), rng.randint(2, 6))
+                utilities = [rng.randint(1, 5) for _ in items]
+                # the transaction utility may exceed the sum of the given utilities
+                f.write("\t".join(map(str, items)) + ":" + str(sum(utilities) + rng.randint(0, 3)) + ":" +
+                        "\t".join(map(str, utilities)) + "\n")
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def mine(self, minUtil, storage):
+        obj = efim.EFIM(self.input_file, minUtil)
+        obj.mine(storage=storage)
+        return obj.getPatterns()
+
+    def test_arrays_match_objects(self):
+        for minUtil in [200, 600]:
+            expected = self.mine(minUtil, 'objects')
+            self.assertTrue(len(expected) > 0)
+            self.assertEqual(self.mine(minUtil, 'arrays'), expected)
+
+    def test_hash_collisions(self):
+        expected = self.mine(200, 'objects')
+        store = efim._TransactionStore.__init__
+
+        def colliding(self, *args):
+            store(self, *args)
+            self.hashes[:] = self.hashes % 3
+
+        efim._TransactionStore.__init__ = colliding
+        try:
+            self.assertEqual(self.mine(200, 'arrays'), expected)
+        finally:
+            efim._TransactionStore.__init__ = store
+
+    def test_fractional_utilities(self):
+        with open(self.input_file, "w") as f:
+            f.write("a\tb:3.5:1.5\t2\n")
+            f.write("b\tc:4:2.5\t1.5\n")
+        self.assertEqual(self.mine(1, 'arrays'), {'a': '1.5', 'b': '4.5', 'c': '1.5', 'a\tb': '3.5', 'c\tb': '4'})
+
+    def test_invalid_storage(self):
+        with self.assertRaises(ValueError):
+            self.mine(200, 'lists')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/highUtilityPattern/parallel/test_efimEngine.py
+
+import unittest
+import os
+import random
+import warnings
+from PAMI.highUtilityPattern.basic.EFIM import EFIM
+from PAMI.highUtilityPattern.parallel import efimEngine
+from PAMI.highUtilityPattern.parallel.efimparallel import efimParallel
+
+warnings.filterwarnings("ignore")
+
+
+class TestEfimEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_efim_engine_input.txt"
+        rng = random.Random(5)
+        with open(self.input_file, "w") as f:
+            for _ in range(400):
+                items = rng.sample(range(1, 21), rng.randint(1, 8))
+                utilities = [rng.randint(1, 10) for _ in items]
+                f.write("\t".join(map(str, items)) + ":" + str(sum(utilities)) + ":" +
+                        "\t".join(map(str, utilities)) + "\n")
+        expected = EFIM(self.input_file, 150)
+        expected.mine()
+        self.expected = {frozenset(k.split("\t")): int(v) for k, v in expected.getPatterns().items()}
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def test_workers_match_efim(self):
+        database = efimEngine.readDatabase(self.input_file, "\t", 150)
+        for numWorkers in [1, 3]:
+            got = efimEngine.mine(database, 150, numWorkers=numWorkers, batchSize=5)
+            self.assertEqual({frozenset(k): v for k, v in got.items()}, self.expected)
+
+    def test_fractional_utilities(self):
+        with open(self.input_file, "w") as f:
+            f.write("a\tb:3.5:1.5\t2\n")
+            f.write("b\tc:4:2.5\t1.5\n")
+        database = efimEngine.readDatabase(self.input_file, "\t", 1)
+        self.assertEqual(efimEngine.mine(database, 1),
+                         {('a',): 1.5, ('b',): 4.5, ('c',): 1.5, ('a', 'b'): 3.5, ('c', 'b'): 4})
+
+    def test_efim_parallel(self):
+        obj = efimParallel(self.input_file, 150, "\t", 2)
+        obj.mine()
+        got = {frozenset(k.split("\t")): v for k, v in obj.getPatterns().items()}
+        self.assertEqual(got, self.expected)
+        self.assertEqual(len(obj.getPatternsAsDataFrame()), len(got))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/highUtilityPatternsInStreams/test_HUPStream.py
+
+import unittest
+import os
+import random
+import warnings
+from itertools import combinations
+from PAMI.highUtilityPatternsInStreams.HUPStream import HUPStream
+
+warnings.filterwarnings("ignore")
+
+
+def bruteForce(transactions, minUtil):
+    items = sorted({item for transaction in transactions for item in transaction})
+    patterns = {}
+    for length in range(1, len(items) + 1):
+        for itemset in combinations(items, length):
+            utility = sum(sum(t[item] for item in itemset) for t in transactions if all(item in t for item in itemset))
+            if utility >= minUtil:
+                patterns[frozenset(itemset)] = utility
+    return patterns
+
+
+class TestHUPStream(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_hupstream_input.txt"
+        self.output_file = "test_hupstream_output.txt"
+        rand = random.Random(7)
+        self.transactions = []
+        for _ in range(24):
+            items = rand.sample(["a", "b", "c", "d", "e", "f"], rand.randint(1, 4))
+            self.transactions.append({item: rand.randint(1, 9) for item in items})
+        with open(self.input_file, "w") as f:
+            for t in self.transactions:
+                f.write(",".join(t) + ":" + str(sum(t.values())) + ":" + ",".join(str(u) for u in t.values()) + "\n")
+
+    def tearDown(self):
+        for name in (self.input_file, self.output_file):
+            if os.path.exists(name):
+                os.remove(name)
+
+    def test_sliding_windows(self):
+        obj = HUPStream(self.input_file, 40, 3, 4, ',')
+        obj.mine()
+        windows = obj.getPatterns()
+        self.assertEqual(len(windows), 4)
+        for (start, end), patterns in windows.items():
+            got = {frozenset(p): u for p, u in patterns}
+            self.assertEqual(got, bruteForce(self.transactions[start:end], 40))
+        obj.save(self.output_file)
+        self.assertTrue(os.path.exists(self.output_file))
+
+    def test_lazy_updates(self):
+        rand = random.Random(3)
+        stream = HUPStream(None, 25, 3)
+        panes = []
+        for step in range(12):
+            pane = [self.transactions[rand.randrange(24)] for _ in range(rand.randint(0, 3))]
+            panes.append(pane)
+            stream.push(pane)
+            if step % 3 != 1:
+                window = [t for p in panes[-3:] for t in p]
+                got = {frozenset(p): u for p, u in stream.currentPatterns().items()}
+                self.assertEqual(got, bruteForce(window, 25))
+
+    def test_stream_iterator(self):
+        stream = HUPStream(None, 40, 2)
+        results = list(stream.stream(iter(self.transactions), 5))
+        self.assertEqual(len(results), 5)
+        start, end, patterns = results[-1]
+        self.assertEqual((start, end), (15, 24))
+        got = {frozenset(p): u for p, u in patterns.items()}
+        self.assertEqual(got, bruteForce(self.transactions[start:end], 40))
+
+
+if __name__ == '__main__':
+    unittest.main()
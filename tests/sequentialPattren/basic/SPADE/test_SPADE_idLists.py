@@ -0,0 +1,73 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/sequentialPattren/basic/SPADE/test_SPADE_idLists.py
+
+import unittest
+import os
+import ast
+import random
+import warnings
+from PAMI.sequentialPattern.basic.SPADE import SPADE
+
+warnings.filterwarnings("ignore")
+
+
+def contains(sequence, pattern):
+    k = 0
+    for itemset in sequence:
+        if k < len(pattern) and set(pattern[k]) <= set(itemset):
+            k += 1
+    return k == len(pattern)
+
+
+def canonical(key):
+    if not key.startswith('('):
+        return ((key,),)
+    pattern, itemset = [], []
+    for item in ast.literal_eval(key):
+        if item == '-1':
+            pattern.append(tuple(sorted(itemset)))
+            itemset = []
+        else:
+            itemset.append(item)
+    if itemset:
+        pattern.append(tuple(sorted(itemset)))
+    return tuple(pattern)
+
+
+class TestSPADEIdLists(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_spade_idlists_input.txt"
+        rand = random.Random(11)
+        self.database = [[sorted(rand.sample("abcdef", rand.randint(1, 3))) for _ in range(rand.randint(1, 6))]
+                         for _ in range(40)]
+        with open(self.input_file, "w") as f:
+            for sequence in self.database:
+                f.write("\t".join(item for itemset in sequence for item in itemset + ["-1"]) + "\n")
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def test_supports(self):
+        obj = SPADE(self.input_file, 6)
+        obj.mine()
+        patterns = obj.getPatterns()
+        self.assertGreater(len(patterns), 0)
+        for key, support in patterns.items():
+            pattern = canonical(key)
+            self.assertEqual(key, pattern[0][0] if len(pattern) == 1 and len(pattern[0]) == 1 else
+                             str(tuple(item for itemset in pattern for item in itemset + ('-1',))))
+            self.assertEqual(support, sum(contains(sequence, pattern) for sequence in self.database))
+
+    def test_matches_previous_engine(self):
+        obj = SPADE(self.input_file, 6)
+        obj.mine()
+        previous = SPADE(self.input_file, 6)
+        previous.mine(idLists=False)
+        self.assertEqual({canonical(k): v for k, v in obj.getPatterns().items()},
+                         {canonical(k): v for k, v in previous.getPatterns().items()})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/sequentialPattren/basic/SPAM/test_SPAM_bitmaps.py
+
+import unittest
+import os
+import random
+import warnings
+import numpy as np
+from PAMI.sequentialPattern.basic.SPAM import SPAM, _sStep
+
+warnings.filterwarnings("ignore")
+
+
+class TestSPAMBitmaps(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_spam_bitmaps_input.txt"
+        rand = random.Random(7)
+        database = [[sorted(rand.sample("abcde", rand.randint(1, 3))) for _ in range(rand.randint(1, 8))]
+                    for _ in range(40)]
+        # sequences longer than one 64 bit word
+        database.append([["a"]] + [["x"]] * 70 + [["b"]])
+        database.append([["x"]] * 66 + [["a"], ["b", "c"]])
+        with open(self.input_file, "w") as f:
+            for sequence in database:
+                f.write("\t".join(item for itemset in sequence for item in itemset + ["-1"]) + "\n")
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def test_sStep(self):
+        bitmap = np.array([[0b010100, 0], [0, 0b1001], [0, 0]], dtype=np.uint64)
+        transformed = _sStep(bitmap)
+        full = ~np.uint64(0)
+        self.assertEqual(transformed[0, 0], full ^ np.uint64(0b000111))
+        self.assertEqual(transformed[0, 1], full)
+        self.assertEqual(transformed[1, 0], 0)
+        self.assertEqual(transformed[1, 1], full ^ np.uint64(0b1))
+        self.assertFalse(transformed[2].any())
+
+    def test_same_patterns(self):
+        patterns = []
+        for bitmaps in (True, False):
+            obj = SPAM(self.input_file, 6)
+            obj.mine(bitmaps=bitmaps)
+            patterns.append(obj.getPatterns())
+        self.assertGreater(len(patterns[0]), 0)
+        # the first version orders the items of an itemset by their first occurrence
+        normalized = [{tuple(tuple(sorted(itemset.split("\t"))) for itemset in key.split("\t-1\t")): value
+                       for key, value in found.items()} for found in patterns]
+        self.assertEqual(normalized[0], normalized[1])
+
+    def test_long_sequences(self):
+        obj = SPAM(self.input_file, 2)
+        obj.mine()
+        patterns = obj.getPatterns()
+        self.assertGreaterEqual(patterns["a\t-1\tb\t-1\t-2"], 2)
+        self.assertEqual(patterns["x\t-1\tb\t-1\t-2"], 2)
+        self.assertEqual(patterns["x\t-1\tx\t-1\t-2"], 2)
+        self.assertNotIn("x\t-1\ta\t-1\tb\t-1\t-2", patterns)
+
+
+if __name__ == '__main__':
+    unittest.main()
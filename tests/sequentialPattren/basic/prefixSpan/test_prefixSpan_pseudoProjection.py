@@ -0,0 +1,73 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/sequentialPattren/basic/prefixSpan/test_prefixSpan_pseudoProjection.py
+
+import unittest
+import os
+import random
+import warnings
+from PAMI.sequentialPattern.basic.PrefixSpan import PrefixSpan
+
+warnings.filterwarnings("ignore")
+
+
+def occurs(sequence, pattern, maxGap):
+    def match(k, last):
+        if k == len(pattern):
+            return True
+        for eid, itemset in enumerate(sequence):
+            if (last is None or last < eid < last + maxGap) and set(pattern[k]) <= set(itemset):
+                if match(k + 1, eid):
+                    return True
+        return False
+    return match(0, None)
+
+
+def bruteForce(database, minSup, maxLength, maxGap):
+    items = sorted({item for sequence in database for itemset in sequence for item in itemset})
+    patterns = {}
+
+    def grow(pattern):
+        for item in items:
+            candidates = []
+            if len(pattern) < maxLength:
+                candidates.append(pattern + [[item]])
+            if pattern and item > pattern[-1][-1]:
+                candidates.append(pattern[:-1] + [pattern[-1] + [item]])
+            for candidate in candidates:
+                support = sum(occurs(sequence, candidate, maxGap) for sequence in database)
+                if support >= minSup:
+                    patterns[str([x for itemset in candidate for x in itemset + ['-1']])] = support
+                    grow(candidate)
+    grow([])
+    return patterns
+
+
+class TestPrefixSpanPseudoProjection(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_prefixspan_pseudo_input.txt"
+        rand = random.Random(3)
+        self.database = [[sorted(rand.sample("abcdef", rand.randint(1, 3))) for _ in range(rand.randint(1, 6))]
+                         for _ in range(30)]
+        with open(self.input_file, "w") as f:
+            for sequence in self.database:
+                f.write("\t".join(item for itemset in sequence for item in itemset + ["-1"]) + "\n")
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def test_patterns(self):
+        obj = PrefixSpan(self.input_file, 5)
+        obj.mine()
+        self.assertEqual(obj.getPatterns(), bruteForce(self.database, 5, float("inf"), float("inf")))
+
+    def test_length_and_gap(self):
+        for maxLength, maxGap in [(2, float("inf")), (float("inf"), 2), (3, 3)]:
+            obj = PrefixSpan(self.input_file, 4, "\t", maxLength, maxGap)
+            obj.mine()
+            self.assertEqual(obj.getPatterns(), bruteForce(self.database, 4, maxLength, maxGap))
+
+
+if __name__ == '__main__':
+    unittest.main()
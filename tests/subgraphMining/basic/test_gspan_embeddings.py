@@ -0,0 +1,35 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/subgraphMining/basic/test_gspan_embeddings.py
+
+import unittest
+import os
+import random
+from PAMI.subgraphMining.basic.gspan import GSpan
+from generate import generate_random_graphs
+
+
+class TestGSpanEmbeddings(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_gspan_embeddings_input.txt"
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def test_embedding_lists_match_isomorphisms(self):
+        for seed, minSupport, maxNumberOfEdges in [(0, 0.25, float('inf')), (1, 0.4, 3), (2, 0.2, float('inf'))]:
+            random.seed(seed)
+            with open(self.input_file, 'w') as f:
+                f.write(generate_random_graphs(15, 10, 14, 3, 2))
+            results = []
+            for embeddingLists in (False, True):
+                gspan = GSpan(self.input_file, minSupport, maxNumberOfEdges=maxNumberOfEdges)
+                gspan.mine(embeddingLists=embeddingLists)
+                results.append((gspan.getFrequentSubgraphs(), gspan.getSubgraphGraphMapping()))
+            self.assertGreater(results[0][0].count('#'), 0)
+            self.assertEqual(results[1], results[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/subgraphMining/topK/test_tkg_parallel.py
+
+import unittest
+import os
+import random
+from PAMI.subgraphMining.topK.tkg import TKG
+from generate import generate_random_graphs
+
+
+class TestTKGParallel(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_tkg_parallel_input.txt"
+        random.seed(7)
+        with open(self.input_file, 'w') as f:
+            f.write(generate_random_graphs(20, 10, 14, 3, 2))
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def topK(self, numWorkers):
+        tkg = TKG(self.input_file, 25, numWorkers=numWorkers)
+        tkg.mine()
+        subgraphs = tkg.getSubgraphsList()
+        self.assertEqual(tkg.patternCount, len(subgraphs))
+        # patterns with the k-th highest support may be replaced by other patterns of the same support
+        kth = subgraphs[-1].support
+        return (tkg.getMinSupport(), [subgraph.support for subgraph in subgraphs],
+                sorted(str(subgraph.dfsCode) for subgraph in subgraphs if subgraph.support > kth))
+
+    def test_workers_match_serial(self):
+        expected = self.topK(1)
+        self.assertEqual(len(expected[1]), 25)
+        self.assertEqual(self.topK(2), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
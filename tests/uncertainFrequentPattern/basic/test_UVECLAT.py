@@ -0,0 +1,68 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/uncertainFrequentPattern/basic/test_UVECLAT.py
+
+import unittest
+import os
+import math
+import random
+import warnings
+from itertools import combinations
+from PAMI.uncertainFrequentPattern.basic.UVECLAT import UVEclat
+
+warnings.filterwarnings("ignore")
+
+
+class TestUVEclat(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_uveclat_input.txt"
+        rand = random.Random(11)
+        # probabilities that are exact in binary, so that expected supports do not depend on the order of the products
+        self.database = []
+        for _ in range(50):
+            items = rand.sample(["a", "b", "c", "d", "e", "f"], rand.randint(1, 6))
+            self.database.append({item: rand.choice([0.25, 0.5, 0.75, 1.0]) for item in items})
+        with open(self.input_file, "w") as f:
+            for transaction in self.database:
+                f.write("\t".join("%s(%s)" % (item, probability) for item, probability in transaction.items()) + "\n")
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def expected(self, minSup):
+        patterns = {}
+        for size in range(1, 7):
+            for itemSet in combinations("abcdef", size):
+                support = sum(math.prod(t[item] for item in itemSet) for t in self.database
+                              if all(item in t for item in itemSet))
+                if support >= minSup:
+                    patterns[frozenset(itemSet)] = support
+        return patterns
+
+    def mine(self, minSup, **kwargs):
+        obj = UVEclat(self.input_file, minSup, "\t")
+        obj.mine(**kwargs)
+        return {frozenset(pattern.split()): support for pattern, support in obj.getPatterns().items()}
+
+    def test_brute_force(self):
+        expected = self.expected(4)
+        self.assertGreater(len(expected), 6)
+        self.assertEqual(self.mine(4), expected)
+
+    def test_log_probabilities(self):
+        patterns = self.mine(4, logProbabilities=True)
+        expected = self.expected(4)
+        self.assertEqual(set(patterns), set(expected))
+        for pattern, support in patterns.items():
+            self.assertAlmostEqual(support, expected[pattern])
+
+    def test_dictionaries(self):
+        # the dictionaries may miss patterns, but every pattern they find has its exact expected support
+        expected = self.expected(4)
+        for pattern, support in self.mine(4, vectorized=False).items():
+            self.assertAlmostEqual(support, expected[pattern])
+
+
+if __name__ == '__main__':
+    unittest.main()